@@ -6,10 +6,13 @@ import yaml
 import os
 from mics_process import tools
 from mics_process.filter_set import FilterSet
+from mics_process.filter_load_planner import FilterLoadPlanner
 from mics_process.jack_renderer import JackRenderer
 from mics_process import process_logger
 from mics_process import system_config
 from mics_process._remote import OscRemote
+from mics_process.realtime import RealtimeAudit, RealtimeMode
+from mics_process.stage_timer import StageTimer
 from time import sleep
 from mics_process.tracker import HeadTracker
 import numpy as np
@@ -161,9 +164,13 @@ def main_renderer():
         compensation_setting,
         is_measured_encoding,
         encoding_filter_name,
-        encoding_filter_type
+        encoding_filter_type,
+        listeners=None,
+        listener_trackers=None,
     ):
         new_renderer = None
+        listeners = listeners or []
+        listener_trackers = listener_trackers or []
         try:
             new_renderer = JackRenderer(
                 f"{name}-Renderer",
@@ -185,6 +192,11 @@ def main_renderer():
                 is_measured_encoding = is_measured_encoding,
                 encoding_filter_name = encoding_filter_name,
                 encoding_filter_type = encoding_filter_type,
+                listener_filter_names=[l["hrir_file"] for l in listeners],
+                listener_filter_types=[l["hrir_type"] for l in listeners],
+                listener_shared_tracker_data=[
+                    t.get_shared_position() for t in listener_trackers
+                ],
                 # azim_deg=azim_deg,
                 # elevs_deg=0
             )
@@ -260,6 +272,163 @@ def main_renderer():
             raise InterruptedError
         return new_renderer
 
+    def setup_batch_renderer(
+        name,
+        OSC_port,
+        BLOCK_LENGTH,
+        microphones,
+        sh_max_order,
+        ir_truncation_level,
+    ):
+        """
+        Create and start a single `JackRenderer` instance, rendering all microphone arrays in one
+        vectorized pass (see `AdjustableShConvolverBatch`). The trackers and pre-renderers of all
+        arrays have to be set up before and stored in `jack_chains`. Since the input delay and
+        the compensation are applied to all arrays alike, all arrays have to be configured with an
+        identical delay and compensation.
+
+        Returns
+        -------
+        JackRenderer
+            freshly created instance
+        """
+        new_renderer = None
+        try:
+            hrir_delays = sorted({m["hrir_delay"] for m in microphones})
+            if len(hrir_delays) > 1:
+                raise ValueError(
+                    f"batch rendering requires an identical HRIR delay of all arrays (configured "
+                    f"{hrir_delays} ms)."
+                )
+            compensations = sorted({str(m["compensation"]) for m in microphones})
+            if len(compensations) > 1:
+                raise ValueError(
+                    f"batch rendering requires an identical compensation of all arrays "
+                    f"(configured {compensations})."
+                )
+            if sh_max_order is not None and not all(c["pre_renderer"] for c in jack_chains):
+                raise ValueError(
+                    "batch rendering in spherical harmonics domain requires a pre-renderer for "
+                    "all arrays."
+                )
+
+            new_renderer = JackRenderer(
+                f"{name}-Renderer",
+                OSC_port=OSC_port,
+                block_length=BLOCK_LENGTH,
+                filter_name=microphones[0]["hrir_file"],
+                filter_type=microphones[0]["hrir_type"],
+                input_delay_ms=microphones[0]["hrir_delay"],
+                source_positions=[(microphones[0]["azim_deg"], 0)],
+                shared_tracker_data=jack_chains[0]["tracker"].get_shared_position(),
+                sh_max_order=sh_max_order,
+                sh_is_enforce_pinv=False,
+                ir_trunc_db=ir_truncation_level,
+                is_main_client=True,
+                is_measure_levels=True,
+                is_single_precision=system_config.IS_SINGLE_PRECISION,
+                array_filter_names=[m["hrir_file"] for m in microphones[1:]],
+                array_filter_types=[m["hrir_type"] for m in microphones[1:]],
+                array_source_positions=[[(m["azim_deg"], 0)] for m in microphones[1:]],
+                array_shared_tracker_data=[
+                    c["tracker"].get_shared_position() for c in jack_chains[1:]
+                ],
+            )
+
+            server_input_ports = new_renderer.get_server_ports(is_audio=True,is_input=True)
+            server_output_ports = new_renderer.get_server_ports(is_audio=True, is_output=True)
+            source_ports = []
+            output_ports = []
+            for m, c in zip(microphones, jack_chains):
+                if (
+                    c["pre_renderer"]
+                    and c["pre_renderer"].is_alive()
+                    and tools.transform_into_type(m["arir_type"], FilterSet.Type)
+                    is not FilterSet.Type.AS_MIRO
+                ):
+                    source_ports.extend(c["pre_renderer"].get_client_outputs())
+                else:
+                    source_ports.extend(
+                        server_output_ports[
+                            m["starting_input_channel"] : m["starting_input_channel"]
+                            + m["input_channel_count"]
+                        ]
+                    )
+                output_ports.extend(
+                    server_input_ports[
+                        m["starting_output_channel"] : m["starting_output_channel"]
+                        + m["output_channel_count"]
+                    ]
+                )
+
+            if sh_max_order is not None:
+                prerenderer_sh_configs = [
+                    c["pre_renderer"].get_pre_renderer_sh_config() for c in jack_chains
+                ]
+                if(sh_max_order == 2):
+                    for prerenderer_sh_config in prerenderer_sh_configs:
+                        prerenderer_sh_config.sh_bases_weighted[-3,:] = 0
+
+                # compensation is shared by all arrays
+                new_renderer.prepare_renderer_sh_processing(
+                    input_sh_config=prerenderer_sh_configs,
+                    mrf_limit_db=system_config.ARIR_RADIAL_AMP,
+                    compensation_type=microphones[0]["compensation"],
+                )
+
+            new_renderer.start(client_connect_target_ports=output_ports)
+            new_renderer.set_output_mute(False)
+            for i, m in enumerate(microphones):
+                new_renderer.set_renderer_array_volume_db(i, m["hrir_level"])
+            sleep(_INITIALIZE_DELAY)
+
+            new_renderer.client_register_and_connect_inputs(source_ports=source_ports)
+        except (ValueError, FileNotFoundError, RuntimeError) as e:
+            logger.error(e)
+            terminate_all(not_working_renderer=new_renderer)
+            raise InterruptedError
+        return new_renderer
+
+    def setup_filter_load_planner(
+        BLOCK_LENGTH, fs, microphones, sh_max_order, ir_truncation_level
+    ):
+        """
+        Load all HRIR and ARIR filter sets referenced by the configuration concurrently, before
+        the renderers are created. The renderers then receive the already preprocessed filter
+        data instead of loading them one after another.
+
+        Parameters
+        ----------
+        fs : int
+            system sampling frequency of the running JACK server, since filters are resampled
+            accordingly
+
+        Returns
+        -------
+        FilterLoadPlanner
+            planner referencing all loaded filter sets until being released
+        """
+        planner = FilterLoadPlanner(
+            block_length=BLOCK_LENGTH,
+            fs=fs,
+            is_single_precision=system_config.IS_SINGLE_PRECISION,
+            logger=logger,
+        )
+        for m in microphones:
+            hrir_files = [(m["hrir_file"], m["hrir_type"])] + [
+                (l["hrir_file"], l["hrir_type"]) for l in m.get("listeners") or []
+            ]
+            for file_name, file_type in [(m["arir_file"], m["arir_type"])] + hrir_files:
+                planner.add(
+                    file_name=file_name,
+                    file_type=file_type,
+                    sh_max_order=sh_max_order,
+                    sh_is_enforce_pinv=False,
+                    ir_trunc_db=ir_truncation_level,
+                )
+        planner.load_all(worker_count=system_config.FILTER_LOAD_WORKER_COUNT)
+        return planner
+
     def terminate_all(not_working_renderer=None):
 
             """
@@ -287,20 +456,20 @@ def main_renderer():
                         pass
     
     def setup_monitor(
-            name,
-            OSC_port,
-            block_length,
+            new_monitor,
             jack_chains,
             starting_output_channel,
-            output_channel_count
+            output_channel_count,
         ):
-        new_monitor = JackMonitor(
-            name = name,
-            OSC_port = OSC_port,
-            block_length = block_length,
-            is_measure_levels=True,
-        )
+        """
+        Start the beforehand created `JackMonitor` instance and connect the outputs of all
+        rendering chains to it.
 
+        Returns
+        -------
+        JackMonitor
+            started instance
+        """
         server_input_ports = new_monitor.get_server_ports(is_audio=True,is_input=True)
         
         output_ports = []
@@ -310,9 +479,24 @@ def main_renderer():
         new_monitor.start(client_connect_target_ports=output_ports)
 
         for i in range(len(jack_chains)):
+            # renderer outputs are shared by all chains in case of batch rendering
+            output_offset = jack_chains[i]["output_offset"]
             source_ports = jack_chains[i]["renderer"].get_client_outputs()
-            source_name = jack_chains[i]["name"]
-            new_monitor.client_register_and_connect_new_bin_input(input_src_name=source_name,source_ports=source_ports)
+            # every listener of a chain is provided as an individual binaural input
+            source_names = [jack_chains[i]["name"]] + [
+                f'{jack_chains[i]["name"]}-{l["name"]}'
+                for l in jack_chains[i]["listeners"]
+            ]
+            for k, source_name in enumerate(source_names):
+                new_monitor.client_register_and_connect_new_bin_input(
+                    input_src_name=source_name,
+                    source_ports=source_ports[
+                        output_offset + 2 * k : output_offset + 2 * (k + 1)
+                    ],
+                    source_client=jack_chains[i]["renderer"],
+                    # pre-renderer only feeds the renderer of its own array
+                    upstream_clients=[jack_chains[i]["pre_renderer"]],
+                )
         return new_monitor
     # code to be executed inside main
 
@@ -342,10 +526,36 @@ def main_renderer():
     microphones = mics_config["microphones"]
     monitoring_setup = mics_config["monitoring"]
     REMOTE_OSC_PORT = mics_config["REMOTE_OSC_PORT"]
+    # render all microphone arrays by a single renderer in one vectorized pass (optional)
+    is_batch_rendering = mics_config.get("BATCH_RENDERING", False)
     jack_system = {}
     jack_chains = [] 
 
     system_config.BLOCK_LENGTH = BLOCK_LENGTH
+
+    monitor_name = monitoring_setup["name"]
+    monitor_OSC_port = monitoring_setup["osc_port"]
+    monitor_starting_output_channel = monitoring_setup["starting_output_channel"]
+    monitor_channel_count = monitoring_setup["output_channel_count"]
+    # only render the chain being listened to by the monitor (optional)
+    monitor_is_demand_driven = monitoring_setup.get("is_demand_driven", False)
+
+    # created first, so its JACK client also provides the system sampling frequency
+    monitor = JackMonitor(
+        name=monitor_name,
+        OSC_port=monitor_OSC_port,
+        block_length=BLOCK_LENGTH,
+        is_demand_driven=monitor_is_demand_driven,
+        is_measure_levels=True,
+    )
+
+    filter_load_planner = setup_filter_load_planner(
+        BLOCK_LENGTH=BLOCK_LENGTH,
+        fs=monitor.get_sample_rate(),
+        microphones=microphones[:renderers_num],
+        sh_max_order=sh_max_order,
+        ir_truncation_level=ir_truncation_level,
+    )
     
     try:
         for i in range(renderers_num):
@@ -368,10 +578,29 @@ def main_renderer():
             is_measured_encoding = microphones[i]["is_measured_encoding"]
             encoding_filter_name = microphones[i]["encoding_filter_name"]
             encoding_filter_type = microphones[i]["encoding_filter_type"]
+            # additional listeners rendered from the same microphone array (optional)
+            listeners = microphones[i].get("listeners") or []
+            if is_batch_rendering and (listeners or is_measured_encoding):
+                logger.warning(
+                    f"additional listeners and measured encoding are not supported in batch "
+                    f"rendering, ignored for {name}."
+                )
+                listeners = []
+            elif is_measured_encoding and listeners:
+                logger.warning(
+                    f"additional listeners are not supported with measured encoding, ignored "
+                    f"for {name}."
+                )
+                listeners = []
             jack_chains.append({})
             
 
             tracker = setup_tracker(name,None,OSC_port)
+            # kept apart from the parsed configuration of the listeners
+            listener_trackers = [
+                setup_tracker(f'{name}-{listener["name"]}', None, listener["osc_port"])
+                for listener in listeners
+            ]
             pre_renderer = setup_pre_renderer(
                 name=name,OSC_port=OSC_port,
                 BLOCK_LENGTH=BLOCK_LENGTH,
@@ -395,6 +624,11 @@ def main_renderer():
             jack_chains[i]["tracker"] = tracker
             jack_chains[i]["pre_renderer"]=pre_renderer
             jack_chains[i]["name"] = name
+            jack_chains[i]["listeners"] = listeners
+            jack_chains[i]["listener_trackers"] = listener_trackers
+            jack_chains[i]["output_offset"] = 0
+            if is_batch_rendering:
+                continue
             
             renderer = setup_renderer(
                 name=name,
@@ -421,28 +655,46 @@ def main_renderer():
                 compensation_setting = compensation_setting,
                 is_measured_encoding = is_measured_encoding,
                 encoding_filter_name=encoding_filter_name,
-                encoding_filter_type=encoding_filter_type
+                encoding_filter_type=encoding_filter_type,
+                listeners=listeners,
+                listener_trackers=listener_trackers,
                 )
             renderer.set_client_crossfade(True)
             jack_chains[i]["renderer"] = renderer
 
+        if is_batch_rendering:
+            renderer = setup_batch_renderer(
+                name="batch",
+                OSC_port=microphones[0]["osc_port"],
+                BLOCK_LENGTH=BLOCK_LENGTH,
+                microphones=microphones[:renderers_num],
+                sh_max_order=sh_max_order,
+                ir_truncation_level=ir_truncation_level,
+            )
+            renderer.set_client_crossfade(True)
+            # outputs of all arrays are provided one after another
+            array_output_count = len(renderer.get_client_outputs()) // renderers_num
+            for i in range(renderers_num):
+                jack_chains[i]["renderer"] = renderer
+                jack_chains[i]["output_offset"] = i * array_output_count
+
 
     except InterruptedError:
         logger.error("application interrupted.")
-        terminate_all()
+        terminate_all(not_working_renderer=monitor)
         return logger  # terminate application
+    finally:
+        # preloaded filter data is referenced by the renderers now
+        filter_load_planner.release()
 
     for i in range(renderers_num):
         # set tracker reference position at application start
         jack_chains[i]["tracker"].set_zero_position()
+        for listener_tracker in jack_chains[i]["listener_trackers"]:
+            listener_tracker.set_zero_position()
        
     
-    monitor_name = monitoring_setup["name"]
-    monitor_OSC_port = monitoring_setup["osc_port"]
-    monitor_starting_output_channel = monitoring_setup["starting_output_channel"]
-    monitor_channel_count = monitoring_setup["output_channel_count"]
-
-    monitor = setup_monitor(name=monitor_name,block_length = BLOCK_LENGTH, OSC_port=monitor_OSC_port,jack_chains=jack_chains,starting_output_channel=monitor_starting_output_channel,output_channel_count=monitor_channel_count)
+    monitor = setup_monitor(new_monitor=monitor,jack_chains=jack_chains,starting_output_channel=monitor_starting_output_channel,output_channel_count=monitor_channel_count)
     
     
     ## monitor.choose_bin_input_to_listen(0)
@@ -458,13 +710,23 @@ def main_renderer():
     clients = [monitor]
     for i in range(len(jack_chains)):
         clients.append(jack_chains[i]["tracker"])
+        clients.extend(jack_chains[i]["listener_trackers"])
         clients.append(jack_chains[i]["pre_renderer"])
-        clients.append(jack_chains[i]["renderer"])
+        if jack_chains[i]["renderer"] not in clients:
+            clients.append(jack_chains[i]["renderer"])
+    # keep garbage collection and non real-time safe operations out of the process callbacks
+    RealtimeMode.enable(logger=logger)
+    RealtimeAudit.start(logger=logger)
+    # dump timing of processing stages of all clients
+    StageTimer.start_dump(logger=logger)
+
     # run remote interface until application is interrupted
     try:
         remote.start(clients=clients)
     except KeyboardInterrupt:
         logger.error("interrupted by user.")
+    finally:
+        RealtimeMode.disable()
 
     monitor.set_output_mute(False)
 main_renderer()
\ No newline at end of file
@@ -4,6 +4,7 @@ import sys
 from pythonosc import dispatcher, osc_server
 
 from . import tools
+from .flight_recorder import FlightRecorder
 
 
 # noinspection PyTypeChecker
@@ -111,8 +112,11 @@ class OscRemote(object):
             ## add_mapping("volume_port_relative", "set_output_volume_port_relative_db")
             ## add_mapping("delay", "set_input_delay_ms")
             add_mapping("crossfade", "set_client_crossfade")  # see `JackRenderer`
+            add_mapping("array_mute", "set_renderer_array_mute")  # see `JackRenderer`
+            add_mapping("array_volume", "set_renderer_array_volume_db")  # see `JackRenderer`
             ## add_mapping("passthrough", "set_client_passthrough")  # see `JackRenderer`
             ## add_mapping("order", "set_renderer_sh_order")  # see `JackRenderer`
+            add_mapping("filter", "set_renderer_filter")  # see `JackRenderer`
             ## add_mapping("zero", "set_zero_position")  # see `HeadTracker`
             add_mapping("azimuth", "set_azimuth_position")  # see `HeadTracker`
             ## add_mapping("stop", "stop")  # see `JackPlayer`
@@ -181,7 +185,7 @@ class OscRemote(object):
 
     # noinspection PyUnresolvedReferences
     @staticmethod
-    def handle_function(_, references, *parameters):
+    def handle_function(address, references, *parameters):
         """
         Call the intended function of the instance with the parameters provided. Additional
         parameters will be dropped, in case there are more given than the referenced function
@@ -189,7 +193,7 @@ class OscRemote(object):
 
         Parameters
         ----------
-        _ : str
+        address : str
             OSC target
         references : list of SubProcess, str, logging.Logger
             instance and function that should be invoked as well as reference to logger to provide
@@ -200,6 +204,7 @@ class OscRemote(object):
         client = references[0]
         function_name = references[1]
         logger = references[2]
+        FlightRecorder.add_event("osc", " ".join([address] + [str(p) for p in parameters]))
 
         function_parameters_count = len(
             inspect.signature(getattr(client, function_name)).parameters
@@ -8,6 +8,8 @@ import numpy as np
 import sound_field_analysis as sfa
 
 from .filter_set import FilterSetMultiChannel, FilterSetShConfig, FilterSetSsr
+from .input_spectrum_cache import InputSpectrumCache
+from .stage_timer import StageTimer
 
 
 class Convolver(object):
@@ -29,6 +31,13 @@ class Convolver(object):
     _irfft : pyfftw.FFTW
         FFTW library wrapper with a pre-calculated optimal scheme for fast real-time computation of
         the 1D inverse real DFT
+    _input_spectrum_key : tuple or None
+        identifier of the current input block provided by the owning client, to share the input
+        spectrum with other convolvers receiving identical input blocks (see
+        `InputSpectrumCache`), `None` if the spectrum should not be shared
+    _is_low_cost : bool
+        if signals should be processed at reduced quality and effort, since the output is
+        currently not audible (no crossfade and limited spherical harmonics rendering order)
     """
 
     @staticmethod
@@ -39,6 +48,11 @@ class Convolver(object):
         shared_tracker_data=None,
         is_measured_encoding = False,
         filter_set_encoding = None,
+        listener_filter_sets=None,
+        listener_shared_tracker_data=None,
+        array_filter_sets=None,
+        array_source_positions=None,
+        array_shared_tracker_data=None,
         ## azim_deg = 0,
         ## elevs_deg = 0
     ):
@@ -58,12 +72,36 @@ class Convolver(object):
         shared_tracker_data : multiprocessing.Array, optional
             shared data array from an existing tracker instance for dynamic binaural rendering,
             see `HeadTracker`
+        listener_filter_sets : list of FilterSet, optional
+            beforehand loaded HRIR filter sets of additional listeners being rendered from the
+            same spherical harmonics decomposition, see `AdjustableShConvolverMultiListener`
+        listener_shared_tracker_data : list of multiprocessing.Array, optional
+            shared data arrays from existing tracker instances of additional listeners
+        array_filter_sets : list of FilterSet, optional
+            beforehand loaded HRIR filter sets of additional microphone arrays being rendered in
+            the same vectorized pass, see `AdjustableShConvolverBatch`
+        array_source_positions : list of list of int or list of list of float, optional
+            rendered binaural source positions of additional microphone arrays
+        array_shared_tracker_data : list of multiprocessing.Array, optional
+            shared data arrays from existing tracker instances of additional microphone arrays
 
         Returns
         -------
-        Convolver, OverlapSaveConvolver, AdjustableFdConvolver or AdjustableShConvolver
+        Convolver, OverlapSaveConvolver, AdjustableFdConvolver, AdjustableShConvolver,
+        AdjustableShConvolverMultiListener or AdjustableShConvolverBatch
             created instance according to `FilterSet.Type`
+
+        Raises
+        ------
+        ValueError
+            in case additional listeners or microphone arrays are combined with measured encoding
         """
+        if is_measured_encoding and (listener_filter_sets or array_filter_sets):
+            raise ValueError(
+                "additional listeners or microphone arrays can not be rendered with measured "
+                "encoding filters."
+            )
+
         if not block_length:
             convolver = Convolver(filter_set)
         elif type(filter_set) == FilterSetMultiChannel:
@@ -73,6 +111,12 @@ class Convolver(object):
                 ##filter_set, block_length, source_positions, azim_deg=azim_deg,elevs_deg=elevs_deg ##shared_tracker_data
                 filter_set, block_length, source_positions, shared_tracker_data
             )
+        # noinspection PyProtectedMember
+        elif filter_set._is_hrir and filter_set._get_is_rendered_by_direction():
+            # isinstance(filter_set, (FilterSetMiro, FilterSetSofa)) without SH processing
+            convolver = AdjustableFdConvolver(
+                filter_set, block_length, source_positions, shared_tracker_data
+            )
         else:
             # isinstance(filter_set, (FilterSetMiro, FilterSetSofa))
             if filter_set.get_sh_configuration().arir_config:
@@ -86,6 +130,25 @@ class Convolver(object):
                         ## filter_set, block_length, source_positions, azim_deg=azim_deg,elevs_deg=elevs_deg ##shared_tracker_data
                         filter_set, block_length, source_positions, shared_tracker_data,filter_set_encoding
                     )
+                elif array_filter_sets:
+                    convolver = AdjustableShConvolverBatch(
+                        filter_set,
+                        block_length,
+                        source_positions,
+                        shared_tracker_data,
+                        array_filter_sets,
+                        array_source_positions,
+                        array_shared_tracker_data,
+                    )
+                elif listener_filter_sets:
+                    convolver = AdjustableShConvolverMultiListener(
+                        filter_set,
+                        block_length,
+                        source_positions,
+                        shared_tracker_data,
+                        listener_filter_sets,
+                        listener_shared_tracker_data,
+                    )
                 else:
                     convolver = AdjustableShConvolver(
                         ## filter_set, block_length, source_positions, azim_deg=azim_deg,elevs_deg=elevs_deg ##shared_tracker_data
@@ -94,7 +157,11 @@ class Convolver(object):
 
         # prevent running debugging help function in case of `AdjustableShConvolver` (needs to be
         # invoked after `AdjustableShConvolver.prepare_renderer_sh_processing()` instead!)
-        if system_config.IS_DEBUG_MODE and type(convolver) is not AdjustableShConvolver:
+        if system_config.IS_DEBUG_MODE and type(convolver) not in (
+            AdjustableShConvolver,
+            AdjustableShConvolverMultiListener,
+            AdjustableShConvolverBatch,
+        ):
             # noinspection PyTypeChecker
             convolver._debug_filter_block(
                 len(source_positions) if source_positions else 0
@@ -118,6 +185,8 @@ class Convolver(object):
         self._irfft = None
         self._fft = None
         self._ifft = None
+        self._input_spectrum_key = None
+        self._is_low_cost = False
 
         # do not run if called by an inheriting class
         if type(self) is Convolver:  # do not replace with `isinstance()`
@@ -181,6 +250,14 @@ class Convolver(object):
             np.zeros_like(self._filter.get_dirac_blocks_fd()[0]), overwrite_input=False
         )
     
+    def release_unused_filter_data(self):
+        """
+        Release all filter representations which are not accessed during rendering anymore (see
+        `FilterSet.release_unused()`), to reduce the memory footprint of the rendering process.
+        This should happen before the rendering process is forked.
+        """
+        self._filter.release_unused(is_keep_blocks_fd=True)
+
     def set_passthrough(self, new_state=None):
         """
         Parameters
@@ -200,6 +277,58 @@ class Convolver(object):
             self._is_passthrough = new_state
         return self._is_passthrough
     
+    def set_low_cost(self, new_state=None):
+        """
+        Parameters
+        ----------
+        new_state : bool or None, optional
+            new low cost state if signals should be processed at reduced quality and effort
+            (no crossfade and spherical harmonics rendering order limited to
+            `system_config.DEMAND_LOW_COST_SH_ORDER`), if `None` is given this function works as a
+            toggle between states
+
+        Returns
+        -------
+        bool
+            actually realized low cost state
+        """
+        if new_state is None:
+            self._is_low_cost = not self._is_low_cost
+        else:
+            self._is_low_cost = new_state
+        return self._is_low_cost
+
+    def set_input_spectrum_key(self, key=None):
+        """
+        Parameters
+        ----------
+        key : tuple or None, optional
+            identifier of the next input block provided by the owning client, consisting of the
+            JACK frame time, the connected source port names and the input delay, if `None` is
+            given the input spectrum will not be shared (see `InputSpectrumCache`)
+        """
+        self._input_spectrum_key = key
+
+    def get_input_target_td(self, channel_count):
+        """
+        Provide the part of the input buffer receiving the next input block, so the owning client
+        can write the input samples there directly instead of providing a separate array to
+        `filter_block()`. This implementation does not buffer any input, hence nothing is
+        provided.
+
+        Parameters
+        ----------
+        channel_count : int
+            number of input channels being written
+
+        Returns
+        -------
+        numpy.ndarray or None
+            writable view of the input buffer of size [number of input channels;
+            `_block_length`], `None` in case writing directly is not supported
+        """
+        return None
+
     def _debug_filter_block(self, input_count, is_generate_noise=False):
         """
         Provides debugging possibilities the `filter_block()` function before running the
@@ -320,6 +449,15 @@ class Convolver(object):
         # noinspection PyProtectedMember
         return self._filter._irs_td.shape[0] * self._filter._irs_td.shape[1]
 
+    def get_block_count(self):
+        """
+        Returns
+        -------
+        int
+            number of blocks (filter partitions) an input block contributes to the output
+        """
+        return 1
+
     def _get_current_filters_fd(self):
         """
         Returns ------- numpy.ndarray complex one-sided filter frequency spectra to be applied to
@@ -347,6 +485,25 @@ class OverlapSaveConvolver(Convolver):
     _input_block_td : numpy.ndarray
         time domain input samples contained in a shifting buffer of size [number of input channels;
         2 * `_block_length`]
+    _silence_energy : float
+        mean input block energy below which a block is considered silent
+    _silence_block_count : int
+        number of consecutive silent input blocks
+    _silence_block_td : numpy.ndarray or None
+        preallocated time domain output samples being delivered while processing is skipped due
+        to silent input of size [number of output channels; `_block_length`]
+    _input_target_td : numpy.ndarray or None
+        view of the second half of `_input_block_td` being written by the owning client directly,
+        see `get_input_target_td()`
+    _is_input_target_pending : bool
+        if `_input_target_td` contains a received input block, which was not processed yet
+    _input_spectra_fd : numpy.ndarray or None
+        copies of the input block spectra being shared with other convolvers (alternately
+        written, so spectra of earlier processing frames stay valid) of size
+        [`InputSpectrumCache.GENERATION_COUNT`; number of input channels; 2 * `_block_length`],
+        see `InputSpectrumCache`
+    _input_spectra_id : int
+        index of the last written spectrum in `_input_spectra_fd`
     """
 
     def __init__(self, filter_set, block_length):
@@ -362,6 +519,13 @@ class OverlapSaveConvolver(Convolver):
         super().__init__(filter_set=filter_set)
         self._block_length = block_length
         self._input_block_td = None
+        self._silence_energy = 10 ** (system_config.SILENCE_GATE_LEVEL_DB / 10)
+        self._silence_block_count = 0
+        self._silence_block_td = None
+        self._input_target_td = None
+        self._is_input_target_pending = False
+        self._input_spectra_fd = None
+        self._input_spectra_id = 0
 
         # calculate filter in frequency domain
         self._filter.calculate_filter_blocks_fd(self._block_length)
@@ -397,9 +561,13 @@ class OverlapSaveConvolver(Convolver):
 
     def _clear_buffers(self):
         """Clear all intermediate signal block buffers, helpful to prevent artifacts when
-        switching configurations."""
+        switching configurations. An input block already received into `_input_target_td` but
+        not processed yet is kept, so only the previous input and the delay line are cleared."""
         super()._clear_buffers()
-        self._input_block_td.fill(0)
+        if self._is_input_target_pending:
+            self._input_block_td[:, : self._block_length].fill(0)
+        else:
+            self._input_block_td.fill(0)
         self._blocks_fd.fill(0)
 
     def init_fft_optimize(self, logger=None):
@@ -449,6 +617,8 @@ class OverlapSaveConvolver(Convolver):
         """
         if input_block_td is None:
             return super().filter_block(input_block_td)
+        if self._filter_block_check_silence(input_block_td):
+            return self._get_silence_block_td(input_block_td)
 
         # transform into frequency domain
         input_block_fd = self._filter_block_shift_and_convert_input(input_block_td)
@@ -463,11 +633,118 @@ class OverlapSaveConvolver(Convolver):
             self._filter_block_complex_multiply(
                 self._blocks_fd, self._get_current_filters_fd(), input_block_fd
             )
+        StageTimer.mark(StageTimer.MAC)
 
         # transform back into time domain
         output_block_td = self._filter_block_shift_and_convert_result()
         return output_block_td
 
+    def get_input_target_td(self, channel_count):
+        """
+        Provide the part of the input buffer receiving the next input block, so the owning client
+        can write the input samples there directly instead of providing a separate array to
+        `filter_block()`. The buffer is shifted beforehand, hence this has to be called exactly
+        once before every call of `filter_block()` with the returned array.
+
+        Parameters
+        ----------
+        channel_count : int
+            number of input channels being written
+
+        Returns
+        -------
+        numpy.ndarray or None
+            writable view of the input buffer of size [number of input channels;
+            `_block_length`], `None` in case the number of channels does not match
+        """
+        if self._input_block_td is None or self._input_block_td.shape[0] != channel_count:
+            return None
+        if (
+            self._input_target_td is None
+            or self._input_target_td.base is not self._input_block_td
+        ):
+            self._input_target_td = self._input_block_td[:, self._block_length :]
+
+        # shift stored blocks backwards
+        self._input_block_td[:, : self._block_length] = self._input_target_td
+        self._is_input_target_pending = True
+        return self._input_target_td
+
+    def get_block_count(self):
+        """
+        Returns
+        -------
+        int
+            number of blocks (filter partitions) an input block contributes to the output
+        """
+        return self._blocks_fd.shape[0]
+
+    def _filter_block_check_silence(self, input_block_td):
+        """
+        Track consecutive silent input blocks (mean energy below
+        `system_config.SILENCE_GATE_LEVEL_DB`). As soon as all blocks in the input buffer and the
+        frequency domain delay line only contain silent input, the processing of further blocks
+        can be skipped until the input signal returns. Residual buffer contents below the
+        threshold are cleared at that point, so processing resumes from the identical state as
+        after digital silence.
+
+        Parameters
+        ----------
+        input_block_td : numpy.ndarray
+            block of time domain input samples of size [number of input channels; `_block_length`]
+
+        Returns
+        -------
+        bool
+            if processing of the block should be skipped, see `_get_silence_block_td()`
+        """
+        if not system_config.IS_SILENCE_GATING:
+            return False
+
+        # `np.vdot()` flattens the input
+        if (
+            np.vdot(input_block_td, input_block_td).real
+            > self._silence_energy * input_block_td.size
+        ):
+            self._silence_block_count = 0
+            return False
+
+        self._silence_block_count += 1
+        # last input block in buffer and all blocks in the delay line need to have decayed
+        decay_block_count = self._blocks_fd.shape[0] + 1
+        if self._silence_block_count <= decay_block_count:
+            return False
+        if self._silence_block_count == decay_block_count + 1:
+            self._clear_buffers()
+        return True
+
+    def _get_silence_block_td(self, input_block_td, channel_count=None):
+        """
+        Parameters
+        ----------
+        input_block_td : numpy.ndarray
+            block of time domain input samples of size [number of input channels; `_block_length`]
+        channel_count : int, optional
+            number of output channels, if not given the number of channels in the delay line
+
+        Returns
+        -------
+        numpy.ndarray
+            preallocated block of zeros as time domain output samples of size [number of output
+            channels; `_block_length`]
+        """
+        if channel_count is None:
+            channel_count = self._blocks_fd.shape[-2]
+        if (
+            self._silence_block_td is None
+            or self._silence_block_td.shape[0] != channel_count
+        ):
+            self._silence_block_td = np.zeros(
+                (channel_count, input_block_td.shape[-1]),
+                dtype=self._filter.get_dirac_td().dtype,
+            )
+        return self._silence_block_td
+
     def _filter_block_shift_and_convert_input(self, input_block_td):
         """
         Parameters
@@ -482,11 +759,23 @@ class OverlapSaveConvolver(Convolver):
             `_block_length` (+1
             depending on even or uneven length)]
         """
-        # set new input to end of stored blocks (after shifting backwards)
-        self._input_block_td[:, : input_block_td.shape[1]] = self._input_block_td[
-            :, input_block_td.shape[1] :
-        ]
-        self._input_block_td[:, input_block_td.shape[1] :] = input_block_td
+        # set new input to end of stored blocks (after shifting backwards), unless it was
+        # written there directly (see `get_input_target_td()`)
+        if input_block_td is not self._input_target_td:
+            self._input_block_td[:, : input_block_td.shape[1]] = self._input_block_td[
+                :, input_block_td.shape[1] :
+            ]
+            self._input_block_td[:, input_block_td.shape[1] :] = input_block_td
+        self._is_input_target_pending = False
+
+        # reuse spectrum in case it was already transformed by another convolver in this frame
+        key = self._input_spectrum_key
+        if key is not None:
+            key += (self._input_block_td.shape, self._input_block_td.dtype.str)
+            buffer_block_fd = InputSpectrumCache.get(key)
+            if buffer_block_fd is not None:
+                StageTimer.mark(StageTimer.FFT)
+                return buffer_block_fd
 
         # transform stored blocks into frequency domain
         buffer_block_fd = (
@@ -495,6 +784,24 @@ class OverlapSaveConvolver(Convolver):
             else np.fft.fft(self._input_block_td)
         )
 
+        if key is not None:
+            # the transform output buffer is reused in the next frame, hence the shared spectrum
+            # is copied into a buffer which is not written again in the meantime
+            if (
+                self._input_spectra_fd is None
+                or self._input_spectra_fd.shape[1:] != buffer_block_fd.shape
+            ):
+                self._input_spectra_fd = np.zeros(
+                    (InputSpectrumCache.GENERATION_COUNT,) + buffer_block_fd.shape,
+                    dtype=buffer_block_fd.dtype,
+                )
+            self._input_spectra_id = (
+                self._input_spectra_id + 1
+            ) % InputSpectrumCache.GENERATION_COUNT
+            spectrum_fd = self._input_spectra_fd[self._input_spectra_id]
+            np.copyto(spectrum_fd, buffer_block_fd)
+            buffer_block_fd = InputSpectrumCache.put(key, spectrum_fd)
+        StageTimer.mark(StageTimer.FFT)
         return buffer_block_fd
 
     @staticmethod
@@ -561,6 +868,7 @@ class OverlapSaveConvolver(Convolver):
             self._last_blocks_fd = buffer_blocks_fd
         else:
             self._blocks_fd = buffer_blocks_fd
+        StageTimer.mark(StageTimer.IFFT)
 
         # remove 1st singular dimension and return relevant second half of the time domain data
         return first_block_td[0, :, int(first_block_td.shape[-1] / 2) :]
@@ -597,6 +905,30 @@ class AdjustableFdConvolver(OverlapSaveConvolver):
     _last_blocks_fd : numpy.ndarray
         complex one-sided frequency spectra that had the past last processing filters applied to
         the signal contained in a shifting buffer of size like `_blocks_fd`
+    _delay_lines_td : numpy.ndarray or None
+        time domain output samples of the current and last filters before applying the onset
+        delays of minimum phase filters contained in a shifting buffer of size [2; number of
+        output channels; maximum delay + `_block_length`], `None` in case the filters were not
+        decomposed (see `FilterSet.get_filter_delays()`)
+    _last_delays : numpy.ndarray or None
+        onset delays in samples that were applied to the signal in the last processing frame of
+        size [number of output channels]
+    _delayed_blocks_td : numpy.ndarray or None
+        preallocated time domain output samples of the current and last filters after applying
+        the onset delays of size [2; number of output channels; `_block_length`]
+    _delay_base_ids : numpy.ndarray or None
+        flat indices into a delay line of the undelayed output samples of size [number of output
+        channels; `_block_length`]
+    _delay_ids : numpy.ndarray or None
+        preallocated flat indices into a delay line of the delayed output samples of size like
+        `_delay_base_ids`
+    _delay_ints : numpy.ndarray or None
+        preallocated integer part of the onset delays of size [number of output channels]
+    _delay_fractions : numpy.ndarray or None
+        preallocated fractional part of the onset delays of size [number of output channels; 1]
+    _delay_scratch_td : numpy.ndarray or None
+        preallocated time domain samples of the interpolation neighbours of size like
+        `_delay_base_ids`
     """
     ## def __init__(self, filter_set, block_length, source_positions, azim_deg = 0 , elevs_deg= 0):
        
@@ -653,6 +985,44 @@ class AdjustableFdConvolver(OverlapSaveConvolver):
         self._last_blocks_fd = np.zeros_like(self._blocks_fd)
         self._last_filters_fd = np.zeros_like(self._get_current_filters_fd())
 
+        # allocate delay lines in case of minimum phase filters
+        self._delay_lines_td = None
+        self._delayed_blocks_td = None
+        self._delay_base_ids = None
+        self._delay_ids = None
+        self._delay_ints = None
+        self._delay_fractions = None
+        self._delay_scratch_td = None
+        self._last_delays = self._filter.get_filter_delays()
+        if self._last_delays is not None:
+            if len(source_positions) > 1:
+                raise ValueError(
+                    "minimum phase filters with onset delays can only be rendered for a single "
+                    "virtual source position."
+                )
+            # additional sample for linear interpolation of fractional delays
+            delay_length = int(np.ceil(self._filter.get_filter_delays_max())) + 1
+            self._delay_lines_td = np.zeros(
+                (2, self._last_delays.shape[0], delay_length + self._block_length),
+                dtype=self._input_block_td.dtype,
+            )
+
+            # preallocate buffers to apply integer and fractional delays of all channels at once
+            channel_count, line_length = self._delay_lines_td.shape[1:]
+            self._delayed_blocks_td = np.zeros(
+                (2, channel_count, self._block_length), dtype=self._input_block_td.dtype
+            )
+            self._delay_base_ids = (
+                np.arange(channel_count)[:, np.newaxis] * line_length
+                + np.arange(delay_length, line_length)
+            )
+            self._delay_ids = np.zeros_like(self._delay_base_ids)
+            self._delay_ints = np.zeros(channel_count, dtype=self._delay_base_ids.dtype)
+            self._delay_fractions = np.zeros(
+                (channel_count, 1), dtype=self._input_block_td.dtype
+            )
+            self._delay_scratch_td = np.zeros_like(self._delayed_blocks_td[0])
+
     def __copy__(self):
         _filter = copy(self._filter)
         _filter.load(
@@ -681,6 +1051,8 @@ class AdjustableFdConvolver(OverlapSaveConvolver):
         switching configurations."""
         super()._clear_buffers()
         self._last_blocks_fd.fill(0)
+        if self._delay_lines_td is not None:
+            self._delay_lines_td.fill(0)
 
     def filter_block(self, input_block_td):
         """
@@ -703,32 +1075,49 @@ class AdjustableFdConvolver(OverlapSaveConvolver):
         """
         if self._is_passthrough or input_block_td is None:
             return super().filter_block(input_block_td)
+        if self._filter_block_check_silence(input_block_td):
+            return self._get_silence_block_td(input_block_td)
 
         # transform into frequency domain
         input_block_fd = self._filter_block_shift_and_convert_input(input_block_td)
         filters_blocks_fd = self._get_current_filters_fd()
+        StageTimer.mark(StageTimer.ROTATION)
 
         # block-wise complex multiplication into current buffer
         self._filter_block_complex_multiply(
             self._blocks_fd, filters_blocks_fd, input_block_fd
         )
+        StageTimer.mark(StageTimer.MAC)
         # transform back into time domain
         output_in_block_td = self._filter_block_shift_and_convert_result(
             is_last_block=False
         )
+        if self._delay_lines_td is not None:
+            delays = self._get_current_filter_delays()
+            output_in_block_td = self._filter_block_delay(0, output_in_block_td, delays)
+            StageTimer.mark(StageTimer.ROTATION)
 
         # skip further calculations in case no crossfade in time domain should be done
-        if not self._is_crossfade:
+        if not self._is_crossfade or self._is_low_cost:
+            if self._delay_lines_td is not None:
+                self._last_delays = delays
             return output_in_block_td
 
         # block-wise complex multiplication into last buffer
         self._filter_block_complex_multiply(
             self._last_blocks_fd, self._last_filters_fd, input_block_fd
         )
+        StageTimer.mark(StageTimer.MAC)
         # transform back into time domain
         output_out_block_td = self._filter_block_shift_and_convert_result(
             is_last_block=True
         )
+        if self._delay_lines_td is not None:
+            output_out_block_td = self._filter_block_delay(
+                1, output_out_block_td, self._last_delays
+            )
+            self._last_delays = delays
+            StageTimer.mark(StageTimer.ROTATION)
 
         # store last used filters
         self._last_filters_fd = (
@@ -736,9 +1125,54 @@ class AdjustableFdConvolver(OverlapSaveConvolver):
         )
 
         # add in time domain after applying windows
-        return (output_in_block_td * self._window_in_td) + (
+        output_block_td = (output_in_block_td * self._window_in_td) + (
             output_out_block_td * self._window_out_td
         )
+        StageTimer.mark(StageTimer.CROSSFADE)
+        return output_block_td
+
+    def _filter_block_delay(self, line, output_block_td, delays):
+        """
+        Apply onset delays of minimum phase filters by linear interpolation between samples.
+
+        Parameters
+        ----------
+        line : int
+            index of the delay line of the current (0) or last (1) filters
+        output_block_td : numpy.ndarray
+            block of filtered time domain output samples of size [number of output channels;
+            `_block_length`]
+        delays : numpy.ndarray
+            onset delays in samples of size [number of output channels]
+
+        Returns
+        -------
+        numpy.ndarray
+            block of delayed time domain output samples of size [number of output channels;
+            `_block_length`]
+        """
+        delay_line_td = self._delay_lines_td[line]
+        # set new output to end of delay line (after shifting backwards)
+        delay_line_td[:, : -self._block_length] = delay_line_td[:, self._block_length :]
+        delay_line_td[:, -self._block_length :] = output_block_td.real
+
+        # split delays into integer and fractional parts
+        np.floor(delays, out=self._delay_fractions[:, 0], casting="unsafe")
+        np.copyto(self._delay_ints, self._delay_fractions[:, 0], casting="unsafe")
+        np.subtract(delays, self._delay_fractions[:, 0], out=self._delay_fractions[:, 0])
+
+        # gather integer delayed samples and their predecessors of all channels at once
+        delayed_block_td = self._delayed_blocks_td[line]
+        np.subtract(self._delay_base_ids, self._delay_ints[:, np.newaxis], out=self._delay_ids)
+        delay_line_td.take(self._delay_ids, out=delayed_block_td, mode="clip")
+        self._delay_ids -= 1
+        delay_line_td.take(self._delay_ids, out=self._delay_scratch_td, mode="clip")
+
+        # linear interpolation of fractional delays
+        self._delay_scratch_td -= delayed_block_td
+        self._delay_scratch_td *= self._delay_fractions
+        delayed_block_td += self._delay_scratch_td
+        return delayed_block_td
 
     @staticmethod
     def _filter_block_complex_multiply(
@@ -792,7 +1226,8 @@ class AdjustableFdConvolver(OverlapSaveConvolver):
         # clean buffers if crossfade was turned off
         if not self._is_crossfade:
             self._last_blocks_fd.fill(0)
-            self._last_filters_fd.fill(0)
+            # filters might reference a read-only dirac view (see `FilterSet.release_unused()`)
+            self._last_filters_fd = np.zeros_like(self._last_filters_fd)
 
         return self._is_crossfade
 
@@ -881,6 +1316,17 @@ class AdjustableFdConvolver(OverlapSaveConvolver):
         # use floats to calculate above to preserve `_sources_deg` dtype
         return azims_deg, elevs_deg
 
+    def _get_current_filter_delays(self):
+        """
+        Returns
+        -------
+        numpy.ndarray
+            onset delays in samples to be applied to the signal of the single rendered source
+            (based on current position) of size [number of output channels]
+        """
+        azims_deg, elevs_deg = self._calculate_individual_directions()
+        return self._filter.get_filter_delays(azims_deg[0], elevs_deg[0])
+
 class AdjustableShConvolver(AdjustableFdConvolver):
     """
     Extension of `AdjustableFdConvolver` to allow fast convolution in spherical harmonics domain
@@ -977,9 +1423,17 @@ class AdjustableShConvolver(AdjustableFdConvolver):
             f"_sh_bases_weighted=shape{self._sh_bases_weighted.shape}]"
         )
 
+    # noinspection PyProtectedMember
+    def release_unused_filter_data(self):
+        """
+        Extends the function of `Convolver` to also release the frequency domain filter blocks,
+        in case the spherical harmonics coefficients are rendered instead.
+        """
+        self._filter.release_unused(is_keep_blocks_fd=self._filter._irs_blocks_nm is None)
+
     # noinspection PyProtectedMember
     def prepare_sh_processing(
-        self, input_sh_config, mrf_limit_db, compensation_type, logger=None
+        self, input_sh_config, mrf_limit_db, compensation_type, logger=None, is_plot=True
     ):
         """
         Calculate components which can be prepared before spherical harmonic processing in
@@ -999,6 +1453,8 @@ class AdjustableShConvolver(AdjustableFdConvolver):
             type of spherical harmonics processing compensation technique
         logger : logging.Logger, optional
             instance to provide identical logging behaviour as the parent process
+        is_plot : bool, optional
+            if compensation filters should be plotted and exported
         """
         # prepare attributes, copy to ensure C-order
         self._sh_m = input_sh_config.sh_m.copy()
@@ -1016,7 +1472,7 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         self._comp_mrf_limit = mrf_limit_db
 
         # apply SH compensation
-        self._apply_sh_compensation(is_plot=True, logger=logger)
+        self._apply_sh_compensation(is_plot=is_plot, logger=logger)
 
         # adjust buffer block sizes according to array configuration
         arir_channel_count = input_sh_config.sh_bases_weighted.shape[-1]
@@ -1101,8 +1557,8 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         # (re)calculate block buffers
         self._filter.calculate_filter_blocks_nm()
 
-        # backup raw block buffers
-        irs_blocks_nm_before = self._filter._irs_blocks_nm.copy()
+        # reference raw block buffers (compensations are not applied in place)
+        irs_blocks_nm_before = self._filter._irs_blocks_nm
 
         # generate specified compensations based on one block length
         comp_nm = Compensation.generate_by_type(
@@ -1116,7 +1572,11 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         )
 
         # apply compensations
-        self._filter._irs_blocks_nm *= comp_nm
+        # filter data might be shared with other filter sets, hence not altered in place
+        self._filter._irs_blocks_nm = self._filter._irs_blocks_nm * comp_nm
+
+        if not is_plot:
+            return
 
         # plot comparison of raw and compensated block buffers
         name = self._filter._generate_plot_name(
@@ -1168,7 +1628,24 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         """
         if self._is_passthrough or input_block_td is None:
             return super().filter_block(input_block_td)
+        if self._filter_block_check_silence(input_block_td):
+            return self._get_silence_block_td(input_block_td)
+
+        return self._filter_block_decode_nm(self._filter_block_encode_nm(input_block_td))
 
+    def _filter_block_encode_nm(self, input_block_td):
+        """
+        Parameters
+        ----------
+        input_block_td : numpy.ndarray
+            block of time domain input samples of size [number of input channels; `_block_length`]
+
+        Returns
+        -------
+        numpy.ndarray
+            block of complex spherical harmonics coefficients (with reversed index applied) of
+            size [number according to `sh_max_order`; `_block_length` * 2]
+        """
         # transform into frequency domain and sh-coefficients
         input_block_nm = sfa.process.spatFT_RT(
             data=self._filter_block_shift_and_convert_input(input_block_td),
@@ -1181,11 +1658,52 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         # ):
         #     block_nm[0] += filter_block_nm * input_block_nm * ...
 
-        # apply reverse index and adjust size according to filter channels
-        input_block_nm = input_block_nm[self._sh_m_rev_id][:, np.newaxis, :]
-        input_block_nm = np.repeat(input_block_nm, self._blocks_fd.shape[-2], axis=1)
+        # apply reverse index
+        input_block_nm = input_block_nm[self._sh_m_rev_id]
+        StageTimer.mark(StageTimer.SPATIAL)
+        return input_block_nm
+
+    def _filter_block_decode_nm(self, input_block_nm):
+        """
+        Apply HRIR coefficients and head rotation to a block of spherical harmonics coefficients
+        and transform the result back into time domain. The provided block is not altered,
+        so it can be decoded by several instances (see `AdjustableShConvolverMultiListener`).
+
+        Parameters
+        ----------
+        input_block_nm : numpy.ndarray
+            block of complex spherical harmonics coefficients of size [number according to
+            `sh_max_order`; `_block_length` * 2], see `_filter_block_encode_nm()`
+
+        Returns
+        -------
+        numpy.ndarray
+            block of filtered time domain output samples of size [number of output channels;
+            `_block_length`]
+        """
+        # consider only the current rendering order here (reduced in low cost mode)
+        is_crossfade = self._is_crossfade and not self._is_low_cost
+        sh_order = (
+            min(self._sh_cur_order, system_config.DEMAND_LOW_COST_SH_ORDER)
+            if self._is_low_cost
+            else self._sh_cur_order
+        )
+        sh_count = (sh_order + 1) ** 2
+        if is_crossfade:
+            # last azimuth exponents might have been applied at a higher order
+            sh_count_used = max(sh_count, self._last_sh_azim_nm.shape[0])
+        else:
+            sh_count_used = sh_count
+
+        # adjust size according to filter channels, `np.repeat()` creates a copy
+        input_block_nm = np.repeat(
+            input_block_nm[:sh_count_used, np.newaxis, :],
+            self._blocks_fd.shape[-2],
+            axis=1,
+        )
         # apply HRIR coefficients
-        input_block_nm *= self._filter.get_filter_blocks_nm()[0]
+        input_block_nm *= self._filter.get_filter_blocks_nm()[0][:sh_count_used]
+        StageTimer.mark(StageTimer.MAC)
 
         # get head-tracker position (neglect elevation)
         azim_deg, _ = self._calculate_individual_directions()
@@ -1194,21 +1712,21 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         sh_azim_nm = np.exp(
             self._blocks_fd.dtype.type(-1j) * self._sh_m * np.deg2rad(azim_deg)
         )
-        # consider only the current rendering order here
-        sh_azim_nm = sh_azim_nm[: (self._sh_cur_order + 1) ** 2, np.newaxis, np.newaxis]
+        sh_azim_nm = sh_azim_nm[:sh_count, np.newaxis, np.newaxis]
 
         # calculation back into frequency domain into current buffer, after applying rotation
         # coefficients
         self._blocks_fd[0, 0] = np.sum(
             input_block_nm[: sh_azim_nm.shape[0]] * sh_azim_nm, axis=0
         )
+        StageTimer.mark(StageTimer.ROTATION)
         # transform back into time domain
         output_in_block_td = self._filter_block_shift_and_convert_result(
             is_last_block=False
         )
 
         # skip further calculations in case no crossfade in time domain should be done
-        if not self._is_crossfade:
+        if not is_crossfade:
             return output_in_block_td
 
         # calculation back into frequency domain into last buffer, after applying rotation
@@ -1217,6 +1735,7 @@ class AdjustableShConvolver(AdjustableFdConvolver):
             input_block_nm[: self._last_sh_azim_nm.shape[0]] * self._last_sh_azim_nm,
             axis=0,
         )
+        StageTimer.mark(StageTimer.ROTATION)
         # transform back into time domain
         output_out_block_td = self._filter_block_shift_and_convert_result(
             is_last_block=True
@@ -1226,9 +1745,11 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         self._last_sh_azim_nm = sh_azim_nm  # copy should not be necessary here
 
         # add in time domain after applying windows
-        return (output_in_block_td * self._window_in_td) + (
+        output_block_td = (output_in_block_td * self._window_in_td) + (
             output_out_block_td * self._window_out_td
         )
+        StageTimer.mark(StageTimer.CROSSFADE)
+        return output_block_td
 
     def set_crossfade(self, new_state=None):
         """
@@ -1256,114 +1777,922 @@ class AdjustableShConvolver(AdjustableFdConvolver):
         return self._is_crossfade
 
 
-
-
-
-
-class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
+class AdjustableShConvolverMultiListener(AdjustableShConvolver):
     """
-    Extension of `AdjustableFdConvolver` to allow fast convolution in spherical harmonics domain
-    while adjusting orientation by a rotation matrix i.e., for binaural rendering (depending on
-    the head  orientation).
+    Extension of `AdjustableShConvolver` to render several individually head-tracked binaural
+    outputs from the same microphone array input. The spatial Fourier transform of the input is
+    done only once per block, whereas the HRIR application, rotation and inverse transform are
+    done for every listener. Hence, the processing effort scales like one encoding plus one
+    decoding per listener instead of one entire rendering chain per listener.
 
-    The current spherical harmonics rendering order can be adjusted i.e., lowered, during execution.
+    The first listener is rendered by this instance itself (with its own `FilterSet` and tracker
+    data). Every additional listener is rendered by a contained `AdjustableShConvolver`.
 
     Attributes
     ----------
-    _sh_m : numpy.ndarray
-        set of spherical harmonics orders of size [count according to `sh_max_order`]
-    _sh_m_rev_id : list of int
-        set of reversed spherical harmonics orders indices of size
-        [count according to `sh_max_order`]
-    _sh_cur_order : int
-        current maximum spherical harmonics order being rendered
-    _sh_bases_weighted : numpy.ndarray
-        spherical harmonic bases weighted by grid weights of spatial sampling points of size
-        [number according to `sh_max_order`; number of input channels]
-    _last_sh_azim_nm : numpy.ndarray
-        set of spherical harmonics azimuth weights that were applied to the signal in the last
-        processing frame of size [count according to `sh_max_order`; 1; 1]
-    _comp : list of str or list of Compensation.Type or str or Compensation.Type
-        type of spherical harmonics compensation being applied to the filter
-    _comp_arir_config : sfa.io.ArrayConfiguration
-        recording / measurement microphone array configuration for spherical harmonics compensation
-        being applied to the filter
-    _comp_mrf_limit : int
-        maximum amplification limit in dB of modal radial filter being applied to the filter
+    _listeners : list of AdjustableShConvolver
+        additional listener decoding stages, each with its own HRIR `FilterSet` and tracker data
+    _output_blocks_td : numpy.ndarray
+        preallocated time domain output samples of all listeners of size [number of output
+        channels of all listeners; `_block_length`]
+    _output_views_td : list of numpy.ndarray
+        views of `_output_blocks_td` of the output channels of every listener
     """
 
-    ## def __init__(self, filter_set, block_length, source_positions, azim_deg=0, elevs_deg = 0): ##shared_tracker_data):
-    def __init__(self, filter_set, block_length, source_positions, shared_tracker_data,filter_set_encoding):
-    
+    def __init__(
+        self,
+        filter_set,
+        block_length,
+        source_positions,
+        shared_tracker_data,
+        listener_filter_sets,
+        listener_shared_tracker_data,
+    ):
         """
-        Extends the function of `OverlapSaveConvolver` to initialize a binaural renderer by
-        loading the provided positions of virtual sound sources.
+        Extends the function of `AdjustableShConvolver` to also initialize all additional
+        listener decoding stages.
 
         Parameters
         ----------
-        source_positions : tuple of int or tuple of float
-            rendered binaural source positions as list of tuple of azimuth (counterclockwise) and
-            elevation in degrees, int or float values are possible
-        shared_tracker_data : multiprocessing.Array
-            shared data array from an existing tracker instance for dynamic binaural rendering, see
+        listener_filter_sets : list of FilterSet
+            beforehand loaded HRIR filter sets of all additional listeners
+        listener_shared_tracker_data : list of multiprocessing.Array
+            shared data arrays from existing tracker instances of all additional listeners, see
             `HeadTracker`
 
         Raises
         ------
-        NotImplementedError
-            in case more then one `source_positions` are given
+        ValueError
+            in case the number of additional listener filter sets and tracker data do not match
         """
         super().__init__(
             filter_set=filter_set,
             block_length=block_length,
             source_positions=source_positions,
             shared_tracker_data=shared_tracker_data,
-            ## azim_deg=azim_deg,
-            ## elevs_deg=elevs_deg
         )
 
-        if self._sources_deg.shape[0] > 1:
-            raise NotImplementedError(
-                "more then one virtual source position given, which is not supported yet."
+        if len(listener_filter_sets) != len(listener_shared_tracker_data):
+            raise ValueError(
+                f"number of listener filter sets ({len(listener_filter_sets)}) does not match "
+                f"number of listener tracker data ({len(listener_shared_tracker_data)})."
             )
 
-        self._sh_m = None
-        self._sh_m_rev_id = None
-        self._sh_cur_order = None
-        self._sh_bases_weighted = None
-        self._last_filters_fd = None
-        self._last_sh_azim_nm = None
-        self._comp = None
-        self._comp_arir_config = None
-        self._comp_mrf_limit = None
-        self._encoding_filters = filter_set_encoding
-        self._encoding_filters.calculate_filter_blocks_fd(block_length)
+        self._listeners = [
+            AdjustableShConvolver(
+                filter_set=listener_filter_set,
+                block_length=block_length,
+                source_positions=source_positions,
+                shared_tracker_data=listener_tracker_data,
+            )
+            for listener_filter_set, listener_tracker_data in zip(
+                listener_filter_sets, listener_shared_tracker_data
+            )
+        ]
 
-    def __copy__(self):
-        # _filter = copy(self._filter)
-        # _filter.load(block_length=self._block_length, is_prevent_logging=True,
-        #              is_single_precision=self._filter.get_dirac_td().dtype == np.float32)
-        # new = type(self)(_filter, self._block_length, self._sources_deg, self._tracker_deg)
-        # new.__dict__.update(self.__dict__)
-        # # this is supposed to be the filter of the pre-renderer !!!
-        # new.prepare_sh_processing(_filter.get_sh_configuration(), 0)
-        # return new
-        raise NotImplementedError("This implementation was not tested so far.")
+        # stacked outputs of all listeners are written in place
+        channel_count = self._blocks_fd.shape[-2]
+        self._output_blocks_td = np.zeros(
+            (channel_count * self.get_listener_count(), self._block_length),
+            dtype=self._input_block_td.dtype,
+        )
+        self._output_views_td = [
+            self._output_blocks_td[c : c + channel_count]
+            for c in range(0, self._output_blocks_td.shape[0], channel_count)
+        ]
 
     def __str__(self):
-        return (
-            f"[{super().__str__()[1:-1]}, _sh_m=shape{self._sh_m.shape}, "
-            f"_sh_m_rev_id=shape{self._sh_m_rev_id.shape}, "
-            f"_sh_cur_order={self._sh_cur_order},"
-            f"_sh_bases_weighted=shape{self._sh_bases_weighted.shape}]"
-        )
+        return f"[{super().__str__()[1:-1]}, _listeners=len({len(self._listeners)})]"
 
-    # noinspection PyProtectedMember
-    def prepare_sh_processing(
-        self, input_sh_config, mrf_limit_db, compensation_type, logger=None
-    ):
-        """
-        Calculate components which can be prepared before spherical harmonic processing in
+    def _clear_buffers(self):
+        """Clear all intermediate signal block buffers, helpful to prevent artifacts when
+        switching configurations."""
+        super()._clear_buffers()
+        for listener in self._listeners:
+            listener._clear_buffers()
+
+    def init_fft_optimize(self, logger=None):
+        """
+        Initialize `pyfftw` objects with given `config` parameters, for most efficient real-time
+        DFT. This is also done for all additional listeners.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        super().init_fft_optimize(logger)
+        for listener in self._listeners:
+            listener.init_fft_optimize(logger)
+
+    def release_unused_filter_data(self):
+        """
+        Extends the function of `AdjustableShConvolver` to also release unused filter data of
+        all additional listeners.
+        """
+        super().release_unused_filter_data()
+        for listener in self._listeners:
+            listener.release_unused_filter_data()
+
+    # noinspection PyProtectedMember
+    def prepare_sh_processing(
+        self, input_sh_config, mrf_limit_db, compensation_type, logger=None
+    ):
+        """
+        Extends the function of `AdjustableShConvolver` to also prepare all additional
+        listeners, so their individual HRIR sets are compensated identically.
+        """
+        super().prepare_sh_processing(
+            input_sh_config, mrf_limit_db, compensation_type, logger
+        )
+        for listener in self._listeners:
+            listener.prepare_sh_processing(
+                input_sh_config, mrf_limit_db, compensation_type, logger
+            )
+
+    def update_sh_processing(self, sh_new_order, logger=None):
+        """
+        Extends the function of `AdjustableShConvolver` to also update the SH processing order of
+        all additional listeners.
+
+        Returns
+        -------
+        int
+            actually realized SH processing order
+        """
+        sh_new_order = super().update_sh_processing(sh_new_order, logger)
+        if sh_new_order is not None:
+            for listener in self._listeners:
+                listener.update_sh_processing(sh_new_order, logger)
+        return sh_new_order
+
+    def set_passthrough(self, new_state=None):
+        """
+        Parameters
+        ----------
+        new_state : bool or None, optional
+            new passthrough state if processing should be virtually bypassed by using a dirac as a
+            'filter', if `None` is given this function works as a toggle between states
+
+        Returns
+        -------
+        bool
+            actually realized passthrough state
+        """
+        new_state = super().set_passthrough(new_state)
+        for listener in self._listeners:
+            listener.set_passthrough(new_state)
+        return new_state
+
+    def set_low_cost(self, new_state=None):
+        """
+        Parameters
+        ----------
+        new_state : bool or None, optional
+            new low cost state if signals should be processed at reduced quality and effort, if
+            `None` is given this function works as a toggle between states
+
+        Returns
+        -------
+        bool
+            actually realized low cost state
+        """
+        new_state = super().set_low_cost(new_state)
+        for listener in self._listeners:
+            listener.set_low_cost(new_state)
+        return new_state
+
+    def set_crossfade(self, new_state=None):
+        """
+        Parameters
+        ----------
+        new_state : bool or None, optional
+            new crossfade state if output signals applying the current filter should be cross-faded
+            with the output signals of the last filter, if `None` is given this function works as a
+            toggle between states
+
+        Returns
+        -------
+        bool
+            actually realized crossfade state
+        """
+        new_state = super().set_crossfade(new_state)
+        for listener in self._listeners:
+            listener.set_crossfade(new_state)
+        return new_state
+
+    def get_listener_count(self):
+        """
+        Returns
+        -------
+        int
+            number of rendered listeners (including the one rendered by this instance)
+        """
+        return len(self._listeners) + 1
+
+    def get_output_channel_count(self):
+        """
+        Returns
+        -------
+        int
+            number of processed output channels of all listeners
+        """
+        return super().get_output_channel_count() * self.get_listener_count()
+
+    def filter_block(self, input_block_td):
+        """
+        Process a block of samples with the given `FilterSet` and all additional listener
+        `FilterSet`s. The spherical harmonics coefficients are calculated once by
+        `_filter_block_encode_nm()` and afterwards decoded individually for every listener by
+        `_filter_block_decode_nm()`.
+
+        In passthrough mode, the functionality of `OverlapSaveConvolver` filtering is used and the
+        result is provided identically to all listeners.
+
+        Parameters
+        ----------
+        input_block_td : numpy.ndarray or None
+            block of time domain input samples of size [number of input channels; `_block_length`]
+
+        Returns
+        -------
+        numpy.ndarray
+            block of filtered time domain output samples of size [number of output channels of
+            all listeners; `_block_length`]
+        """
+        if self._is_passthrough or input_block_td is None:
+            output_block_td = super().filter_block(input_block_td)
+            if output_block_td is None:
+                return None
+            for output_view_td in self._output_views_td:
+                output_view_td[:] = output_block_td.real
+            return self._output_blocks_td
+
+        if self._filter_block_check_silence(input_block_td):
+            return self._get_silence_block_td(
+                input_block_td, self._blocks_fd.shape[-2] * self.get_listener_count()
+            )
+
+        input_block_nm = self._filter_block_encode_nm(input_block_td)
+        self._output_views_td[0][:] = self._filter_block_decode_nm(input_block_nm).real
+        for listener, output_view_td in zip(self._listeners, self._output_views_td[1:]):
+            output_view_td[:] = listener._filter_block_decode_nm(input_block_nm).real
+        return self._output_blocks_td
+
+
+class AdjustableShConvolverBatch(AdjustableShConvolver):
+    """
+    Extension of `AdjustableShConvolver` to render several microphone arrays with individual
+    head orientations in one vectorized pass. The blocks of all arrays are stacked along a
+    leading axis, so that a single DFT, spatial Fourier transform, HRIR multiplication and
+    inverse DFT serves all arrays. Hence, the Python overhead per processed block does not depend
+    on the number of rendered arrays anymore.
+
+    All arrays need to share the block length, the number of array channels, the SH order and
+    the number of HRIR output channels. The first array is rendered with the `FilterSet` and
+    tracker data of this instance itself. Every additional array is represented by a contained
+    `AdjustableShConvolver`, which is only used to prepare its individual SH configuration,
+    compensation filters and head orientation.
+
+    Attributes
+    ----------
+    _arrays : list of AdjustableShConvolver
+        additional microphone array rendering stages, each with its own HRIR `FilterSet` and
+        tracker data
+    _array_volumes : numpy.ndarray
+        output volume (linear factor) of every array of size [number of arrays]
+    _array_mutes : numpy.ndarray
+        output mute state of every array of size [number of arrays]
+    _batch_input_block_td : numpy.ndarray
+        time domain input samples of all arrays contained in a shifting buffer of size
+        [number of arrays; number of array channels; 2 * `_block_length`]
+    _batch_sh_bases_weighted : numpy.ndarray
+        spherical harmonic bases weighted by grid weights (with reversed index applied) of all
+        arrays of size [number of arrays; number according to `sh_max_order`; number of array
+        channels]
+    _batch_filters_nm : numpy.ndarray
+        compensated HRIR spherical harmonics coefficients of all arrays of size [number of
+        arrays; number according to `sh_max_order`; number of output channels;
+        2 * `_block_length`]
+    _batch_weighted_nm : numpy.ndarray
+        buffer for the input coefficients after applying the HRIR coefficients of size like
+        `_batch_filters_nm`
+    _batch_sh_weights : numpy.ndarray
+        real weights of size [number of arrays; number according to `sh_max_order`], combining
+        the current rendering order as well as the volume and mute state of every array
+    _batch_sh_weights_low_cost : numpy.ndarray
+        real weights like `_batch_sh_weights`, with the rendering order additionally limited to
+        `system_config.DEMAND_LOW_COST_SH_ORDER` in low cost mode
+    _batch_passthrough_td : numpy.ndarray
+        preallocated time domain output samples of all arrays in passthrough mode of size
+        [number of arrays; number of output channels; `_block_length`]
+    _batch_last_sh_azim_nm : numpy.ndarray
+        set of spherical harmonics azimuth weights of all arrays that were applied to the signal
+        in the last processing frame of size like `_batch_sh_weights`
+    _batch_fft : pyfftw.FFTW
+        FFTW library wrapper with a pre-calculated optimal scheme for the DFT of all arrays
+    _batch_ifft : pyfftw.FFTW
+        FFTW library wrapper with a pre-calculated optimal scheme for the inverse DFT of all
+        arrays (current and last orientation in case of crossfade)
+    _batch_ifft_single : pyfftw.FFTW
+        FFTW library wrapper with a pre-calculated optimal scheme for the inverse DFT of all
+        arrays (only current orientation)
+    """
+
+    def __init__(
+        self,
+        filter_set,
+        block_length,
+        source_positions,
+        shared_tracker_data,
+        array_filter_sets,
+        array_source_positions,
+        array_shared_tracker_data,
+    ):
+        """
+        Extends the function of `AdjustableShConvolver` to also initialize all additional
+        microphone array rendering stages.
+
+        Parameters
+        ----------
+        array_filter_sets : list of FilterSet
+            beforehand loaded HRIR filter sets of all additional arrays
+        array_source_positions : list of list of int or list of list of float or None
+            rendered binaural source positions of all additional arrays, if `None` is given the
+            `source_positions` of this instance are used
+        array_shared_tracker_data : list of multiprocessing.Array
+            shared data arrays from existing tracker instances of all additional arrays, see
+            `HeadTracker`
+
+        Raises
+        ------
+        ValueError
+            in case the number of additional array filter sets, source positions and tracker data
+            do not match
+        """
+        super().__init__(
+            filter_set=filter_set,
+            block_length=block_length,
+            source_positions=source_positions,
+            shared_tracker_data=shared_tracker_data,
+        )
+
+        if array_source_positions is None:
+            array_source_positions = [source_positions] * len(array_filter_sets)
+        if not (
+            len(array_filter_sets)
+            == len(array_source_positions)
+            == len(array_shared_tracker_data)
+        ):
+            raise ValueError(
+                f"number of array filter sets ({len(array_filter_sets)}), source positions "
+                f"({len(array_source_positions)}) and tracker data "
+                f"({len(array_shared_tracker_data)}) does not match."
+            )
+
+        self._arrays = [
+            AdjustableShConvolver(
+                filter_set=array_filter_set,
+                block_length=block_length,
+                source_positions=array_positions,
+                shared_tracker_data=array_tracker_data,
+            )
+            for array_filter_set, array_positions, array_tracker_data in zip(
+                array_filter_sets, array_source_positions, array_shared_tracker_data
+            )
+        ]
+        self._array_volumes = np.ones(self.get_array_count())
+        self._array_mutes = np.zeros(self.get_array_count(), dtype=np.bool_)
+
+        self._batch_input_block_td = None
+        self._batch_sh_bases_weighted = None
+        self._batch_filters_nm = None
+        self._batch_weighted_nm = None
+        self._batch_sh_weights = None
+        self._batch_sh_weights_low_cost = None
+        self._batch_passthrough_td = None
+        self._batch_last_sh_azim_nm = None
+        self._batch_fft = None
+        self._batch_ifft = None
+        self._batch_ifft_single = None
+
+    def __str__(self):
+        return f"[{super().__str__()[1:-1]}, _arrays=len({len(self._arrays)})]"
+
+    def _get_arrays(self):
+        """
+        Returns
+        -------
+        list of AdjustableShConvolver
+            all rendered arrays (including the one rendered by this instance)
+        """
+        return [self] + self._arrays
+
+    def _clear_buffers(self):
+        """Clear all intermediate signal block buffers, helpful to prevent artifacts when
+        switching configurations."""
+        super()._clear_buffers()
+        if self._batch_input_block_td is not None:
+            self._batch_input_block_td.fill(0)
+
+    def init_fft_optimize(self, logger=None):
+        """
+        Initialize `pyfftw` objects with given `config` parameters, for most efficient real-time
+        DFT. This is also done for the stacked buffers of all arrays.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        super().init_fft_optimize(logger)
+        if not system_config.IS_PYFFTW_MODE or self._batch_filters_nm is None:
+            return
+
+        blocks_shape = (
+            self._batch_filters_nm.shape[0],
+            2,
+            self._batch_filters_nm.shape[-2],
+            self._batch_filters_nm.shape[-1],
+        )
+        self._batch_fft = pyfftw.builders.fft(
+            self._batch_input_block_td, overwrite_input=False
+        )
+        self._batch_ifft = pyfftw.builders.ifft(
+            np.zeros(blocks_shape, dtype=self._batch_filters_nm.dtype),
+            overwrite_input=True,
+        )
+        self._batch_ifft_single = pyfftw.builders.ifft(
+            np.zeros(
+                (blocks_shape[0], 1) + blocks_shape[2:],
+                dtype=self._batch_filters_nm.dtype,
+            ),
+            overwrite_input=True,
+        )
+
+    def release_unused_filter_data(self):
+        """
+        Extends the function of `AdjustableShConvolver` to also release unused filter data of
+        all additional arrays.
+        """
+        super().release_unused_filter_data()
+        for array in self._arrays:
+            array.release_unused_filter_data()
+
+    # noinspection PyProtectedMember
+    def prepare_sh_processing(
+        self, input_sh_config, mrf_limit_db, compensation_type, logger=None
+    ):
+        """
+        Extends the function of `AdjustableShConvolver` to also prepare all additional arrays.
+        Afterwards all components relevant to the vectorized processing are stacked.
+
+        Parameters
+        ----------
+        input_sh_config : FilterSetShConfig or list of FilterSetShConfig
+            combined filter configuration with all necessary information to transform an incoming
+            audio block into spherical harmonics sound field coefficients in real-time, either
+            one for all arrays or individually for every array
+        mrf_limit_db : int
+            maximum modal amplification limit in dB
+        compensation_type : str or Compensation.Type
+            type of spherical harmonics processing compensation technique
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+
+        Raises
+        ------
+        ValueError
+            in case the number of provided configurations does not match the number of arrays
+        """
+        if not isinstance(input_sh_config, list):
+            input_sh_config = [input_sh_config] * self.get_array_count()
+        if len(input_sh_config) != self.get_array_count():
+            raise ValueError(
+                f"number of SH configurations ({len(input_sh_config)}) does not match number of "
+                f"arrays ({self.get_array_count()})."
+            )
+
+        super().prepare_sh_processing(
+            input_sh_config[0], mrf_limit_db, compensation_type, logger
+        )
+        for array, array_sh_config in zip(self._arrays, input_sh_config[1:]):
+            array.prepare_sh_processing(
+                array_sh_config, mrf_limit_db, compensation_type, logger
+            )
+
+        self._stack_batch_processing()
+
+    def update_sh_processing(self, sh_new_order, logger=None):
+        """
+        Extends the function of `AdjustableShConvolver` to also update the SH processing order of
+        all additional arrays.
+
+        Returns
+        -------
+        int
+            actually realized SH processing order
+        """
+        sh_new_order = super().update_sh_processing(sh_new_order, logger)
+        if sh_new_order is not None:
+            for array in self._arrays:
+                array.update_sh_processing(sh_new_order, logger)
+            self._stack_batch_filters()
+            self._update_batch_sh_weights()
+        return sh_new_order
+
+    # noinspection PyProtectedMember
+    def _stack_batch_processing(self):
+        """
+        Allocate the stacked buffers and gather the prepared components of all arrays for the
+        vectorized processing.
+
+        Raises
+        ------
+        ValueError
+            in case the arrays do not share the number of channels or the size of the HRIR
+            spherical harmonics coefficients
+        """
+        arrays = self._get_arrays()
+        channel_counts = {array._input_block_td.shape[-2] for array in arrays}
+        if len(channel_counts) > 1:
+            raise ValueError(
+                f"batch rendering requires an identical number of channels for all arrays, "
+                f"but {sorted(channel_counts)} were given."
+            )
+        filter_shapes = {array._filter.get_filter_blocks_nm().shape for array in arrays}
+        if len(filter_shapes) > 1:
+            raise ValueError(
+                f"batch rendering requires identical HRIR spherical harmonics coefficient sizes "
+                f"for all arrays, but {sorted(filter_shapes)} were given."
+            )
+
+        self._batch_input_block_td = np.zeros(
+            (len(arrays),) + self._input_block_td.shape,
+            dtype=self._input_block_td.dtype,
+        )
+        # apply reverse index already to the bases, so it is not necessary at runtime
+        self._batch_sh_bases_weighted = np.stack(
+            [array._sh_bases_weighted[array._sh_m_rev_id] for array in arrays]
+        ).astype(self._blocks_fd.dtype)
+        self._stack_batch_filters()
+        self._batch_weighted_nm = np.zeros_like(self._batch_filters_nm)
+        self._batch_last_sh_azim_nm = np.zeros(
+            self._batch_filters_nm.shape[:2], dtype=self._blocks_fd.dtype
+        )
+        self._batch_passthrough_td = np.zeros(
+            (len(arrays), self._batch_filters_nm.shape[2], self._block_length),
+            dtype=self._input_block_td.dtype,
+        )
+        self._update_batch_sh_weights()
+
+    # noinspection PyProtectedMember
+    def _stack_batch_filters(self):
+        """Gather the (compensated) HRIR spherical harmonics coefficients of all arrays."""
+        self._batch_filters_nm = np.stack(
+            [array._filter.get_filter_blocks_nm()[0] for array in self._get_arrays()]
+        ).astype(self._blocks_fd.dtype)
+
+    def _update_batch_sh_weights(self):
+        """Combine the current rendering order (also limited for low cost mode) as well as volume
+        and mute state of all arrays into real weights, which are applied together with the
+        rotation coefficients."""
+        if self._batch_filters_nm is None:
+            return
+
+        sh_ids = np.arange(self._batch_filters_nm.shape[1])
+        array_weights = np.where(self._array_mutes, 0, self._array_volumes)[:, np.newaxis]
+        sh_orders = np.array([array._sh_cur_order for array in self._get_arrays()])
+        sh_orders_low_cost = np.minimum(sh_orders, system_config.DEMAND_LOW_COST_SH_ORDER)
+
+        sh_weights = (sh_ids < (sh_orders[:, np.newaxis] + 1) ** 2) * array_weights
+        sh_weights_low_cost = (
+            sh_ids < (sh_orders_low_cost[:, np.newaxis] + 1) ** 2
+        ) * array_weights
+        # replace references at once
+        self._batch_sh_weights = sh_weights.astype(self._input_block_td.dtype)
+        self._batch_sh_weights_low_cost = sh_weights_low_cost.astype(self._input_block_td.dtype)
+
+    def set_crossfade(self, new_state=None):
+        """
+        Parameters
+        ----------
+        new_state : bool or None, optional
+            new crossfade state if output signals applying the current filter should be cross-faded
+            with the output signals of the last filter, if `None` is given this function works as a
+            toggle between states
+
+        Returns
+        -------
+        bool
+            actually realized crossfade state
+        """
+        new_state = super().set_crossfade(new_state)
+        for array in self._arrays:
+            array.set_crossfade(new_state)
+
+        # clean buffers if crossfade was turned off
+        if not new_state and self._batch_last_sh_azim_nm is not None:
+            self._batch_last_sh_azim_nm.fill(0)
+
+        return new_state
+
+    def set_array_volume(self, array_id, value):
+        """
+        Parameters
+        ----------
+        array_id : int
+            index of the array
+        value : float
+            new output volume (linear factor) of the array
+
+        Returns
+        -------
+        float
+            actually realized output volume (linear factor) of the array
+        """
+        self._array_volumes[array_id] = value
+        self._update_batch_sh_weights()
+        return self._array_volumes[array_id]
+
+    def set_array_mute(self, array_id, new_state=None):
+        """
+        Parameters
+        ----------
+        array_id : int
+            index of the array
+        new_state : bool or None, optional
+            new output mute state of the array, if `None` is given this function works as a
+            toggle between states
+
+        Returns
+        -------
+        bool
+            actually realized output mute state of the array
+        """
+        if new_state is None:
+            self._array_mutes[array_id] = not self._array_mutes[array_id]
+        else:
+            self._array_mutes[array_id] = new_state
+        self._update_batch_sh_weights()
+        return bool(self._array_mutes[array_id])
+
+    def get_array_count(self):
+        """
+        Returns
+        -------
+        int
+            number of rendered arrays (including the one rendered by this instance)
+        """
+        return len(self._arrays) + 1
+
+    def get_input_channel_count(self):
+        """
+        Returns
+        -------
+        int
+            number of processed input channels of all arrays
+        """
+        return sum(
+            array._input_block_td.shape[-2] for array in self._get_arrays()
+        )
+
+    def get_output_channel_count(self):
+        """
+        Returns
+        -------
+        int
+            number of processed output channels of all arrays
+        """
+        return super().get_output_channel_count() * self.get_array_count()
+
+    def filter_block(self, input_block_td):
+        """
+        Process a block of samples of all arrays in one vectorized pass. The input channels of
+        all arrays are expected to be stacked in the order of the arrays.
+
+        In passthrough mode, the first array channels (according to the number of output
+        channels) of every array are delivered.
+
+        As long as the batch processing was not prepared yet (see `prepare_sh_processing()`), the
+        functionality of `AdjustableShConvolver` filtering is used for the first array only.
+
+        Parameters
+        ----------
+        input_block_td : numpy.ndarray or None
+            block of time domain input samples of size [number of input channels of all arrays;
+            `_block_length`]
+
+        Returns
+        -------
+        numpy.ndarray
+            block of filtered time domain output samples of size [number of output channels of
+            all arrays; `_block_length`]
+        """
+        if input_block_td is None or self._batch_filters_nm is None:
+            return super().filter_block(input_block_td)
+
+        if self._filter_block_check_silence(input_block_td):
+            return self._get_silence_block_td(
+                input_block_td,
+                self._batch_filters_nm.shape[0] * self._batch_filters_nm.shape[2],
+            )
+
+        array_count, sh_count, channel_count, nfft = self._batch_filters_nm.shape
+        block_length = input_block_td.shape[-1]
+
+        # set new input to end of stored blocks (after shifting backwards)
+        self._batch_input_block_td[..., :block_length] = self._batch_input_block_td[
+            ..., block_length:
+        ]
+        self._batch_input_block_td[..., block_length:] = input_block_td.reshape(
+            array_count, -1, block_length
+        )
+
+        if self._is_passthrough:
+            # further output channels than array channels remain zero
+            passthrough_count = min(channel_count, self._batch_input_block_td.shape[1])
+            self._batch_passthrough_td[:, :passthrough_count] = self._batch_input_block_td[
+                :, :passthrough_count, block_length:
+            ]
+            return self._batch_passthrough_td.reshape(-1, block_length)
+
+        # transform all arrays into frequency domain and sh-coefficients
+        input_block_fd = (
+            self._batch_fft(self._batch_input_block_td)
+            if system_config.IS_PYFFTW_MODE
+            else np.fft.fft(self._batch_input_block_td)
+        )
+        StageTimer.mark(StageTimer.FFT)
+        input_block_nm = np.matmul(self._batch_sh_bases_weighted, input_block_fd)
+        StageTimer.mark(StageTimer.SPATIAL)
+
+        # apply HRIR coefficients of all arrays
+        np.multiply(
+            input_block_nm[:, :, np.newaxis, :],
+            self._batch_filters_nm,
+            out=self._batch_weighted_nm,
+        )
+        StageTimer.mark(StageTimer.MAC)
+
+        # get head-tracker positions of all arrays (neglect elevation)
+        azims_deg = np.array(
+            [array._calculate_individual_directions()[0][0] for array in self._get_arrays()]
+        )
+        sh_azim_nm = np.exp(
+            self._blocks_fd.dtype.type(-1j)
+            * self._sh_m[np.newaxis, :]
+            * np.deg2rad(azims_deg)[:, np.newaxis]
+        )
+        # consider only the current rendering order (reduced in low cost mode) as well as volume
+        # and mute state here
+        sh_azim_nm *= (
+            self._batch_sh_weights_low_cost if self._is_low_cost else self._batch_sh_weights
+        )
+
+        # apply current (and last) rotation coefficients and sum over all sh-coefficients
+        is_crossfade = self._is_crossfade and not self._is_low_cost
+        if is_crossfade:
+            sh_azims_nm = np.stack((sh_azim_nm, self._batch_last_sh_azim_nm), axis=1)
+        else:
+            sh_azims_nm = sh_azim_nm[:, np.newaxis]
+        blocks_fd = np.matmul(
+            sh_azims_nm, self._batch_weighted_nm.reshape(array_count, sh_count, -1)
+        ).reshape(array_count, sh_azims_nm.shape[1], channel_count, nfft)
+        StageTimer.mark(StageTimer.ROTATION)
+
+        # transform back into time domain
+        if system_config.IS_PYFFTW_MODE:
+            blocks_td = (
+                self._batch_ifft(blocks_fd)
+                if is_crossfade
+                else self._batch_ifft_single(blocks_fd)
+            )
+        else:
+            blocks_td = np.fft.ifft(blocks_fd)
+        # relevant second half of the time domain data
+        blocks_td = blocks_td[..., block_length:].real
+        StageTimer.mark(StageTimer.IFFT)
+
+        # skip further calculations in case no crossfade in time domain should be done
+        if not is_crossfade:
+            return blocks_td[:, 0].reshape(-1, block_length)
+
+        # store last used azimuth exponents
+        self._batch_last_sh_azim_nm = sh_azim_nm
+
+        # add in time domain after applying windows
+        output_block_td = (
+            (blocks_td[:, 0] * self._window_in_td) + (blocks_td[:, 1] * self._window_out_td)
+        ).reshape(-1, block_length)
+        StageTimer.mark(StageTimer.CROSSFADE)
+        return output_block_td
+
+
+class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
+    """
+    Extension of `AdjustableFdConvolver` to allow fast convolution in spherical harmonics domain
+    while adjusting orientation by a rotation matrix i.e., for binaural rendering (depending on
+    the head  orientation).
+
+    The current spherical harmonics rendering order can be adjusted i.e., lowered, during execution.
+
+    Attributes
+    ----------
+    _sh_m : numpy.ndarray
+        set of spherical harmonics orders of size [count according to `sh_max_order`]
+    _sh_m_rev_id : list of int
+        set of reversed spherical harmonics orders indices of size
+        [count according to `sh_max_order`]
+    _sh_cur_order : int
+        current maximum spherical harmonics order being rendered
+    _sh_bases_weighted : numpy.ndarray
+        spherical harmonic bases weighted by grid weights of spatial sampling points of size
+        [number according to `sh_max_order`; number of input channels]
+    _last_sh_azim_nm : numpy.ndarray
+        set of spherical harmonics azimuth weights that were applied to the signal in the last
+        processing frame of size [count according to `sh_max_order`; 1; 1]
+    _comp : list of str or list of Compensation.Type or str or Compensation.Type
+        type of spherical harmonics compensation being applied to the filter
+    _comp_arir_config : sfa.io.ArrayConfiguration
+        recording / measurement microphone array configuration for spherical harmonics compensation
+        being applied to the filter
+    _comp_mrf_limit : int
+        maximum amplification limit in dB of modal radial filter being applied to the filter
+    """
+
+    ## def __init__(self, filter_set, block_length, source_positions, azim_deg=0, elevs_deg = 0): ##shared_tracker_data):
+    def __init__(self, filter_set, block_length, source_positions, shared_tracker_data,filter_set_encoding):
+    
+        """
+        Extends the function of `OverlapSaveConvolver` to initialize a binaural renderer by
+        loading the provided positions of virtual sound sources.
+
+        Parameters
+        ----------
+        source_positions : tuple of int or tuple of float
+            rendered binaural source positions as list of tuple of azimuth (counterclockwise) and
+            elevation in degrees, int or float values are possible
+        shared_tracker_data : multiprocessing.Array
+            shared data array from an existing tracker instance for dynamic binaural rendering, see
+            `HeadTracker`
+
+        Raises
+        ------
+        NotImplementedError
+            in case more then one `source_positions` are given
+        """
+        super().__init__(
+            filter_set=filter_set,
+            block_length=block_length,
+            source_positions=source_positions,
+            shared_tracker_data=shared_tracker_data,
+            ## azim_deg=azim_deg,
+            ## elevs_deg=elevs_deg
+        )
+
+        if self._sources_deg.shape[0] > 1:
+            raise NotImplementedError(
+                "more then one virtual source position given, which is not supported yet."
+            )
+
+        self._sh_m = None
+        self._sh_m_rev_id = None
+        self._sh_cur_order = None
+        self._sh_bases_weighted = None
+        self._last_filters_fd = None
+        self._last_sh_azim_nm = None
+        self._comp = None
+        self._comp_arir_config = None
+        self._comp_mrf_limit = None
+        self._encoding_filters = filter_set_encoding
+        self._encoding_filters.calculate_filter_blocks_fd(block_length)
+
+    def __copy__(self):
+        # _filter = copy(self._filter)
+        # _filter.load(block_length=self._block_length, is_prevent_logging=True,
+        #              is_single_precision=self._filter.get_dirac_td().dtype == np.float32)
+        # new = type(self)(_filter, self._block_length, self._sources_deg, self._tracker_deg)
+        # new.__dict__.update(self.__dict__)
+        # # this is supposed to be the filter of the pre-renderer !!!
+        # new.prepare_sh_processing(_filter.get_sh_configuration(), 0)
+        # return new
+        raise NotImplementedError("This implementation was not tested so far.")
+
+    def __str__(self):
+        return (
+            f"[{super().__str__()[1:-1]}, _sh_m=shape{self._sh_m.shape}, "
+            f"_sh_m_rev_id=shape{self._sh_m_rev_id.shape}, "
+            f"_sh_cur_order={self._sh_cur_order},"
+            f"_sh_bases_weighted=shape{self._sh_bases_weighted.shape}]"
+        )
+
+    # noinspection PyProtectedMember
+    def prepare_sh_processing(
+        self, input_sh_config, mrf_limit_db, compensation_type, logger=None
+    ):
+        """
+        Calculate components which can be prepared before spherical harmonic processing in
         real-time. This contains calculating all spherical harmonics orders, coefficients and
         base functions. Also a modal radial filter according to the provided input array
         configuration, as well as further compensation filters will be generated and applied
@@ -1491,8 +2820,8 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
         # (re)calculate block buffers
         self._filter.calculate_filter_blocks_nm()
 
-        # backup raw block buffers
-        irs_blocks_nm_before = self._filter._irs_blocks_nm.copy()
+        # reference raw block buffers (compensations are not applied in place)
+        irs_blocks_nm_before = self._filter._irs_blocks_nm
 
         # generate specified compensations based on one block length
         comp_nm = Compensation.generate_by_type(
@@ -1558,6 +2887,8 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
         """
         if self._is_passthrough or input_block_td is None:
             return super().filter_block(input_block_td)
+        if self._filter_block_check_silence(input_block_td):
+            return self._get_silence_block_td(input_block_td)
 
         # transform into frequency domain and sh-coefficients
         
@@ -1568,6 +2899,7 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
         
 
         input_block_nm = self._sh_encode(data=self._filter_block_shift_and_convert_input(input_block_td))
+        StageTimer.mark(StageTimer.SPATIAL)
 
 
         #logger.info(f"dim of filter encoding: {np.shape(input_block_nm)} ")
@@ -1617,6 +2949,7 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
                 input_block_nm[mm,:,:] *=self._filter.get_filter_blocks_nm()[0][3,:,:]
             else:
                 input_block_nm[mm,:,:] *=self._filter.get_filter_blocks_nm()[0][mm,:,:]*0
+        StageTimer.mark(StageTimer.MAC)
 
        
         # get head-tracker position (neglect elevation)
@@ -1637,6 +2970,7 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
             input_block_nm[: sh_azim_nm.shape[0]] * sh_azim_nm, axis=0
             #input_block_nm, axis=0
         )
+        StageTimer.mark(StageTimer.ROTATION)
         # transform back into time domain
         output_in_block_td = self._filter_block_shift_and_convert_result(
             is_last_block=False
@@ -1644,7 +2978,7 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
 
         output_in_block_td = np.real(output_in_block_td)
         # skip further calculations in case no crossfade in time domain should be done
-        if not self._is_crossfade:
+        if not self._is_crossfade or self._is_low_cost:
             return output_in_block_td
 
         # calculation back into frequency domain into last buffer, after applying rotation
@@ -1654,6 +2988,7 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
             axis=0,
             #input_block_nm, axis=0
         )
+        StageTimer.mark(StageTimer.ROTATION)
         # transform back into time domain
        
         output_out_block_td = self._filter_block_shift_and_convert_result(
@@ -1664,9 +2999,11 @@ class AdjustableShConvolverMeasuredEnc(AdjustableShConvolver):
         self._last_sh_azim_nm = sh_azim_nm  # copy should not be necessary here
 
         # add in time domain after applying windows
-        return (output_in_block_td * self._window_in_td) + (
+        output_block_td = (output_in_block_td * self._window_in_td) + (
             output_out_block_td * self._window_out_td
         )
+        StageTimer.mark(StageTimer.CROSSFADE)
+        return output_block_td
 
     def set_crossfade(self, new_state=None):
         """
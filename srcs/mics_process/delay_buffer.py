@@ -103,6 +103,15 @@ class DelayBuffer(object):
         # return delay in ms
         return (self._delay_blocks * self._block_length / self._sample_rate) * 1000
 
+    def get_delay_blocks(self):
+        """
+        Returns
+        -------
+        int
+            current delay in blocks
+        """
+        return self._delay_blocks
+
     def process_block(self, input_td):
         """
         Parameters
@@ -0,0 +1,345 @@
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+
+from . import system_config
+
+
+class FilterCache(object):
+    """
+    Flexible interface to a content-addressed on-disk cache of fully preprocessed filter sets.
+    Loading, truncating, resampling and normalizing filters as well as transforming them into
+    frequency or spherical harmonics domain takes considerable time on every startup, whereas the
+    results only depend on the source file contents and the respective load parameters.
+
+    Every cache entry is identified by a hash over the source file contents and all parameters
+    influencing the preprocessing result. An entry is a directory in
+    `system_config.FILTER_CACHE_PATH` containing the individual arrays in `.npy` format, which are
+    memory-mapped when being read, and a small JSON dictionary of all further attributes (with
+    contained arrays stored alongside in `.npz` format). Memory maps are opened in copy-on-write
+    mode, so filter data may still be altered in place after being loaded without affecting the
+    stored entry.
+
+    Entries are written atomically, so an interrupted startup never leaves a corrupt entry
+    behind. The cache can be deleted at any time and will be rebuilt on the next startup.
+    """
+
+    _VERSION = 2
+    """Version of the stored data layout, which invalidates all existing entries when being
+    increased."""
+    _HASH_CHUNK_SIZE = 2**22
+    """Number of bytes being read at once when hashing source file contents."""
+    _META_NAME = "meta"
+    """Name of the files containing all further attributes of an entry."""
+    _META_ARRAY_KEY = "__array__"
+    """Key of JSON objects referencing an array stored alongside the attributes."""
+    _DIGESTS = {}
+    """Global dictionary of the content hashes of source files per path, size and modification
+    time, so every file is only read once."""
+
+    @staticmethod
+    def get_is_enabled():
+        """
+        Returns
+        -------
+        bool
+            if caching of preprocessed filter sets is enabled by the system configuration
+        """
+        return bool(getattr(system_config, "FILTER_CACHE_PATH", None))
+
+    @staticmethod
+    def get_key(file_name, *params, is_hash_contents=True):
+        """
+        Parameters
+        ----------
+        file_name : str or numpy.ndarray
+            file path/name of filter source file, directly provided filter coefficients are not
+            cached
+        params : Any
+            all further parameters influencing the preprocessing result, which need to provide a
+            deterministic `repr()`
+        is_hash_contents : bool, optional
+            if the source file contents should be hashed, otherwise only its path, size and
+            modification time identify the source (sufficient within a single process)
+
+        Returns
+        -------
+        str or None
+            identifier of the cache entry, `None` in case caching is not possible for the given
+            source
+        """
+        if not isinstance(file_name, str):
+            return None
+
+        try:
+            stat = os.stat(file_name)
+        except OSError:
+            return None
+        source = (os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns)
+        if is_hash_contents:
+            digest = FilterCache._DIGESTS.get(source)
+            if digest is None:
+                digest = hashlib.sha256()
+                try:
+                    with open(file_name, "rb") as file:
+                        for chunk in iter(lambda: file.read(FilterCache._HASH_CHUNK_SIZE), b""):
+                            digest.update(chunk)
+                except OSError:
+                    return None
+                digest = digest.hexdigest()
+                FilterCache._DIGESTS[source] = digest
+        else:
+            digest = repr(source)
+
+        key = hashlib.sha256()
+        key.update(repr((FilterCache._VERSION, params)).encode())
+        key.update(digest.encode())
+        return key.hexdigest()
+
+    @staticmethod
+    def get_data_key(data, *params):
+        """
+        Parameters
+        ----------
+        data : list of numpy.ndarray
+            all arrays influencing the preprocessing result (i.e., a spatial sampling grid), in
+            case the result does not depend on a source file
+        params : Any
+            all further parameters influencing the preprocessing result, see `get_key()`
+
+        Returns
+        -------
+        str
+            identifier of the cache entry
+        """
+        key = hashlib.sha256()
+        key.update(repr((FilterCache._VERSION, params)).encode())
+        for d in data:
+            d = np.ascontiguousarray(d)
+            key.update(repr((d.dtype.str, d.shape)).encode())
+            key.update(d.data)
+        return key.hexdigest()
+
+    @staticmethod
+    def get_array(key, name):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the cache entry, see `get_key()`
+        name : str
+            name of the array within the cache entry
+
+        Returns
+        -------
+        numpy.ndarray or None
+            memory-mapped array in copy-on-write mode, `None` in case it was not cached yet
+        """
+        if key is None or not FilterCache.get_is_enabled():
+            return None
+
+        try:
+            return np.load(FilterCache._get_path(key, f"{name}.npy"), mmap_mode="c")
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def put_array(key, name, data, logger=None):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the cache entry, see `get_key()`
+        name : str
+            name of the array within the cache entry
+        data : numpy.ndarray
+            array to be stored
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        if key is None or not FilterCache.get_is_enabled():
+            return
+
+        FilterCache._write(
+            key=key,
+            file_name=f"{name}.npy",
+            write_function=lambda file: np.save(file, data, allow_pickle=False),
+            logger=logger,
+        )
+
+    @staticmethod
+    def get_meta(key):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the cache entry, see `get_key()`
+
+        Returns
+        -------
+        dict or None
+            further attributes of the cache entry, `None` in case it was not cached yet
+        """
+        if key is None or not FilterCache.get_is_enabled():
+            return None
+
+        try:
+            path = FilterCache._get_path(key, FilterCache._META_NAME)
+            with open(f"{path}.json", "r") as file:
+                meta = json.load(file)
+            with np.load(f"{path}.npz", allow_pickle=False) as file:
+                arrays = {name: file[name] for name in file.files}
+            return FilterCache._decode_meta(meta, arrays)
+        except (OSError, ValueError, KeyError):
+            return None
+
+    @staticmethod
+    def put_meta(key, meta, logger=None):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the cache entry, see `get_key()`
+        meta : dict
+            further attributes of the cache entry, which may only consist of (nested) dictionaries
+            with string keys, lists, tuples, numbers, strings, `None` and arrays, tuples are
+            restored as lists
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        if key is None or not FilterCache.get_is_enabled():
+            return
+
+        arrays = {}
+        try:
+            meta_str = json.dumps(FilterCache._encode_meta(meta, arrays, "meta"))
+        except (TypeError, ValueError) as e:
+            log_str = f"failed to encode filter cache attributes ({e})."
+            logger.warning(log_str) if logger else print(
+                f"[WARNING]  {log_str}", file=sys.stderr
+            )
+            return
+
+        # attributes are written last, so they are only found once the arrays are complete
+        FilterCache._write(
+            key=key,
+            file_name=f"{FilterCache._META_NAME}.npz",
+            write_function=lambda file: np.savez(file, **arrays),
+            logger=logger,
+        )
+        FilterCache._write(
+            key=key,
+            file_name=f"{FilterCache._META_NAME}.json",
+            write_function=lambda file: file.write(meta_str.encode()),
+            logger=logger,
+        )
+
+    @staticmethod
+    def _encode_meta(value, arrays, path):
+        """
+        Parameters
+        ----------
+        value : Any
+            attribute value being encoded
+        arrays : dict
+            collection of all contained arrays, which is extended by the arrays of this value
+        path : str
+            unique name of the value within the attributes
+
+        Returns
+        -------
+        Any
+            JSON serializable representation of the value, arrays are replaced by references
+        """
+        if isinstance(value, np.ndarray):
+            arrays[path] = value
+            return {FilterCache._META_ARRAY_KEY: path}
+        if isinstance(value, np.generic):
+            return value.item()
+        if isinstance(value, dict):
+            return {
+                k: FilterCache._encode_meta(v, arrays, f"{path}.{k}") for k, v in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            return [
+                FilterCache._encode_meta(v, arrays, f"{path}.{i}") for i, v in enumerate(value)
+            ]
+        return value
+
+    @staticmethod
+    def _decode_meta(value, arrays):
+        """
+        Parameters
+        ----------
+        value : Any
+            JSON representation of the attribute value, see `_encode_meta()`
+        arrays : dict
+            all arrays stored alongside the attributes
+
+        Returns
+        -------
+        Any
+            attribute value with references replaced by the respective arrays
+        """
+        if isinstance(value, dict):
+            if list(value) == [FilterCache._META_ARRAY_KEY]:
+                return arrays[value[FilterCache._META_ARRAY_KEY]]
+            return {k: FilterCache._decode_meta(v, arrays) for k, v in value.items()}
+        if isinstance(value, list):
+            return [FilterCache._decode_meta(v, arrays) for v in value]
+        return value
+
+    @staticmethod
+    def _get_path(key, file_name=""):
+        """
+        Parameters
+        ----------
+        key : str
+            identifier of the cache entry
+        file_name : str, optional
+            name of the file within the cache entry
+
+        Returns
+        -------
+        str
+            path to the cache entry directory or respective file
+        """
+        return os.path.join(system_config.FILTER_CACHE_PATH, key, file_name)
+
+    @staticmethod
+    def _write(key, file_name, write_function, logger=None):
+        """
+        Write a file into the cache entry atomically, by writing to a temporary file first which
+        is renamed afterwards. Failures are only logged, since the cache is not essential for
+        rendering.
+
+        Parameters
+        ----------
+        key : str
+            identifier of the cache entry
+        file_name : str
+            name of the file within the cache entry
+        write_function : function
+            function writing the contents into the provided opened binary file
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        path = FilterCache._get_path(key, file_name)
+        path_tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(FilterCache._get_path(key), exist_ok=True)
+            with open(path_tmp, "wb") as file:
+                write_function(file)
+            os.replace(path_tmp, path)
+        except OSError as e:
+            log_str = f'failed to write filter cache "{os.path.relpath(path)}" ({e}).'
+            logger.warning(log_str) if logger else print(
+                f"[WARNING]  {log_str}", file=sys.stderr
+            )
+            try:
+                os.remove(path_tmp)
+            except OSError:
+                pass
@@ -0,0 +1,186 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from . import system_config, tools
+from .filter_registry import FilterRegistry
+from .filter_set import FilterSet, FilterSetMiro
+
+
+class FilterLoadPlanner(object):
+    """
+    Flexible structure to load all filter sets referenced by the rendering configuration
+    concurrently at startup, before the rendering clients are created. Identical filter sets
+    (same file, type and load parameters) are only loaded once.
+
+    Loaded, resampled and transformed filter data is provided to the rendering clients by the
+    `FilterRegistry` (and `FilterCache`), so their own `FilterSet.load()` calls with identical
+    parameters finish immediately. The planner keeps references to all loaded filter sets until
+    `release()` is called, which should happen after all rendering clients have been created.
+
+    Attributes
+    ----------
+    _block_length : int
+        system wide length of audio blocks in samples
+    _fs : int
+        system sampling frequency the filters are resampled to
+    _is_single_precision : bool
+        if filters should be loaded in single precision
+    _logger : logging.Logger or None
+        instance to provide identical logging behaviour as the parent process
+    _plans : dict
+        parameters of all unique filter sets to be loaded
+    _filter_sets : list of FilterSet
+        loaded filter sets being referenced until `release()` is called
+    """
+
+    def __init__(self, block_length, fs, is_single_precision, logger=None):
+        """
+        Parameters
+        ----------
+        block_length : int
+            system wide length of audio blocks in samples
+        fs : int
+            system sampling frequency the filters are resampled to
+        is_single_precision : bool
+            if filters should be loaded in single precision
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        self._block_length = block_length
+        self._fs = fs
+        self._is_single_precision = is_single_precision
+        self._logger = logger
+        self._plans = {}
+        self._filter_sets = []
+
+    def add(
+        self, file_name, file_type, sh_max_order=None, sh_is_enforce_pinv=False, ir_trunc_db=None
+    ):
+        """
+        Register a filter set to be loaded, with identical parameters as given to the according
+        `JackRenderer`. Filter sets which would not be loaded by the renderer are ignored.
+
+        Parameters
+        ----------
+        file_name : str or None
+            file path/name of filter source file
+        file_type : str, FilterSet.Type or None
+            type of filter source file
+        sh_max_order : int, optional
+            spherical harmonics order used for the spatial Fourier transform
+        sh_is_enforce_pinv : bool, optional
+            if pseudo-inverse (Moore-Penrose) matrix will be used over explicitly given sampling
+            grid weights to calculate the weighted SH basis functions
+        ir_trunc_db : float, optional
+            impulse response truncation level in dB relative under peak
+        """
+        if not isinstance(file_name, str):
+            return
+        _type = tools.transform_into_type(file_type, FilterSet.Type)
+
+        plan = (file_name, _type, sh_max_order, sh_is_enforce_pinv, ir_trunc_db)
+        self._plans[plan] = plan
+
+    def load_all(self, worker_count=None):
+        """
+        Load, resample and transform all registered filter sets concurrently by a thread pool.
+        Failures are only logged, since they will be raised again when the respective renderer
+        loads the filter set.
+
+        Parameters
+        ----------
+        worker_count : int, optional
+            number of threads loading filter sets in parallel, `None` to use one per unique
+            filter set
+        """
+        if not (FilterRegistry.get_is_enabled() or system_config.FILTER_CACHE_PATH):
+            self._log(
+                "concurrent filter loading skipped, since neither filter sharing nor caching is "
+                "enabled.",
+                is_warning=True,
+            )
+            return
+        if not self._plans:
+            return
+
+        start = perf_counter()
+        with ThreadPoolExecutor(max_workers=worker_count or len(self._plans)) as executor:
+            results = list(executor.map(self._load, self._plans.values()))
+        self._filter_sets.extend(f for f in results if f is not None)
+
+        self._log(
+            f"loaded {len(self._filter_sets)} of {len(self._plans)} unique filter sets "
+            f"concurrently in {perf_counter() - start:.2f} s."
+        )
+
+    def release(self):
+        """Release references to all loaded filter sets, after the rendering clients have
+        been created."""
+        self._filter_sets.clear()
+
+    def _load(self, plan):
+        """
+        Parameters
+        ----------
+        plan : tuple
+            parameters of the filter set to be loaded, see `add()`
+
+        Returns
+        -------
+        FilterSet or None
+            loaded filter set, `None` in case loading failed or was not applicable
+        """
+        file_name, file_type, sh_max_order, sh_is_enforce_pinv, ir_trunc_db = plan
+        start = perf_counter()
+        try:
+            filter_set = FilterSet.create_instance_by_type(
+                file_name=file_name,
+                file_type=file_type,
+                sh_max_order=sh_max_order,
+                sh_is_enforce_pinv=sh_is_enforce_pinv,
+            )
+            if filter_set is None:
+                return None
+
+            # plots are not generated, since `matplotlib` is not thread-safe, resampling is not
+            # parallelized further, since filter sets are loaded in parallel already
+            filter_set.load(
+                block_length=self._block_length,
+                is_single_precision=self._is_single_precision,
+                logger=self._logger,
+                ir_trunc_db=ir_trunc_db,
+                check_fs=self._fs,
+                is_prevent_logging=True,
+                resample_worker_count=1,
+            )
+            filter_set.calculate_filter_blocks_fd(self._block_length)
+            # noinspection PyProtectedMember
+            if (
+                isinstance(filter_set, FilterSetMiro)
+                and filter_set._is_hrir
+                and sh_max_order is not None
+            ):
+                filter_set.calculate_filter_blocks_nm()
+        except (ValueError, OSError, RuntimeError, NotImplementedError) as e:
+            self._log(f'preloading "{file_name}" failed ({e}).', is_warning=True)
+            return None
+
+        self._log(f'preloaded "{file_name}" in {perf_counter() - start:.2f} s.')
+        return filter_set
+
+    def _log(self, log_str, is_warning=False):
+        """
+        Parameters
+        ----------
+        log_str : str
+            message to be logged
+        is_warning : bool, optional
+            if message should be logged as warning
+        """
+        if is_warning:
+            self._logger.warning(log_str) if self._logger else print(
+                f"[WARNING]  {log_str}", file=sys.stderr
+            )
+        else:
+            self._logger.info(log_str) if self._logger else print(log_str)
@@ -0,0 +1,212 @@
+import weakref
+
+from . import system_config
+from .filter_cache import FilterCache
+
+
+class FilterRegistry(object):
+    """
+    Flexible abstract structure providing an in-memory registry of preprocessed filter data on
+    top of the on-disk `FilterCache`. Several `FilterSet` instances loading an identical source
+    file with identical load parameters (i.e., the same HRIR or ARIR for multiple microphone
+    chains) reference the same physical copy of the filter arrays, instead of each holding an
+    individual copy.
+
+    Registered arrays are provided as read-only views, since they are shared between all
+    consumers. Operations altering filter data (i.e., applying compensations) therefore need to
+    create new arrays. All rendering clients are forked from the process loading the filters, so
+    they also share the physical memory of the registered arrays (as long as it is not written
+    to). Arrays restored from the on-disk cache are additionally backed by the shared page cache
+    of the memory-mapped files.
+
+    Arrays are referenced weakly, so they are released as soon as no filter set uses them anymore.
+    """
+
+    _ARRAYS = weakref.WeakValueDictionary()
+    """Global dictionary of registered read-only filter arrays."""
+    _METAS = {}
+    """Global dictionary of registered further attributes of the filter sets, which are released
+    together with the last registered array of the same filter data."""
+
+    @staticmethod
+    def get_is_enabled():
+        """
+        Returns
+        -------
+        bool
+            if sharing of identical filter data is enabled by the system configuration
+        """
+        return bool(getattr(system_config, "IS_SHARED_FILTERS", False))
+
+    @staticmethod
+    def get_key(file_name, *params):
+        """
+        Parameters
+        ----------
+        file_name : str or numpy.ndarray
+            file path/name of filter source file, directly provided filter coefficients are not
+            registered
+        params : Any
+            all further parameters influencing the preprocessing result, see
+            `FilterCache.get_key()`
+
+        Returns
+        -------
+        str or None
+            identifier of the filter data, `None` in case neither sharing nor caching is enabled
+            or possible for the given source
+        """
+        if not (FilterRegistry.get_is_enabled() or FilterCache.get_is_enabled()):
+            return None
+        # identifying the source file by its contents is only necessary across processes
+        return FilterCache.get_key(
+            file_name, *params, is_hash_contents=FilterCache.get_is_enabled()
+        )
+
+    @staticmethod
+    def get_array(key, name):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the filter data, see `get_key()`
+        name : str
+            name of the array
+
+        Returns
+        -------
+        numpy.ndarray or None
+            registered or cached array (read-only in case sharing is enabled), `None` in case it
+            is neither registered nor cached yet
+        """
+        if key is None:
+            return None
+
+        data = FilterRegistry._ARRAYS.get((key, name))
+        if data is None:
+            data = FilterCache.get_array(key, name)
+            if data is not None:
+                data = FilterRegistry._register(key, name, data)
+        return data
+
+    @staticmethod
+    def put_array(key, name, data, logger=None):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the filter data, see `get_key()`
+        name : str
+            name of the array
+        data : numpy.ndarray
+            array to be registered and cached, which must not be altered afterwards
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+
+        Returns
+        -------
+        numpy.ndarray
+            array to be referenced instead of the provided one (read-only in case sharing is
+            enabled)
+        """
+        if key is None:
+            return data
+
+        FilterCache.put_array(key, name, data, logger=logger)
+        return FilterRegistry._register(key, name, data)
+
+    @staticmethod
+    def get_meta(key):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the filter data, see `get_key()`
+
+        Returns
+        -------
+        dict or None
+            registered or cached further attributes of the filter set, `None` in case they are
+            neither registered nor cached yet
+        """
+        if key is None:
+            return None
+
+        meta = FilterRegistry._METAS.get(key)
+        if meta is None:
+            meta = FilterCache.get_meta(key)
+            if meta is not None:
+                FilterRegistry._register_meta(key, meta)
+        return meta
+
+    @staticmethod
+    def put_meta(key, meta, logger=None):
+        """
+        Parameters
+        ----------
+        key : str or None
+            identifier of the filter data, see `get_key()`
+        meta : dict
+            further attributes of the filter set, which need to be picklable
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        if key is None:
+            return
+
+        FilterCache.put_meta(key, meta, logger=logger)
+        FilterRegistry._register_meta(key, meta)
+
+    @staticmethod
+    def clear():
+        """Release all references to registered filter data, arrays still in use by filter sets
+        remain valid."""
+        FilterRegistry._ARRAYS.clear()
+        FilterRegistry._METAS.clear()
+
+    @staticmethod
+    def _register_meta(key, meta):
+        """
+        Register further attributes of the filter sets and release all attributes of filter data
+        without any registered arrays anymore, so the registry does not grow unbounded.
+
+        Parameters
+        ----------
+        key : str
+            identifier of the filter data
+        meta : dict
+            further attributes of the filter set
+        """
+        if not FilterRegistry.get_is_enabled():
+            return
+
+        keys = {k for k, _ in FilterRegistry._ARRAYS.keys()}
+        for k in [k for k in FilterRegistry._METAS if k not in keys]:
+            del FilterRegistry._METAS[k]
+        FilterRegistry._METAS[key] = meta
+
+    @staticmethod
+    def _register(key, name, data):
+        """
+        Parameters
+        ----------
+        key : str
+            identifier of the filter data
+        name : str
+            name of the array
+        data : numpy.ndarray
+            array to be registered
+
+        Returns
+        -------
+        numpy.ndarray
+            read-only view of the registered array, or the provided array in case sharing is
+            disabled
+        """
+        if not FilterRegistry.get_is_enabled():
+            return data
+
+        data = data.view()
+        data.flags.writeable = False
+        FilterRegistry._ARRAYS[(key, name)] = data
+        return data
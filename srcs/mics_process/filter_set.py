@@ -6,9 +6,15 @@ import samplerate
 import soundfile
 import sound_field_analysis as sfa
 import pysofaconventions as sofa
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
 from . import DataRetriever, tools
-from scipy import special as scy
+from .filter_cache import FilterCache
+from .filter_registry import FilterRegistry
+from scipy import fft as sfft, io as sio, signal, special as scy
+from scipy.spatial import ConvexHull, QhullError, cKDTree
+from . import system_config
 
 class FilterSet(object):
     """
@@ -50,6 +56,10 @@ class FilterSet(object):
     _irs_orig_shape : tuple of int
         filter impulse response original shape, considering already performed transposes or
         adjustments alike and potentially resampling
+    _irs_delays : numpy.ndarray or None
+        onset delays in samples removed from the filters by the minimum phase decomposition of
+        size [number of hrir positions; number of output channels], `None` in case filters were not
+        decomposed (see `system_config.IS_HRIR_MINIMUM_PHASE`)
     """
 
     class Type(Enum):
@@ -147,6 +157,12 @@ class FilterSet(object):
 
     _ERROR_MSG_FD = "blocks in frequency domain have not been calculated yet."
     _ERROR_MSG_NM = "blocks in spherical harmonics domain have not been calculated yet."
+    _ONSET_LEVEL_DB = -20
+    """Level in dB relative under the individual peak, at which the onset of an impulse response
+    is detected for the minimum phase decomposition."""
+    _SPECTRUM_FLOOR_DB = -150
+    """Level in dB relative under the individual spectral peak, which magnitude spectra are
+    limited to before calculating the real cepstrum for the minimum phase decomposition."""
 
     @staticmethod
     def create_instance_by_type(
@@ -244,6 +260,9 @@ class FilterSet(object):
         self._dirac_td = None
         self._dirac_blocks_fd = None
         self._irs_orig_shape = None
+        self._irs_delays = None
+        self._cache_key = None
+        self._source = None
 
     def __str__(self):
         try:
@@ -255,7 +274,8 @@ class FilterSet(object):
             grid = ""
         return (
             f"[ID={id(self)}, _file_name={os.path.relpath(self._file_name)}, {grid}_fs={self._fs}, "
-            f"_irs_td=shape{self._irs_td.shape}, _irs_blocks_fd=shape{self._irs_blocks_fd.shape}]"
+            f"_irs_td=shape{self._irs_td.shape}, "
+            f"_irs_blocks_fd=shape{np.shape(self._irs_blocks_fd)}]"
         )
 
     def load(
@@ -269,6 +289,7 @@ class FilterSet(object):
         is_prevent_logging=False,
         is_normalize=False,
         is_normalize_individually=False,
+        resample_worker_count=None,
     ):
         """
         Loading the file contents of the provided FIR filter according to its specification. The
@@ -299,15 +320,45 @@ class FilterSet(object):
             if each channel of the loaded filter impulse response should be normalized regarding
             its individual peak (except for second to last dimension, resembling binaural pairs of
             left and right ear)
+        resample_worker_count : int, optional
+            number of threads resampling the filter in parallel, `None` to use
+            `system_config.RESAMPLING_WORKER_COUNT`
         """
         # gather data, in case local file does not exist and online reference is given
         self._file_name = DataRetriever.retrieve(path=self._file_name, logger=logger)
 
+        # skip entire preprocessing in case the identical result was loaded or cached before
+        self._cache_key = FilterRegistry.get_key(
+            self._file_name,
+            type(self).__name__,
+            self._is_hrir,
+            self._is_hpcf,
+            block_length,
+            is_single_precision,
+            ir_trunc_db,
+            check_fs,
+            is_prevent_resampling,
+            is_normalize,
+            is_normalize_individually,
+            system_config.IS_HRIR_MINIMUM_PHASE,
+            system_config.HRIR_TRUNCATION_ENERGY_DB,
+            self._get_is_rendered_by_direction(),
+            system_config.RESAMPLING_TYPE,
+        )
+        if self._load_from_cache(logger=logger, is_prevent_logging=is_prevent_logging):
+            if not is_prevent_logging:
+                self._plot(block_length=block_length, logger=logger)
+            return
+
         if not is_prevent_logging:
             self._log_load(logger=logger)
 
         # type specific loading
-        self._load(dtype=np.float32 if is_single_precision else np.float64)
+        try:
+            self._load(dtype=np.float32 if is_single_precision else np.float64)
+        finally:
+            # release parsed source file contents
+            self._close_source()
         # delete attributes if not needed
         if not self._is_hrir:
             del self._points_azim_deg
@@ -327,40 +378,138 @@ class FilterSet(object):
                 logger=logger,
                 target_fs=check_fs,
                 is_prevent_resampling=is_prevent_resampling,
+                worker_count=resample_worker_count,
             )
 
         # normalize if requested
         if is_normalize_individually or is_normalize:
             self._normalize(logger=logger, is_individually=is_normalize_individually)
 
+        # decompose into minimum phase and onset delays if requested
+        if system_config.IS_HRIR_MINIMUM_PHASE and self._is_hrir:
+            self._transform_minimum_phase(logger=logger)
+
         # store original filter length
         self._irs_orig_shape = self._irs_td.shape
         # zero-padding if necessary
         self._zero_pad(block_length=block_length)
 
         if not is_prevent_logging:
-            # plot filters TD and FD
-            if self._is_hrir or self._is_hpcf or type(self) == FilterSetSsr:
-                data = self._irs_td[0]
-            else:
-                data = self._irs_td[:, :8]
-
-            tools.export_plot(
-                figure=tools.plot_ir_and_tf(
-                    data_td_or_fd=data,
-                    fs=self._fs,
-                    set_fd_db_y=30,
-                    set_td_db_y=120,
-                    is_etc=True,
-                    step_db_y=10,
-                ),
-                name=self._generate_plot_name(block_length=block_length, logger=logger),
-                logger=logger,
+            self._plot(block_length=block_length, logger=logger)
+
+        # generate dirac impulse
+        self._dirac_td = np.zeros(self._irs_td.shape[-2:], dtype=self._irs_td.dtype)
+        self._dirac_td[:, 0] = 1.0
+
+        # share and store preprocessing result
+        self._irs_td = FilterRegistry.put_array(
+            self._cache_key, "irs_td", self._irs_td, logger=logger
+        )
+        FilterRegistry.put_meta(self._cache_key, self._get_cache_meta(), logger=logger)
+
+    def _plot(self, block_length, logger=None):
+        """
+        Plot filters in time and frequency domain, independent of whether they were preprocessed
+        or restored from cache.
+
+        Parameters
+        ----------
+        block_length : int or None
+            system specific size of every audio block
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        """
+        if self._is_hrir or self._is_hpcf or type(self) == FilterSetSsr:
+            data = self._irs_td[0]
+        else:
+            data = self._irs_td[:, :8]
+
+        tools.export_plot(
+            figure=tools.plot_ir_and_tf(
+                data_td_or_fd=data,
+                fs=self._fs,
+                set_fd_db_y=30,
+                set_td_db_y=120,
+                is_etc=True,
+                step_db_y=10,
+            ),
+            name=self._generate_plot_name(block_length=block_length, logger=logger),
+            logger=logger,
+        )
+
+    def _load_from_cache(self, logger=None, is_prevent_logging=False):
+        """
+        Restore all attributes of a beforehand registered or cached preprocessing result with
+        identical source file and load parameters, see `FilterRegistry` and `FilterCache`. The
+        filter coefficients are shared with other filter sets or memory-mapped.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the parent process
+        is_prevent_logging : bool, optional
+            prevent logging messages during load process
+
+        Returns
+        -------
+        bool
+            if the preprocessing result was restored from cache
+        """
+        meta = FilterRegistry.get_meta(self._cache_key)
+        if meta is None:
+            return False
+        irs_td = FilterRegistry.get_array(self._cache_key, "irs_td")
+        if irs_td is None:
+            return False
+
+        self._irs_td = irs_td
+        self._set_cache_meta(meta)
+        if not self._is_hrir:
+            del self._points_azim_deg
+            del self._points_elev_deg
+
+        if not is_prevent_logging:
+            log_str = (
+                f'reusing preprocessed file "{os.path.relpath(self._file_name)}" '
+                f"[{self._cache_key[:12]}]\n --> samplerate: {self._fs} Hz, "
+                f"shape: {self._irs_td.shape}, format: {self._irs_td.dtype}"
             )
+            logger.info(log_str) if logger else print(log_str)
 
         # generate dirac impulse
         self._dirac_td = np.zeros(self._irs_td.shape[-2:], dtype=self._irs_td.dtype)
         self._dirac_td[:, 0] = 1.0
+        return True
+
+    def _get_cache_meta(self):
+        """
+        Returns
+        -------
+        dict
+            all attributes of the preprocessing result besides the filter coefficients, which are
+            necessary to restore the filter set from cache
+        """
+        return {
+            "fs": self._fs,
+            "irs_orig_shape": self._irs_orig_shape,
+            "irs_delays": self._irs_delays,
+            "points_azim_deg": getattr(self, "_points_azim_deg", None),
+            "points_elev_deg": getattr(self, "_points_elev_deg", None),
+        }
+
+    def _set_cache_meta(self, meta):
+        """
+        Parameters
+        ----------
+        meta : dict
+            all attributes of the preprocessing result besides the filter coefficients, see
+            `_get_cache_meta()`
+        """
+        self._fs = meta["fs"]
+        self._irs_orig_shape = tuple(meta["irs_orig_shape"])
+        self._irs_delays = meta["irs_delays"]
+        self._points_azim_deg = meta["points_azim_deg"]
+        self._points_elev_deg = meta["points_elev_deg"]
 
     def _generate_plot_name(self, block_length, logger=None):
         """
@@ -427,6 +576,34 @@ class FilterSet(object):
 
         logger.info(log_str) if logger else print(log_str)
 
+    def _get_source(self):
+        """
+        Returns
+        -------
+        Any
+            parsed contents of the source file, which are read only once and shared between
+            `_log_load()` and `_load()` until `_close_source()` is called
+        """
+        if self._source is None:
+            self._source = self._read_source()
+        return self._source
+
+    def _read_source(self):
+        """
+        Individual implementation of parsing the source file, in case the contents are required
+        by `_log_load()` as well as `_load()`.
+
+        Returns
+        -------
+        Any
+            parsed contents of the source file, `None` in case not implemented
+        """
+        return None
+
+    def _close_source(self):
+        """Release the parsed contents of the source file, see `_get_source()`."""
+        self._source = None
+
     def _load(self, dtype):
         """
         Individual implementation of loading the FIR filter according to its specifications.
@@ -506,10 +683,15 @@ class FilterSet(object):
         self._irs_td = data_td[:, :, :len_max].copy()
         # tools.plot_ir_and_tf(self._irs_td[0, 0], self._fs, is_etc=True, is_show_blocked=False)
 
-    def _resample(self, logger, target_fs, is_prevent_resampling=False):
+    def _resample(self, logger, target_fs, is_prevent_resampling=False, worker_count=None):
         """
-        Resample loaded filter to the given target sampling rate, utilizing the API of package
-        `samplerate` to the C-library `libsamplerate`.
+        Resample loaded filter to the given target sampling rate, utilizing either the API of
+        package `samplerate` to the C-library `libsamplerate` or a polyphase filter of package
+        `scipy` for rational ratios, see `system_config.RESAMPLING_TYPE`.
+
+        The filter positions are split into chunks, which are resampled in parallel by a thread
+        pool (both libraries release the GIL during processing) and written into a preallocated
+        output. All channels of a chunk are resampled by a single library call.
 
         Parameters
         ----------
@@ -519,14 +701,36 @@ class FilterSet(object):
             target (system) sampling frequency
         is_prevent_resampling : bool, optional
             if loaded filter impulse response should not be resampled
+        worker_count : int, optional
+            number of threads resampling chunks of filter positions in parallel, `None` to use
+            `system_config.RESAMPLING_WORKER_COUNT`
 
         Raises
         ------
         ValueError
             in case resampling was prevented but would be necessary
+        ValueError
+            in case an unknown `system_config.RESAMPLING_TYPE` is configured
         """
+        _RESAMPLE_CONVERTER_TYPES = {"SINC_BEST": "sinc_best", "POLYPHASE": None}
+        """Resampling converter type of `samplerate` library per `system_config.RESAMPLING_TYPE`,
+        `None` for a polyphase filter."""
         _RESAMPLE_CONVERTER_TYPE = "sinc_best"
-        """Resampling converter type, see `samplerate` library."""
+        """Resampling converter type of `samplerate` library, in case polyphase resampling is not
+        feasible."""
+        _POLYPHASE_MAX_FACTOR = 1000
+        """Maximum up- or downsampling factor of the reduced ratio to resample by a polyphase
+        filter, since the filter length grows with the factors."""
+        _CHUNKS_PER_WORKER = 4
+        """Number of chunks of filter positions per worker, to balance the processing load."""
+
+        resampling_type = str(system_config.RESAMPLING_TYPE).upper()
+        if resampling_type not in _RESAMPLE_CONVERTER_TYPES:
+            raise ValueError(
+                f'unknown resampling type "{system_config.RESAMPLING_TYPE}", use one of '
+                f'{", ".join(f"{t!r}" for t in _RESAMPLE_CONVERTER_TYPES)}.'
+            )
+        converter_type = _RESAMPLE_CONVERTER_TYPES[resampling_type]
 
         if self._fs == target_fs:
             return
@@ -541,31 +745,75 @@ class FilterSet(object):
             f"[WARNING]  {log_str}", file=sys.stderr
         )
 
+        if self._irs_td.ndim != 3:
+            raise NotImplementedError(
+                f"resampling for {self._irs_td.ndim} ndarray dimensions not implemented yet."
+            )
+
         # initialize target variables
         ratio_fs = target_fs / self._fs
-
-        if self._irs_td.ndim == 3:
-            # iteration over first dimension, since `samplerate.resample()` only takes
-            # 2-dimensional inputs
-            irs_td_new = np.stack(
-                [
-                    samplerate.resample(irs_td.T, ratio_fs, _RESAMPLE_CONVERTER_TYPE)
-                    for irs_td in self._irs_td
-                ]
+        ratio = Fraction(int(target_fs), int(self._fs))
+        is_polyphase = converter_type is None
+        if is_polyphase and max(ratio.numerator, ratio.denominator) > _POLYPHASE_MAX_FACTOR:
+            is_polyphase = False
+            converter_type = _RESAMPLE_CONVERTER_TYPE
+            log_str = (
+                f"polyphase resampling by {ratio.numerator}/{ratio.denominator} not feasible, "
+                f'using "{_RESAMPLE_CONVERTER_TYPE}" instead.'
             )
-            # restore former dimension order
-            irs_td_new = np.swapaxes(irs_td_new, 1, 2).copy()  # copy to ensure C-order
-        else:
-            raise NotImplementedError(
-                f"resampling for {self._irs_td.ndim} ndarray dimensions not implemented yet."
+            logger.warning(log_str) if logger else print(
+                f"[WARNING]  {log_str}", file=sys.stderr
             )
 
-        # import matplotlib.pyplot as plt
-        #
-        # tools.plot_ir_and_tf(self._irs_td[0], self._fs)
-        # plt.show(block=False)
-        # tools.plot_ir_and_tf(irs_td_new[0], target_fs)
-        # plt.show(block=False)
+        def _resample_chunk(irs_td):
+            """
+            Parameters
+            ----------
+            irs_td : numpy.ndarray
+                filter impulse responses of size [number of positions; number of output channels;
+                number of samples]
+
+            Returns
+            -------
+            numpy.ndarray
+                resampled filter impulse responses of size [number of positions; number of output
+                channels; number of resampled samples]
+            """
+            if is_polyphase:
+                return signal.resample_poly(
+                    irs_td, ratio.numerator, ratio.denominator, axis=-1
+                )
+
+            # `samplerate.resample()` only takes 2-dimensional inputs, hence all channels of all
+            # positions are processed at once in order of [number of samples; number of channels]
+            data_td = np.ascontiguousarray(irs_td.reshape(-1, irs_td.shape[-1]).T)
+            data_td = samplerate.resample(data_td, ratio_fs, converter_type)
+            return data_td.T.reshape(*irs_td.shape[:-1], -1)
+
+        worker_count = (
+            worker_count or system_config.RESAMPLING_WORKER_COUNT or os.cpu_count() or 1
+        )
+        chunks = [
+            chunk
+            for chunk in np.array_split(
+                np.arange(self._irs_td.shape[0]), worker_count * _CHUNKS_PER_WORKER
+            )
+            if chunk.shape[0]
+        ]
+        chunks = [slice(chunk[0], chunk[-1] + 1) for chunk in chunks]
+
+        irs_td_new = None
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            results = executor.map(
+                _resample_chunk, [self._irs_td[chunk] for chunk in chunks]
+            )
+            for chunk, result in zip(chunks, results):
+                if irs_td_new is None:
+                    # allocate according to resulting length (implementation specific)
+                    irs_td_new = np.empty(
+                        self._irs_td.shape[:-1] + result.shape[-1:], dtype=self._irs_td.dtype
+                    )
+                irs_td_new[chunk] = result
 
         # update attributes
         self._irs_td = irs_td_new
@@ -603,6 +851,94 @@ class FilterSet(object):
 
         self._irs_td *= target_amp / irs_peak
 
+    def _transform_minimum_phase(self, logger):
+        """
+        Decompose loaded HRIRs into minimum phase filters and onset delays per direction and ear.
+        Afterwards the filters are truncated to the length containing all but
+        `system_config.HRIR_TRUNCATION_ENERGY_DB` of the energy of every individual filter. This
+        reduces the number of partitions being convolved during rendering.
+
+        The onsets are detected at `_ONSET_LEVEL_DB` under the individual peak with linear
+        interpolation between samples. The minimum phase filters are derived from the folded real
+        cepstrum. The onset delays are stored relative to the earliest onset of the entire set in
+        `_irs_delays`, so the common delay of all directions is removed from rendering.
+
+        In case the filters are not rendered per direction (see `_get_is_rendered_by_direction()`),
+        the delays could not be reapplied. Then only the common onset delay is removed from the
+        otherwise unaltered filters before truncation.
+
+        Parameters
+        ----------
+        logger : logging.Logger
+            instance to provide identical logging behaviour as the parent process
+        """
+        irs_td = self._irs_td
+        length = irs_td.shape[-1]
+
+        # detect onsets at first crossing of threshold with linear interpolation between samples
+        irs_abs = np.abs(irs_td)
+        thresholds = irs_abs.max(axis=-1) * 10 ** (FilterSet._ONSET_LEVEL_DB / 20)
+        onset_ids = np.argmax(irs_abs >= thresholds[..., np.newaxis], axis=-1)
+        after = np.take_along_axis(irs_abs, onset_ids[..., np.newaxis], axis=-1)[..., 0]
+        before = np.take_along_axis(
+            irs_abs, np.maximum(onset_ids - 1, 0)[..., np.newaxis], axis=-1
+        )[..., 0]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fractions = np.where(
+                onset_ids > 0, (thresholds - before) / (after - before), 1.0
+            )
+        onsets = np.maximum(onset_ids - 1 + np.nan_to_num(fractions, nan=1.0), 0)
+        del irs_abs
+
+        if self._get_is_rendered_by_direction():
+            nfft = 2 ** int(np.ceil(np.log2(8 * length)))  # limit cepstral aliasing
+            spectrum_abs = np.abs(sfft.rfft(irs_td, nfft, axis=-1, workers=-1))
+            spectrum_abs = np.maximum(
+                spectrum_abs,
+                spectrum_abs.max(axis=-1, keepdims=True)
+                * 10 ** (FilterSet._SPECTRUM_FLOOR_DB / 20),
+            )
+            cepstrum = sfft.irfft(np.log(spectrum_abs), nfft, axis=-1, workers=-1)
+            del spectrum_abs
+            # fold anti-causal part of the real cepstrum onto the causal part
+            cepstrum[..., 1 : nfft // 2] *= 2
+            cepstrum[..., nfft // 2 + 1 :] = 0
+            irs_td = sfft.irfft(
+                np.exp(sfft.rfft(cepstrum, axis=-1, workers=-1)), nfft, axis=-1, workers=-1
+            )[..., :length].astype(self._irs_td.dtype)
+            del cepstrum
+            self._irs_delays = onsets - onsets.min()
+        else:
+            irs_td = irs_td[..., int(onsets.min()) :]
+
+        # truncate to energy criterion (of every individual filter)
+        energy = np.cumsum(np.square(irs_td, dtype=np.float64), axis=-1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            energy_residual = 1 - energy / energy[..., -1:]
+        energy_limit = 10 ** (system_config.HRIR_TRUNCATION_ENERGY_DB / 10)
+        length_new = np.argmax(np.nan_to_num(energy_residual) <= energy_limit, axis=-1).max() + 1
+        del energy, energy_residual
+        self._irs_td = np.ascontiguousarray(irs_td[..., :length_new])
+
+        log_str = (
+            f'decomposed into {"minimum phase and " if self._irs_delays is not None else ""}'
+            f'onset delays "{os.path.relpath(self._file_name)}"\n --> length: {length} to '
+            f"{length_new} samples, common onset: {onsets.min():.1f} samples"
+        )
+        if self._irs_delays is not None:
+            log_str = f"{log_str}, max. delay: {self._irs_delays.max():.1f} samples"
+        logger.info(log_str) if logger else print(log_str)
+
+    def _get_is_rendered_by_direction(self):
+        """
+        Returns
+        -------
+        bool
+            if filters are rendered by selecting individual directions, so onset delays per
+            direction and ear can be reapplied after the minimum phase decomposition
+        """
+        return True
+
     def _zero_pad(self, block_length):
         """
         Append zeros in time domain to `_irs_td` to full blocks and if filter length is smaller
@@ -624,10 +960,11 @@ class FilterSet(object):
 
         # create padded array with otherwise identical dimensions
         irs_td_padded = np.zeros(
-            (self._irs_td.shape[0], self._irs_td.shape[1], block_length * block_count)
+            (self._irs_td.shape[0], self._irs_td.shape[1], block_length * block_count),
+            dtype=self._irs_td.dtype,
         )
         irs_td_padded[:, :, : self._irs_td.shape[2]] = self._irs_td
-        self._irs_td = irs_td_padded.astype(self._irs_td.dtype)  # `astype()` makes copy
+        self._irs_td = irs_td_padded
 
     def calculate_filter_blocks_fd(self, block_length):
         """
@@ -649,27 +986,60 @@ class FilterSet(object):
             block_length = self._irs_td.shape[-1]
 
         # for filter
-        block_count = self._irs_td.shape[-1] // block_length
-        block_length_2 = block_length * 2
-        # cut signal into slices and stack on new axis after transformation in frequency domain
-        self._irs_blocks_fd = np.stack(
-            [
-                np.fft.fft(block_td, block_length_2)
-                for block_td in np.dsplit(self._irs_td, block_count)
-            ]
-        )
-        # rfft not replaced by `pyfftw` since it is not executed in real-time
+        cache_name = f"irs_blocks_fd_{block_length}"
+        self._irs_blocks_fd = FilterRegistry.get_array(self._cache_key, cache_name)
+        if self._irs_blocks_fd is None:
+            block_count = self._irs_td.shape[-1] // block_length
+            # cut signal into slices on a new first axis (without copying) and transform all
+            # blocks at once, `scipy.fft` preserves single precision unlike `numpy.fft`
+            blocks_td = self._irs_td.reshape(
+                *self._irs_td.shape[:-1], block_count, block_length
+            ).transpose(2, 0, 1, 3)
+            self._irs_blocks_fd = np.ascontiguousarray(
+                sfft.fft(blocks_td, 2 * block_length, axis=-1, workers=-1)
+            )
+            # not replaced by `pyfftw` since it is not executed in real-time
 
-        # numpy `rfft()` will always yield double precision!!
-        if self._irs_td.dtype == np.float32:
-            self._irs_blocks_fd = self._irs_blocks_fd.astype(
-                np.complex64
-            )  # `astype()` makes copy
+            self._irs_blocks_fd = FilterRegistry.put_array(
+                self._cache_key, cache_name, self._irs_blocks_fd
+            )
 
         # for dirac impulse, limited to be rotation independent
-        self._dirac_blocks_fd = np.zeros_like(self._irs_blocks_fd)[:, :1]
+        self._dirac_blocks_fd = np.zeros(
+            (self._irs_blocks_fd.shape[0], 1, *self._irs_blocks_fd.shape[2:]),
+            dtype=self._irs_blocks_fd.dtype,
+        )
         self._dirac_blocks_fd[0] = 1.0
 
+    def release_unused(self, is_keep_blocks_fd=True):
+        """
+        Release representations of the filter data, which are not read anymore by the
+        `Convolver` after all preparations are done (see `system_config.IS_LEAN_FILTERS`). Time
+        domain impulse responses are replaced by a view of zeros and dirac impulses by
+        broadcasted views, which preserve size and data type without occupying memory. The
+        replacements are read-only.
+
+        Parameters
+        ----------
+        is_keep_blocks_fd : bool, optional
+            if block-wise frequency domain spectra are still read by the `Convolver`
+        """
+        self._irs_td = np.broadcast_to(np.zeros(1, dtype=self._irs_td.dtype), self._irs_td.shape)
+
+        dirac_td = np.zeros(self._dirac_td.shape[-1], dtype=self._dirac_td.dtype)
+        dirac_td[0] = 1.0
+        self._dirac_td = np.broadcast_to(dirac_td, self._dirac_td.shape)
+
+        if self._dirac_blocks_fd is not None:
+            dirac_blocks_fd = np.zeros(
+                (self._dirac_blocks_fd.shape[0], 1, 1, 1), dtype=self._dirac_blocks_fd.dtype
+            )
+            dirac_blocks_fd[0] = 1.0
+            self._dirac_blocks_fd = np.broadcast_to(dirac_blocks_fd, self._dirac_blocks_fd.shape)
+
+        if not is_keep_blocks_fd:
+            self._irs_blocks_fd = None
+
     def get_dirac_td(self):
         """
         Returns
@@ -742,6 +1112,37 @@ class FilterSet(object):
         # print(f'azim {azim_deg:>-4.0f}, elev {elev_deg:>-4.0f} -> index {index:>4.0f}')
         return self._irs_blocks_fd[:, index]
 
+    def get_filter_delays(self, azim_deg=0.0, elev_deg=0.0):
+        """
+        Parameters
+        ----------
+        azim_deg : int or float, optional
+            azimuth of desired sound incidence direction in degrees (only relevant for HRIR)
+        elev_deg: int or float, optional
+            elevation of desired sound incidence direction in degrees (only relevant for HRIR)
+
+        Returns
+        -------
+        numpy.ndarray or None
+            onset delays in samples to be applied to the filters of `get_filter_blocks_fd()` of
+            size [number of output channels], `None` in case filters were not decomposed into
+            minimum phase (see `system_config.IS_HRIR_MINIMUM_PHASE`)
+        """
+        if self._irs_delays is None:
+            return None
+        return self._irs_delays[self._get_index_from_rotation(azim_deg, elev_deg)]
+
+    def get_filter_delays_max(self):
+        """
+        Returns
+        -------
+        float
+            maximum onset delay in samples of all filters, see `get_filter_delays()`
+        """
+        if self._irs_delays is None:
+            return 0.0
+        return float(self._irs_delays.max())
+
     def _get_index_from_rotation(self, azim_deg, elev_deg):
         """
         Parameters
@@ -871,15 +1272,26 @@ class FilterSetSsr(FilterSet):
         TypeError
             in case unknown type for filter name is given
         """
+        _READ_BLOCK_LENGTH = 2**14
+        """Number of frames being read and deinterleaved at once."""
+
         if not isinstance(self._file_name, str):
             raise TypeError(f'unknown parameter type "{type(self._file_name)}".')
 
-        irs_td, self._fs = soundfile.read(self._file_name, dtype=dtype)
-        irs_td_l = irs_td[:, 0:-1:2].T  # all even elements
-        irs_td_r = irs_td[:, 1::2].T  # all uneven elements
-        self._irs_td = np.swapaxes(
-            np.stack((irs_td_l, irs_td_r)), 0, 1
-        )  # proper memory alignment will be done later
+        with soundfile.SoundFile(self._file_name) as file:
+            self._fs = file.samplerate
+            self._irs_td = np.empty((file.channels // 2, 2, file.frames), dtype=dtype)
+
+            # deinterleave block-wise into preallocated output, so the entire file is never held
+            # in memory additionally (even channels for left, uneven channels for right ear)
+            frame = 0
+            for block in file.blocks(
+                blocksize=_READ_BLOCK_LENGTH, dtype=dtype, always_2d=True
+            ):
+                self._irs_td[:, :, frame : frame + block.shape[0]] = block.reshape(
+                    block.shape[0], -1, 2
+                ).transpose(1, 2, 0)
+                frame += block.shape[0]
 
         self._points_azim_deg = np.linspace(
             0, 360, self._irs_td.shape[0], endpoint=False, dtype=np.int16
@@ -928,10 +1340,54 @@ class FilterSetMiro(FilterSet):
         block-wise complex spherical harmonics coefficients of size [number of blocks; number
         according to `sh_order`; number of output channels; block length (+1 depending on even or
         uneven length)]
+    _irs_blocks_nm_raw : numpy.ndarray or None
+        block-wise complex spherical harmonics coefficients before compensations were applied by
+        the `Convolver` of size like `_irs_blocks_nm`, which are reused when compensations are
+        re-applied (also after `_irs_blocks_fd` was released)
     _arir_config : sfa.io.ArrayConfiguration
         recording / measurement microphone array configuration
+    _points_lookup_ids : numpy.ndarray
+        indices of the nearest (great-circle distance) sampling point for quantized head
+        orientations of size [number of azimuths; number of elevations] according to
+        `system_config.HRIR_LOOKUP_RESOLUTION_DEG`, only relevant for HRIR
+    _points_lookup_scale : float
+        number of quantization steps per degree of `_points_lookup_ids`
+    _points_interp_ids : numpy.ndarray
+        indices of the sampling points of the enclosing grid triangle for quantized head
+        orientations of size [number of azimuths; number of elevations; 3], only relevant for HRIR
+        in case `system_config.IS_HRIR_INTERPOLATION` is enabled
+    _points_interp_weights : numpy.ndarray
+        barycentric interpolation weights of the sampling points in `_points_interp_ids` of size
+        [number of azimuths; number of elevations; 3]
+    _irs_blocks_compact_nm : numpy.ndarray or None
+        block-wise complex spherical harmonics coefficients of HRIRs being rendered by direction
+        of size [number of blocks; number according to `system_config.HRIR_COMPACT_SH_ORDER`;
+        number of output channels; block length (+1 depending on even or uneven length)], which
+        replace `_irs_blocks_fd` in case compact storage is enabled
+    _compact_blocks_fd : collections.OrderedDict
+        least recently used block-wise one-sided complex frequency spectra synthesized from
+        `_irs_blocks_compact_nm` for quantized head orientations, each with the index of the
+        occupied entry of `_compact_blocks_pool`
+    _compact_blocks_pool : numpy.ndarray or None
+        preallocated storage of all synthesized spectra of size
+        [`system_config.HRIR_COMPACT_CACHE_SIZE`; number of blocks; number of output channels;
+        block length (+1 depending on even or uneven length)]
+    _compact_bases_elev : numpy.ndarray or None
+        colatitude dependent factor of the SH basis functions (including the azimuth rotation of
+        orientations beyond the poles) for all quantized elevations of size [number of
+        elevations; number according to `system_config.HRIR_COMPACT_SH_ORDER`]
+    _compact_bases_azim : numpy.ndarray or None
+        azimuth dependent factor of the SH basis functions for all quantized azimuths of size
+        [number of azimuths; number according to `system_config.HRIR_COMPACT_SH_ORDER`]
+    _compact_bases : numpy.ndarray or None
+        buffer for the SH basis functions of the synthesized orientation of size [number
+        according to `system_config.HRIR_COMPACT_SH_ORDER`]
     """
 
+    _SH_BASES_WEIGHTED = {}
+    """Global dictionary of read-only weighted SH basis functions already calculated for a
+    sampling grid, SH order, weighting method and precision, see `get_sh_configuration()`."""
+
     def __init__(self, file_name, is_hrir, sh_max_order=None, sh_is_enforce_pinv=False):
         """
         Initialize FIR filter, call `load()` afterwards to load the file contents!
@@ -955,7 +1411,18 @@ class FilterSetMiro(FilterSet):
 
         self._irs_grid = None
         self._irs_blocks_nm = None
+        self._irs_blocks_nm_raw = None
         self._arir_config = None
+        self._points_lookup_ids = None
+        self._points_lookup_scale = None
+        self._points_interp_ids = None
+        self._points_interp_weights = None
+        self._irs_blocks_compact_nm = None
+        self._compact_blocks_fd = OrderedDict()
+        self._compact_blocks_pool = None
+        self._compact_bases_elev = None
+        self._compact_bases_azim = None
+        self._compact_bases = None
 
     def __str__(self):
         try:
@@ -970,6 +1437,212 @@ class FilterSetMiro(FilterSet):
             f"_irs_grid=len{self._irs_grid.azimuth.shape[0]}, "
             f"_irs_blocks_nm=shape{blocks_shape}, _arir_config={arir_str}]"
         )
+
+    def load(self, *args, **kwargs):
+        """
+        Extends the `FilterSet` function to also generate the lookup table of the nearest
+        sampling point for quantized head orientations, in case the filter set contains HRIR
+        data. See `FilterSet.load()` for parameters.
+        """
+        super().load(*args, **kwargs)
+        if self._is_hrir:
+            self._calculate_points_lookup()
+
+    def _calculate_points_lookup(self):
+        """
+        Generate a dense table of the nearest sampling point for all head orientations quantized
+        according to `system_config.HRIR_LOOKUP_RESOLUTION_DEG`. The nearest points are determined
+        by great-circle distance, realized as euclidean distance between unit vectors in a
+        KD-tree. Elevations cover -180 to 180 degrees, so orientations beyond the poles are
+        resolved without further wrapping. This allows an orientation lookup in constant time
+        during real-time processing, see `_get_index_from_rotation()`.
+
+        In case `system_config.IS_HRIR_INTERPOLATION` is enabled, tables of the enclosing grid
+        triangle and according barycentric weights are generated for the same orientations, see
+        `_calculate_points_interpolation()`.
+        """
+        resolution_deg = system_config.HRIR_LOOKUP_RESOLUTION_DEG
+        azim_count = int(round(360 / resolution_deg))
+        elev_count = azim_count + 1
+        is_interpolation = system_config.IS_HRIR_INTERPOLATION
+
+        self._points_lookup_scale = azim_count / 360
+        self._points_lookup_ids = FilterRegistry.get_array(
+            self._cache_key, f"points_lookup_{azim_count}"
+        )
+        if is_interpolation:
+            self._points_interp_ids = FilterRegistry.get_array(
+                self._cache_key, f"points_interp_ids_{azim_count}"
+            )
+            self._points_interp_weights = FilterRegistry.get_array(
+                self._cache_key, f"points_interp_weights_{azim_count}"
+            )
+            if self._points_interp_ids is None or self._points_interp_weights is None:
+                self._points_lookup_ids = None
+        if self._points_lookup_ids is not None:
+            return
+
+        def _get_unit_vectors(azims_deg, elevs_deg):
+            azims_rad = np.deg2rad(azims_deg)
+            elevs_rad = np.deg2rad(elevs_deg)
+            return np.stack(
+                [
+                    np.cos(elevs_rad) * np.cos(azims_rad),
+                    np.cos(elevs_rad) * np.sin(azims_rad),
+                    np.sin(elevs_rad),
+                ],
+                axis=-1,
+            )
+
+        points_vectors = _get_unit_vectors(
+            self._points_azim_deg.astype(np.float64),
+            self._points_elev_deg.astype(np.float64),
+        )
+        tree = cKDTree(points_vectors)
+
+        # query all quantized orientations at once
+        azims_deg, elevs_deg = np.meshgrid(
+            np.arange(azim_count) / self._points_lookup_scale,
+            np.arange(elev_count) / self._points_lookup_scale - 180,
+            indexing="ij",
+        )
+        lookup_vectors = _get_unit_vectors(azims_deg, elevs_deg)
+        points_ids = tree.query(lookup_vectors)[1]
+        ids_dtype = (
+            np.int16 if self._points_azim_deg.shape[0] <= np.iinfo(np.int16).max else np.int32
+        )
+        self._points_lookup_ids = FilterRegistry.put_array(
+            self._cache_key, f"points_lookup_{azim_count}", points_ids.astype(ids_dtype)
+        )
+
+        if is_interpolation:
+            interp_ids, interp_weights = self._calculate_points_interpolation(
+                points_vectors=points_vectors,
+                lookup_vectors=lookup_vectors.reshape(-1, 3),
+                nearest_ids=points_ids.reshape(-1),
+            )
+            self._points_interp_ids = FilterRegistry.put_array(
+                self._cache_key,
+                f"points_interp_ids_{azim_count}",
+                interp_ids.astype(ids_dtype).reshape(azim_count, elev_count, 3),
+            )
+            self._points_interp_weights = FilterRegistry.put_array(
+                self._cache_key,
+                f"points_interp_weights_{azim_count}",
+                interp_weights.astype(self._irs_td.dtype).reshape(azim_count, elev_count, 3),
+            )
+
+    @staticmethod
+    def _calculate_points_interpolation(points_vectors, lookup_vectors, nearest_ids):
+        """
+        Triangulate the spherical sampling grid by its convex hull and determine the enclosing
+        triangle and barycentric weights of its three sampling points for each orientation.
+        Orientations not being enclosed by any triangle (i.e., in case of grids not covering the
+        entire sphere) use the nearest sampling point only.
+
+        Parameters
+        ----------
+        points_vectors : numpy.ndarray
+            unit vectors of the sampling points of size [number of points; 3]
+        lookup_vectors : numpy.ndarray
+            unit vectors of the quantized orientations of size [number of orientations; 3]
+        nearest_ids : numpy.ndarray
+            indices of the nearest sampling point of size [number of orientations]
+
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            indices of size [number of orientations; 3] and according interpolation weights of
+            size [number of orientations; 3] of the sampling points
+        """
+        # fall back to nearest sampling point
+        interp_ids = np.repeat(nearest_ids[:, np.newaxis], 3, axis=-1)
+        interp_weights = np.zeros(interp_ids.shape)
+        interp_weights[:, 0] = 1.0
+
+        try:
+            hull = ConvexHull(points_vectors)
+        except QhullError:
+            # grid is degenerated i.e., contains only horizontal directions
+            return interp_ids, interp_weights
+
+        # only consider triangles facing away from the origin
+        normals = hull.equations[:, :3]
+        distances = -hull.equations[:, 3]
+        normals = normals[distances > 1e-6] / distances[distances > 1e-6, np.newaxis]
+        simplices = hull.simplices[distances > 1e-6]
+        if not simplices.shape[0]:
+            return interp_ids, interp_weights
+
+        # barycentric weights of a triangle result from inverse of its vertices matrix
+        simplices_inv = np.linalg.inv(np.swapaxes(points_vectors[simplices], -1, -2))
+
+        # limit temporary memory consumption by processing orientations in chunks
+        chunk_length = max(2**20 // simplices.shape[0], 1)
+        for start in range(0, lookup_vectors.shape[0], chunk_length):
+            chunk = slice(start, start + chunk_length)
+            vectors = lookup_vectors[chunk]
+
+            # enclosing triangle is intersected first by ray from origin into the orientation
+            simplex_ids = np.argmax(vectors @ normals.T, axis=-1)
+            weights = np.einsum("kij,kj->ki", simplices_inv[simplex_ids], vectors)
+
+            # resolve ambiguities of coplanar triangles (i.e., quadrilateral grid cells) by
+            # testing all triangles
+            is_valid = np.all(weights > -1e-9, axis=-1)
+            if not np.all(is_valid):
+                weights_all = np.einsum("fij,kj->kfi", simplices_inv, vectors[~is_valid])
+                is_valid_all = np.all(weights_all > -1e-9, axis=-1)
+                simplex_ids_all = np.argmax(is_valid_all, axis=-1)
+                k_ids = np.arange(simplex_ids_all.shape[0])
+                simplex_ids[~is_valid] = simplex_ids_all
+                weights[~is_valid] = weights_all[k_ids, simplex_ids_all]
+                is_valid[~is_valid] = is_valid_all[k_ids, simplex_ids_all]
+
+            weights = np.clip(weights[is_valid], 0, None)
+            interp_ids[chunk][is_valid] = simplices[simplex_ids[is_valid]]
+            interp_weights[chunk][is_valid] = weights / weights.sum(axis=-1, keepdims=True)
+
+        # sort by descending weight, so orientations matching a sampling point are recognizable
+        order = np.argsort(-interp_weights, axis=-1, kind="stable")
+        return (
+            np.take_along_axis(interp_ids, order, axis=-1),
+            np.take_along_axis(interp_weights, order, axis=-1),
+        )
+
+    def _get_cache_meta(self):
+        """
+        Returns
+        -------
+        dict
+            all attributes of the preprocessing result besides the filter coefficients, which are
+            necessary to restore the filter set from cache
+        """
+        meta = super()._get_cache_meta()
+        # store plain fields, see `FilterCache.put_meta()`
+        meta["irs_grid"] = self._irs_grid._asdict() if self._irs_grid is not None else None
+        meta["arir_config"] = (
+            self._arir_config._asdict() if self._arir_config is not None else None
+        )
+        return meta
+
+    def _set_cache_meta(self, meta):
+        """
+        Parameters
+        ----------
+        meta : dict
+            all attributes of the preprocessing result besides the filter coefficients, see
+            `_get_cache_meta()`
+        """
+        super()._set_cache_meta(meta)
+        self._irs_grid = (
+            sfa.io.SphericalGrid(**meta["irs_grid"]) if meta["irs_grid"] is not None else None
+        )
+        self._arir_config = (
+            sfa.io.ArrayConfiguration(**meta["arir_config"])
+            if meta["arir_config"] is not None
+            else None
+        )
     
     def _log_load(self, logger=None):
         """
@@ -985,8 +1658,7 @@ class FilterSetMiro(FilterSet):
 
         # generate file info
         try:
-            # array_signal = sfa.io.read_miro_struct(self._file_name)
-            array_signal = sfa.io.read_miro_struct(self._file_name,transducer_type = "cardioid")
+            array_signal = self._get_source()["irChOne"]
             log_str = (
                 f"{log_str}\n --> samplerate: {array_signal.signal.fs:.0f} Hz, "
                 f"channels: {array_signal.signal.signal.shape[0]}, "
@@ -997,9 +1669,59 @@ class FilterSetMiro(FilterSet):
                 f"type: {array_signal.configuration.array_type}"
             )
             logger.info(log_str) if logger else print(log_str)
-        except ValueError as e:
+        except (ValueError, KeyError) as e:
             raise ValueError(f"{log_str}\n --> {e.args[0]}")
 
+    def _read_source(self):
+        """
+        Parse the MIRO source file once, only reading the variables relevant for the filter set
+        (i.e., both ear channels in case of HRIR). The result is equivalent to
+        `sfa.io.read_miro_struct()` for each channel, but sharing the sampling grid.
+
+        Returns
+        -------
+        dict of sfa.io.ArraySignal
+            parsed array signal of each relevant channel
+
+        Raises
+        ------
+        TypeError
+            in case unknown type for filter name is given
+        """
+        if not isinstance(self._file_name, str):
+            raise TypeError(f'unknown parameter type "{type(self._file_name)}".')
+
+        channels = ["irChOne", "irChTwo"] if self._is_hrir else ["irChOne"]
+        data = sio.loadmat(
+            self._file_name,
+            variable_names=channels
+            + ["fs", "azimuth", "colatitude", "radius", "quadWeight", "scatterer", "avgAirTemp"],
+        )
+
+        grid = sfa.io.SphericalGrid(
+            azimuth=np.squeeze(data["azimuth"]),
+            colatitude=np.squeeze(data["colatitude"]),
+            radius=np.squeeze(data["radius"]),
+            weight=np.squeeze(data["quadWeight"]) if "quadWeight" in data else None,
+        )
+        configuration = sfa.io.ArrayConfiguration(
+            array_radius=grid.radius,
+            array_type="rigid" if np.squeeze(data["scatterer"]) else "open",
+            transducer_type="omni" if self._is_hrir else "cardioid",
+        )
+        fs = np.squeeze(data["fs"])
+        temperature = np.squeeze(data["avgAirTemp"]) if "avgAirTemp" in data else None
+
+        return {
+            channel: sfa.io.ArraySignal(
+                signal=sfa.io.TimeSignal(signal=np.squeeze(data[channel]).T, fs=fs),
+                grid=grid,
+                configuration=configuration,
+                temperature=temperature,
+            )
+            for channel in channels
+        }
+
     def _load(self, dtype):
         """
         Load a filter set containing impulse responses for provided spherical grid positions.
@@ -1013,45 +1735,18 @@ class FilterSetMiro(FilterSet):
         ------
         TypeError
             in case unknown type for filter name is given
-        ValueError
-            in case specific parameters of left and right in case of HRIR do not match
         """
-        if not isinstance(self._file_name, str):
-            raise TypeError(f'unknown parameter type "{type(self._file_name)}".')
+        source = self._get_source()
 
         if self._is_hrir:
-            array_signal_l = sfa.io.read_miro_struct(self._file_name, channel="irChOne")
-            array_signal_r = sfa.io.read_miro_struct(self._file_name, channel="irChTwo")
+            # both ears share sampling frequency and grid, since they are read from one file
+            array_signal = source["irChOne"]
             self._irs_td = np.stack(
-                (array_signal_l.signal.signal, array_signal_r.signal.signal)
+                (array_signal.signal.signal, source["irChTwo"].signal.signal)
             )
             # proper memory alignment will be done later
             self._irs_td = np.swapaxes(self._irs_td, 0, 1)
 
-            # make sure provided sampling frequencies are identical and safe for reference
-            if array_signal_l.signal.fs != array_signal_r.signal.fs:
-                raise ValueError(f"mismatch in left and right ear sampling frequency.")
-
-            # make sure provided sampling grids are identical and safe for reference
-            if (
-                not np.array_equal(
-                    array_signal_l.grid.colatitude, array_signal_r.grid.colatitude
-                )
-                or not np.array_equal(
-                    array_signal_l.grid.azimuth, array_signal_r.grid.azimuth
-                )
-                or not np.array_equal(
-                    array_signal_l.grid.radius, array_signal_r.grid.radius
-                )
-                or not np.array_equal(
-                    array_signal_l.grid.weight, array_signal_r.grid.weight
-                )
-            ):
-                raise ValueError(f"mismatch in left and right ear sampling grid.")
-
-            # select one set for further reference, since they are identical
-            array_signal = array_signal_l
-
             self._points_azim_deg = np.rad2deg(array_signal.grid.azimuth.astype(dtype))
             # transform colatitude into elevation!
             self._points_elev_deg = 90 - np.rad2deg(
@@ -1059,7 +1754,7 @@ class FilterSetMiro(FilterSet):
             )
 
         else:
-            array_signal = sfa.io.read_miro_struct(self._file_name,transducer_type = "cardioid")
+            array_signal = source["irChOne"]
 
             # save needed attributes and adjust dtype
             self._irs_td = array_signal.signal.signal[np.newaxis, :]
@@ -1098,6 +1793,155 @@ class FilterSetMiro(FilterSet):
         #     )
 
     
+    def calculate_filter_blocks_fd(self, block_length):
+        """
+        Extends the `FilterSet` function to store HRIRs being rendered by direction as block-wise
+        spherical harmonics coefficients of order `system_config.HRIR_COMPACT_SH_ORDER` instead of
+        spectra for every sampling point, in case it is given. This reduces the memory footprint
+        of dense sampling grids considerably. Spectra for individual head orientations are
+        synthesized on demand, see `get_filter_blocks_fd()`.
+
+        Parameters
+        ----------
+        block_length : int or None
+            system wide length of audio blocks in samples
+        """
+        self._irs_blocks_nm_raw = None
+        sh_order = system_config.HRIR_COMPACT_SH_ORDER
+        if sh_order is None or not self._is_hrir or not self._get_is_rendered_by_direction():
+            super().calculate_filter_blocks_fd(block_length)
+            return
+
+        # entire signal is one block, if no size is given
+        if not block_length:  # None or <=0
+            block_length = self._irs_td.shape[-1]
+        block_count = self._irs_td.shape[-1] // block_length
+        dtype = np.complex64 if self._irs_td.dtype == np.float32 else np.complex128
+
+        self._irs_blocks_fd = None
+        self._compact_blocks_fd.clear()
+        cache_name = f"irs_blocks_compact_nm_{block_length}_{sh_order}_{self._sh_is_enforce_pinv:d}"
+        self._irs_blocks_compact_nm = FilterRegistry.get_array(self._cache_key, cache_name)
+        if self._irs_blocks_compact_nm is None:
+            sh_bases_weighted = self._get_sh_bases_weighted(sh_order, dtype)
+            blocks_td = self._irs_td.reshape(
+                *self._irs_td.shape[:-1], block_count, block_length
+            ).transpose(2, 0, 1, 3)
+
+            # transform block by block, so spectra of all sampling points are never stored
+            self._irs_blocks_compact_nm = np.empty(
+                (
+                    block_count,
+                    sh_bases_weighted.shape[0],
+                    self._irs_td.shape[1],
+                    2 * block_length,
+                ),
+                dtype=dtype,
+            )
+            for block_td, block_nm in zip(blocks_td, self._irs_blocks_compact_nm):
+                block_fd = sfft.fft(block_td, 2 * block_length, axis=-1, workers=-1)
+                np.einsum("np,pcf->ncf", sh_bases_weighted, block_fd, out=block_nm)
+
+            self._irs_blocks_compact_nm = FilterRegistry.put_array(
+                self._cache_key, cache_name, self._irs_blocks_compact_nm
+            )
+
+        # prepare synthesis, so it does not allocate during real-time processing (the storage is
+        # not occupied before being written)
+        self._calculate_compact_bases(sh_order, dtype)
+        self._compact_blocks_pool = np.empty(
+            (system_config.HRIR_COMPACT_CACHE_SIZE, block_count)
+            + self._irs_blocks_compact_nm.shape[2:],
+            dtype=dtype,
+        )
+
+        # for dirac impulse, limited to be rotation independent
+        self._dirac_blocks_fd = np.zeros(
+            (block_count, 1, self._irs_td.shape[1], 2 * block_length), dtype=dtype
+        )
+        self._dirac_blocks_fd[0] = 1.0
+
+    def _calculate_compact_bases(self, sh_order, dtype):
+        """
+        Generate tables of the SH basis functions for all head orientations quantized according to
+        `system_config.HRIR_LOOKUP_RESOLUTION_DEG`. The complex basis functions separate into a
+        colatitude and an azimuth dependent factor, so only one table per angle is necessary.
+
+        Parameters
+        ----------
+        sh_order : int
+            spherical harmonics order of the compact storage
+        dtype : type
+            complex data type of the SH basis functions
+        """
+        azim_count, elev_count = self._points_lookup_ids.shape
+        sh_m = sfa.sph.mnArrays(nMax=sh_order)[0]
+
+        # wrap orientations beyond the poles into colatitude and azimuth rotated by 180 degrees
+        elevs_rad = np.deg2rad(np.arange(elev_count) / self._points_lookup_scale - 180)
+        colats_rad = np.arccos(np.clip(np.sin(elevs_rad), -1, 1))
+        self._compact_bases_elev = sfa.sph.sph_harm_all(
+            nMax=sh_order, az=np.zeros(elev_count), co=colats_rad
+        ).astype(dtype)
+        self._compact_bases_elev[np.cos(elevs_rad) < 0] *= (-1.0) ** sh_m
+
+        azims_rad = np.deg2rad(np.arange(azim_count) / self._points_lookup_scale)
+        self._compact_bases_azim = np.exp(1j * np.outer(azims_rad, sh_m)).astype(dtype)
+        self._compact_bases = np.empty(sh_m.shape[0], dtype=dtype)
+
+    def _get_filter_blocks_fd_compact(self, azim_deg, elev_deg):
+        """
+        Parameters
+        ----------
+        azim_deg : int or float
+            azimuth of desired sound incidence direction in degrees
+        elev_deg: int or float
+            elevation of desired sound incidence direction in degrees
+
+        Returns
+        -------
+        numpy.ndarray
+            read-only block-wise one-sided complex frequency spectra of the filters synthesized
+            from `_irs_blocks_compact_nm` for the quantized orientation of size [number of blocks;
+            number of output channels; block length (+1 depending on even or uneven length)],
+            which is overwritten as soon as it becomes the least recently used one of
+            `system_config.HRIR_COMPACT_CACHE_SIZE` synthesized orientations
+        """
+        # quantize orientation (azimuth wraps around, elevation is limited to -180 .. 180)
+        azim_count = self._points_lookup_ids.shape[0]
+        azim_id = int(round(azim_deg * self._points_lookup_scale)) % azim_count
+        elev_id = int(round((elev_deg + 180) * self._points_lookup_scale))
+        elev_id = min(max(elev_id, 0), self._points_lookup_ids.shape[1] - 1)
+
+        entry = self._compact_blocks_fd.get((azim_id, elev_id))
+        if entry is not None:
+            self._compact_blocks_fd.move_to_end((azim_id, elev_id))
+            return entry[1]
+
+        # occupy unused storage or the one of the least recently used orientation
+        if len(self._compact_blocks_fd) < self._compact_blocks_pool.shape[0]:
+            pool_id = len(self._compact_blocks_fd)
+        else:
+            pool_id = self._compact_blocks_fd.popitem(last=False)[1][0]
+
+        # synthesize from SH coefficients
+        np.multiply(
+            self._compact_bases_elev[elev_id],
+            self._compact_bases_azim[azim_id],
+            out=self._compact_bases,
+        )
+        np.einsum(
+            "n,bncf->bcf",
+            self._compact_bases,
+            self._irs_blocks_compact_nm,
+            out=self._compact_blocks_pool[pool_id],
+        )
+        blocks_fd = self._compact_blocks_pool[pool_id]
+        blocks_fd.flags.writeable = False
+
+        self._compact_blocks_fd[(azim_id, elev_id)] = (pool_id, blocks_fd)
+        return blocks_fd
+
     def calculate_filter_blocks_nm(self):
         """
         Transform beforehand calculated block-wise one-sided complex spectra in frequency domain
@@ -1137,6 +1981,11 @@ class FilterSetMiro(FilterSet):
             )
             return np.swapaxes(ir_nm.astype(block_fd.dtype), 0, 1)
 
+        # reuse uncompensated coefficients (frequency domain blocks might have been released)
+        if self._irs_blocks_nm_raw is not None:
+            self._irs_blocks_nm = self._irs_blocks_nm_raw
+            return
+
         if self._irs_blocks_fd is None:
             raise RuntimeError(FilterSet._ERROR_MSG_FD)
 
@@ -1147,6 +1996,15 @@ class FilterSetMiro(FilterSet):
                 f"loaded filter and partitioned convolution in SH domain is not implemented yet."
             )
 
+        cache_name = (
+            f"irs_blocks_nm_{self._irs_blocks_fd.shape[-1]}_{self._sh_max_order}_"
+            f"{self._sh_is_enforce_pinv:d}"
+        )
+        self._irs_blocks_nm = FilterRegistry.get_array(self._cache_key, cache_name)
+        if self._irs_blocks_nm is not None:
+            self._irs_blocks_nm_raw = self._irs_blocks_nm
+            return
+
         # precompute weighted SH basis function
         sh_bases_weighted = self.get_sh_configuration().sh_bases_weighted
 
@@ -1156,6 +2014,11 @@ class FilterSetMiro(FilterSet):
         )
         self._irs_blocks_nm = self._irs_blocks_nm.copy()  # copy to ensure C-order
 
+        self._irs_blocks_nm = FilterRegistry.put_array(
+            self._cache_key, cache_name, self._irs_blocks_nm
+        )
+        self._irs_blocks_nm_raw = self._irs_blocks_nm
+
     def _get_index_from_rotation(self, azim_deg, elev_deg):
         """
         Parameters
@@ -1169,29 +2032,42 @@ class FilterSetMiro(FilterSet):
         -------
         int
             index in the `numpy.ndarray` storing the impulse response according to the desired
-            incidence direction
+            incidence direction (nearest sampling point of the quantized orientation)
         """
-        # TODO: change to grid based search method of closest point
+        # quantize orientation (azimuth wraps around, elevation is limited to -180 .. 180)
+        azim_id = int(round(azim_deg * self._points_lookup_scale))
+        azim_id %= self._points_lookup_ids.shape[0]
+        elev_id = int(round((elev_deg + 180) * self._points_lookup_scale))
+        elev_id = min(max(elev_id, 0), self._points_lookup_ids.shape[1] - 1)
 
-        # get closest azimuth index (catch case when index at end of vector would be detected)
-        azim_ids = min(
-            self._points_azim_deg.searchsorted(
-                azim_deg, side="left" if azim_deg >= 0 else "right"
-            ),
-            self._points_azim_deg.shape[0] - 1,
-        )
+        return self._points_lookup_ids[azim_id, elev_id]
 
-        # get indices of all azimuths having the same value
-        azim_ids = np.where(self._points_azim_deg == self._points_azim_deg[azim_ids])[0]
+    def _get_interpolation_from_rotation(self, azim_deg, elev_deg):
+        """
+        Parameters
+        ----------
+        azim_deg : int or float
+            azimuth of desired sound incidence direction in degrees
+        elev_deg: int or float
+            elevation of desired sound incidence direction in degrees
 
-        # get closest elevation index of subset (catch case when index at end of vector would be
-        # detected)
-        elev_sub_id = min(
-            self._points_elev_deg[azim_ids].searchsorted(elev_deg),
-            azim_ids.shape[0] - 1,
-        )
+        Returns
+        -------
+        (numpy.ndarray, numpy.ndarray)
+            indices in the `numpy.ndarray` storing the impulse responses of the enclosing grid
+            triangle and according barycentric interpolation weights of the quantized orientation,
+            both of size [3]
+        """
+        # quantize orientation (azimuth wraps around, elevation is limited to -180 .. 180)
+        azim_id = int(round(azim_deg * self._points_lookup_scale))
+        azim_id %= self._points_interp_ids.shape[0]
+        elev_id = int(round((elev_deg + 180) * self._points_lookup_scale))
+        elev_id = min(max(elev_id, 0), self._points_interp_ids.shape[1] - 1)
 
-        return azim_ids[elev_sub_id]
+        return (
+            self._points_interp_ids[azim_id, elev_id],
+            self._points_interp_weights[azim_id, elev_id],
+        )
 
     def get_filter_blocks_fd(self, azim_deg=0.0, elev_deg=0.0):
         """
@@ -1216,13 +2092,47 @@ class FilterSetMiro(FilterSet):
             in case requested blocks have not been calculated yet
         """
         if self._is_hrir:
-            return super().get_filter_blocks_fd(azim_deg, elev_deg)
+            if self._irs_blocks_compact_nm is not None:
+                return self._get_filter_blocks_fd_compact(azim_deg, elev_deg)
+            if self._points_interp_weights is None:
+                return super().get_filter_blocks_fd(azim_deg, elev_deg)
+            if self._irs_blocks_fd is None:
+                raise RuntimeError(FilterSet._ERROR_MSG_FD)
+
+            ids, weights = self._get_interpolation_from_rotation(azim_deg, elev_deg)
+            if weights[0] == 1:
+                # orientation matches a sampling point or no enclosing triangle exists
+                return self._irs_blocks_fd[:, ids[0]]
+            # blend spectra of the enclosing triangle
+            return np.einsum("bpcf,p->bcf", self._irs_blocks_fd[:, ids], weights)
         else:
             if self._irs_blocks_fd is None:
                 raise RuntimeError(FilterSet._ERROR_MSG_FD)
 
             return self._irs_blocks_fd
 
+    def get_filter_delays(self, azim_deg=0.0, elev_deg=0.0):
+        """
+        Extends the `FilterSet` function to blend the onset delays of the enclosing grid
+        triangle, in case `system_config.IS_HRIR_INTERPOLATION` is enabled. See
+        `FilterSet.get_filter_delays()` for parameters.
+        """
+        if self._irs_delays is None or self._points_interp_weights is None:
+            return super().get_filter_delays(azim_deg, elev_deg)
+
+        ids, weights = self._get_interpolation_from_rotation(azim_deg, elev_deg)
+        return weights @ self._irs_delays[ids]
+
+    def _get_is_rendered_by_direction(self):
+        """
+        Returns
+        -------
+        bool
+            if filters are rendered by selecting individual directions, which is not the case in
+            spherical harmonics domain
+        """
+        return self._sh_max_order is None
+
     def get_filter_blocks_nm(self):
         """
         Returns
@@ -1269,100 +2179,87 @@ class FilterSetMiro(FilterSet):
         
         #[sh_m,sh_n] = sfa.sph.mnArrays(nMax=self._sh_max_order).astype(np.int16)
 
-        # calculate sh base functions, see `sound-field-analysis-py` `process.spatFT()` for
-        # reference
-        #sh_m = np.delete(sh_m,-3)
-        #sh_n = np.delete(sh_n,-3)
-        #print(sh_m)
-        #print(sh_n)
-        #sh_bases = scy.sph_harm(sh_m, sh_n, self._irs_grid.azimuth, self._irs_grid.colatitude)
+        # provide copy, since the configuration may be altered by the consumer
+        sh_bases_weighted = self._get_sh_bases_weighted(self._sh_max_order, dtype).copy()
+        return FilterSetShConfig(sh_m, sh_bases_weighted, self._arir_config)
 
-        sh_bases = sfa.sph.sph_harm_all(
-            nMax=self._sh_max_order,
-            az=self._irs_grid.azimuth,
-            co=self._irs_grid.colatitude,
-        ).astype(dtype)
-        #print(sh_bases)
-        #print("sh_bases")
-        # ignore underflow FloatingPointError in `numpy.matmul()`
-        #with np.errstate(under="ignore"):
-        #    if self._sh_is_enforce_pinv or self._irs_grid.weight is None:
-        #        # calculate pseudo inverse since no grid weights are given
-        #        sh_bases_weighted = np.linalg.pinv(sh_bases)
-        #    else:
-        #        # apply given grid weights
-        #        sh_bases_weighted = np.conj(sh_bases).T * (
-        #            4 * np.pi * self._irs_grid.weight
-        #        )
-
-       # print(self._irs_grid.weight)
-        #àprint("weights:")
-        #print("sh_bases_weighted")
-        #print(sh_bases_weighted)
-        #print(sh_bases_weighted)
-        #return FilterSetShConfig(sh_m, sh_bases_weighted, self._arir_config)
-
-    #def my_get_sh_configuration(self):
+    def _get_sh_bases_weighted(self, sh_max_order, dtype):
         """
+        Weighted SH bases are only calculated once per sampling grid, SH order, weighting method
+        and precision, since SH order changes at runtime would otherwise recalculate them while
+        rendering is paused. They are kept in memory and in the on-disk `FilterCache`.
+
+        Parameters
+        ----------
+        sh_max_order : int
+            maximum spherical harmonics order
+        dtype : type
+            complex data type of the SH basis functions
+
         Returns
         -------
-        FilterSetShConfig
-            combined filter configuration with all necessary information to transform an incoming
-            audio block into spherical harmonics sound field coefficients in real-time
-
-        Raises
-        ------
-        ValueError
-            in case an invalid value for the maximal spherical harmonics processing order is given
-        """
+        numpy.ndarray
+            read-only spherical harmonic bases weighted by grid weights of spatial sampling points
+            of size [number according to `sh_max_order`; number of input channels]
         """
-        if self._sh_max_order is None or self._sh_max_order < 0:
-            raise ValueError(
-                f'Invalid value "{self._sh_max_order}" for spherical harmonics order.'
-            )
-
-        # adjust dtype
-        dtype = np.complex64 if self._irs_td.dtype == np.float32 else np.complex128
+        is_pinv = self._sh_is_enforce_pinv or self._irs_grid.weight is None
+        key = FilterCache.get_data_key(
+            [
+                self._irs_grid.azimuth,
+                self._irs_grid.colatitude,
+                self._irs_grid.weight if self._irs_grid.weight is not None else [],
+            ],
+            "sh_bases_weighted",
+            sh_max_order,
+            is_pinv,
+            np.dtype(dtype).str,
+        )
+        sh_bases_weighted = FilterSetMiro._SH_BASES_WEIGHTED.get(key)
+        if sh_bases_weighted is None:
+            sh_bases_weighted = FilterCache.get_array(key, "sh_bases_weighted")
+            if sh_bases_weighted is None:
+                sh_bases_weighted = self._calculate_sh_bases_weighted(
+                    sh_max_order, dtype, is_pinv
+                )
+                FilterCache.put_array(key, "sh_bases_weighted", sh_bases_weighted)
+            sh_bases_weighted.flags.writeable = False
+            FilterSetMiro._SH_BASES_WEIGHTED[key] = sh_bases_weighted
+        return sh_bases_weighted
 
-        # calculate stacked SH orders and modes
-        sh_m = sfa.sph.mnArrays(nMax=self._sh_max_order)[0].astype(np.int16)
-        sh_n = sfa.sph.mnArrays(nMax=self._sh_max_order)[1].astype(np.int16)
-        
-        #[sh_m,sh_n] = sfa.sph.mnArrays(nMax=self._sh_max_order).astype(np.int16)
+    def _calculate_sh_bases_weighted(self, sh_max_order, dtype, is_pinv):
+        """
+        Parameters
+        ----------
+        sh_max_order : int
+            maximum spherical harmonics order
+        dtype : type
+            complex data type of the SH basis functions
+        is_pinv : bool
+            if pseudo-inverse (Moore-Penrose) matrix will be used over explicitly given sampling
+            grid weights
 
+        Returns
+        -------
+        numpy.ndarray
+            spherical harmonic bases weighted by grid weights of spatial sampling points of size
+            [number according to `sh_max_order`; number of input channels]
+        """
         # calculate sh base functions, see `sound-field-analysis-py` `process.spatFT()` for
         # reference
-        sh_m = np.delete(sh_m,-3)
-        sh_n = np.delete(sh_n,-3)
-        print(sh_m)
-        print(sh_n)
-        #sh_bases = scy.sph_harm(sh_m, sh_n, self._irs_grid.azimuth, self._irs_grid.colatitude)
-        mA, azA = np.meshgrid(sh_m, self._irs_grid.azimuth)
-        nA, coA = np.meshgrid(sh_n, self._irs_grid.colatitude)
-        print(nA)
-        print(coA)
-        sh_bases = sfa.sph.sph_harm(
-            m=mA,
-            n=nA,
-            az=azA,
-            co=coA,
+        sh_bases = sfa.sph.sph_harm_all(
+            nMax=sh_max_order,
+            az=self._irs_grid.azimuth,
+            co=self._irs_grid.colatitude,
         ).astype(dtype)
-        print("sh_bases")
-        print(sh_bases) """ 
+
         # ignore underflow FloatingPointError in `numpy.matmul()`
         with np.errstate(under="ignore"):
-            if self._sh_is_enforce_pinv or self._irs_grid.weight is None:
-            #if True:
+            if is_pinv:
                 # calculate pseudo inverse since no grid weights are given
-                sh_bases_weighted = np.linalg.pinv(sh_bases)
+                return np.linalg.pinv(sh_bases)
             else:
                 # apply given grid weights
-                sh_bases_weighted = np.conj(sh_bases).T * (
-                    4 * np.pi * self._irs_grid.weight
-                )
-        #print("sh_bases_weighted")
-        #print(sh_bases_weighted)
-        return FilterSetShConfig(sh_m, sh_bases_weighted, self._arir_config)
+                return np.conj(sh_bases).T * (4 * np.pi * self._irs_grid.weight)
 
 class FilterSetShConfig(
     namedtuple("FilterSetShConfig", ["sh_m", "sh_bases_weighted", "arir_config"])
@@ -1417,45 +2314,18 @@ class FilterSetSofa(FilterSetMiro):
             instance to provide identical logging behaviour as the parent process
         """
 
-        def _load_convention(file):
-            convention = file.getGlobalAttributeValue("SOFAConventions")
-            if convention == "AmbisonicsDRIR":
-                return sofa.SOFAAmbisonicsDRIR(file.ncfile.filename, "r")
-            elif convention == "GeneralFIR":
-                return sofa.SOFAGeneralFIR(file.ncfile.filename, "r")
-            elif convention == "GeneralFIRE":
-                return sofa.SOFAGeneralFIRE(file.ncfile.filename, "r")
-            elif convention == "GeneralTF":
-                return sofa.SOFAGeneralTF(file.ncfile.filename, "r")
-            elif convention == "MultiSpeakerBRIR":
-                return sofa.SOFAMultiSpeakerBRIR(file.ncfile.filename, "r")
-            elif convention == "SimpleFreeFieldHRIR":
-                return sofa.SOFASimpleFreeFieldHRIR(file.ncfile.filename, "r")
-            elif convention == "SimpleFreeFieldSOS":
-                return sofa.SOFASimpleFreeFieldSOS(file.ncfile.filename, "r")
-            elif convention == "SimpleHeadphoneIR":
-                return sofa.SOFASimpleHeadphoneIR(file.ncfile.filename, "r")
-            elif convention == "SingleRoomDRIR":
-                return sofa.SOFASingleRoomDRIR(file.ncfile.filename, "r")
-            else:
-                raise ValueError(f"unknown SOFA convention {convention}!")
-
         # load file
         log_str = f'opening file "{os.path.relpath(self._file_name)}"'
         try:
-            file_sofa = sofa.SOFAFile(self._file_name, "r")
-            file_convention = _load_convention(file_sofa)
+            file_convention = self._get_source()
         except OSError as e:
             raise ValueError(f"{log_str}\n --> {e.strerror}")
 
-        # check validity
-        if not file_sofa.isValid():
-            warn_str = "invalid SOFA file."
-            logger.warning(warn_str) if logger else print(warn_str, file=sys.stderr)
-        elif not file_convention.isValid():
+        # check validity (also covers general SOFA validity)
+        if not file_convention.isValid():
             warn_str = (
                 f"invalid SOFA file according to "
-                f'`{file_sofa.getGlobalAttributeValue("SOFAConventions")}` convention.'
+                f'`{file_convention.getGlobalAttributeValue("SOFAConventions")}` convention.'
             )
             logger.warning(warn_str) if logger else print(warn_str, file=sys.stderr)
 
@@ -1467,7 +2337,7 @@ class FilterSetSofa(FilterSetMiro):
             f', emitters: {file_convention.ncfile.file.dimensions["E"].size}'
             f', measurements: {file_convention.ncfile.file.dimensions["M"].size}'
             f', samples: {file_convention.ncfile.file.dimensions["N"].size}'
-            f", format: {file_convention.getDataIR().dtype}"
+            f', format: {file_convention.ncfile.file.variables["Data.IR"].dtype}'
             f"\n --> radius: {arir_config.array_radius*100:.2f} cm, "
             f"transducer: {arir_config.transducer_type}, "
             f"type: {arir_config.array_type}"
@@ -1487,6 +2357,54 @@ class FilterSetSofa(FilterSetMiro):
             pass
         logger.info(log_str) if logger else print(log_str)
 
+    def _read_source(self):
+        """
+        Open the SOFA source file once according to its convention. The data is only read on
+        access, since netCDF variables are loaded lazily.
+
+        Returns
+        -------
+        pysofaconventions.SOFAFile.SOFAFile
+            opened SOFA source file of the specific convention
+
+        Raises
+        ------
+        TypeError
+            in case unknown type for filter name is given
+        ValueError
+            in case unknown SOFA convention is given
+        """
+        _CONVENTIONS = {
+            "AmbisonicsDRIR": sofa.SOFAAmbisonicsDRIR,
+            "GeneralFIR": sofa.SOFAGeneralFIR,
+            "GeneralFIRE": sofa.SOFAGeneralFIRE,
+            "GeneralTF": sofa.SOFAGeneralTF,
+            "MultiSpeakerBRIR": sofa.SOFAMultiSpeakerBRIR,
+            "SimpleFreeFieldHRIR": sofa.SOFASimpleFreeFieldHRIR,
+            "SimpleFreeFieldSOS": sofa.SOFASimpleFreeFieldSOS,
+            "SimpleHeadphoneIR": sofa.SOFASimpleHeadphoneIR,
+            "SingleRoomDRIR": sofa.SOFASingleRoomDRIR,
+        }
+        """Supported SOFA conventions, see `pysofaconventions` library."""
+
+        if not isinstance(self._file_name, str):
+            raise TypeError(f'unknown parameter type "{type(self._file_name)}".')
+
+        # read convention from header only
+        file = sofa.SOFAFile(self._file_name, "r")
+        convention = file.getGlobalAttributeValue("SOFAConventions")
+        file.close()
+        if convention not in _CONVENTIONS:
+            raise ValueError(f"unknown SOFA convention {convention}!")
+
+        return _CONVENTIONS[convention](self._file_name, "r")
+
+    def _close_source(self):
+        """Close the opened SOFA source file, see `_get_source()`."""
+        if self._source is not None:
+            self._source.close()
+        super()._close_source()
+
     @staticmethod
     def _load_arir_config(sofa_file):
         """
@@ -1571,11 +2489,7 @@ class FilterSetSofa(FilterSetMiro):
                 irs = irs.filled(0)
             return irs.astype(dtype)  # `astype()` makes copy
 
-        if not isinstance(self._file_name, str):
-            raise TypeError(f'unknown parameter type "{type(self._file_name)}".')
-
-        # load file
-        file = sofa.SOFAFile(self._file_name, "r")
+        file = self._get_source()
 
         # get IRs and adjust data type
         self._irs_td = _check_irs(file.getDataIR())
@@ -0,0 +1,229 @@
+import gc
+import json
+import os
+import sys
+import threading
+from collections import deque
+from time import perf_counter, strftime
+
+import numpy as np
+
+from . import system_config
+from .stage_timer import StageTimer
+
+
+class FlightRecorder(object):
+    """
+    Flexible structure to record what a `JackClient` was doing during the last blocks before a
+    JACK xrun occurred. The process callback writes one row per block (time, JACK frame time,
+    callback duration, tracker orientation and durations of all processing stages measured by a
+    `StageTimer`) into a fixed size preallocated ring. Furthermore, process wide events (OSC
+    commands received and garbage collections) are recorded with their time of occurrence.
+
+    On every xrun, a snapshot of the ring and all events within the recorded time span is dumped
+    into a JSON file in `system_config.FLIGHT_RECORDER_PATH` by a separate thread, so the
+    callback is never blocked by writing to disk.
+
+    Attributes
+    ----------
+    name : str
+        name of the recorded client
+    _blocks : numpy.ndarray
+        ring of recorded blocks of size [`system_config.FLIGHT_RECORDER_BLOCK_COUNT`; number of
+        fields], see `FIELD_NAMES`
+    _write_count : int
+        number of blocks recorded by the process callback
+    _xruns : collections.deque
+        xruns (time in s and delay in microseconds) which were not dumped yet
+    _event_xrun : threading.Event
+        event waking the dumping thread when being set
+    _event_terminate : multiprocessing.Event
+        event of the owning client ending the dumping thread when being set
+    _logger : logging.Logger or None
+        instance to provide identical logging behaviour as the owning client
+    """
+
+    FIELD_NAMES = (
+        "time_sec",
+        "frame_time",
+        "duration_ms",
+        "azim_deg",
+        "elev_deg",
+        "tilt_deg",
+    ) + tuple(f"{stage}_ms" for stage in StageTimer.STAGE_NAMES)
+    """Names of all fields recorded per block."""
+
+    _START = perf_counter()
+    """Reference of all recorded times."""
+    _EVENTS = deque(maxlen=system_config.FLIGHT_RECORDER_EVENT_COUNT)
+    """Global ring of process wide events (time in s, kind and message)."""
+    _IS_GC_RECORDED = False
+    """If garbage collections are recorded already."""
+
+    @staticmethod
+    def get_is_enabled():
+        """
+        Returns
+        -------
+        bool
+            if flight recording is enabled by the system configuration
+        """
+        return bool(getattr(system_config, "IS_FLIGHT_RECORDER", False))
+
+    @staticmethod
+    def add_event(kind, message):
+        """
+        Record a process wide event, in case flight recording is enabled by the system
+        configuration.
+
+        Parameters
+        ----------
+        kind : str
+            kind of event, e.g. "osc" or "gc"
+        message : str
+            description of the event
+        """
+        if FlightRecorder.get_is_enabled():
+            FlightRecorder._EVENTS.append((perf_counter() - FlightRecorder._START, kind, message))
+
+    @staticmethod
+    def _record_gc(phase, info):
+        """
+        Record garbage collections, see `gc.callbacks`.
+
+        Parameters
+        ----------
+        phase : str
+            "start" or "stop" of the collection
+        info : dict
+            information about the collection
+        """
+        if phase == "start":
+            FlightRecorder.add_event("gc", f"start generation {info['generation']}")
+        else:
+            FlightRecorder.add_event(
+                "gc",
+                f"stop generation {info['generation']} (collected {info['collected']}, "
+                f"uncollectable {info['uncollectable']})",
+            )
+
+    def __init__(self, name, event_terminate, logger=None):
+        """
+        Parameters
+        ----------
+        name : str
+            name of the recorded client
+        event_terminate : multiprocessing.Event
+            event of the owning client ending the dumping thread when being set
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the owning client
+        """
+        self.name = name
+        self._blocks = np.zeros(
+            (system_config.FLIGHT_RECORDER_BLOCK_COUNT, len(FlightRecorder.FIELD_NAMES))
+        )
+        self._write_count = 0
+        self._xruns = deque(maxlen=FlightRecorder._EVENTS.maxlen)
+        self._event_xrun = threading.Event()
+        self._event_terminate = event_terminate
+        self._logger = logger
+
+        if not FlightRecorder._IS_GC_RECORDED:
+            FlightRecorder._IS_GC_RECORDED = True
+            gc.callbacks.append(FlightRecorder._record_gc)
+
+    def start(self):
+        """Start the dumping thread."""
+        threading.Thread(target=self._run, name=f"{self.name}-flight", daemon=True).start()
+
+    def record(self, start, frame_time, orientation_deg=None, stages_sec=None):
+        """
+        Record the current block. This is called at the end of the JACK process callback.
+
+        Parameters
+        ----------
+        start : float
+            high-resolution time at the beginning of the callback, see `time.perf_counter()`
+        frame_time : int
+            JACK frame time at the beginning of the current block
+        orientation_deg : numpy.ndarray, optional
+            current tracker azimuth, elevation and tilt in degrees
+        stages_sec : numpy.ndarray, optional
+            durations of all processing stages in s, see `StageTimer`
+        """
+        row = self._blocks[self._write_count % self._blocks.shape[0]]
+        row[0] = start - FlightRecorder._START
+        row[1] = frame_time
+        row[2] = (perf_counter() - start) * 1000
+        if orientation_deg is not None:
+            row[3:6] = orientation_deg
+        if stages_sec is not None:
+            np.multiply(stages_sec, 1000, out=row[6:])
+        self._write_count += 1
+
+    def trigger(self, delay_usec):
+        """
+        Request a snapshot to be dumped. This is called by the JACK xrun callback.
+
+        Parameters
+        ----------
+        delay_usec : float
+            delay in microseconds reported by JACK
+        """
+        self._xruns.append((perf_counter() - FlightRecorder._START, delay_usec))
+        self._event_xrun.set()
+
+    def _run(self):
+        """Dump snapshots on request until the owning client terminates. Dumps are limited to
+        one per `system_config.FLIGHT_RECORDER_MIN_INTERVAL_SEC`, further xruns in between are
+        contained in the following snapshot."""
+        while not self._event_terminate.is_set():
+            if not self._event_xrun.wait(timeout=1):
+                continue
+            self._event_xrun.clear()
+            self._dump()
+            self._event_terminate.wait(timeout=system_config.FLIGHT_RECORDER_MIN_INTERVAL_SEC)
+
+    def _dump(self):
+        """Write a snapshot of all recorded blocks (oldest first) and the events within their time
+        span. The file is written atomically by writing to a temporary file first which is renamed
+        afterwards. Failures are only logged. Nothing is written in case neither blocks nor xruns
+        were recorded."""
+        write_count = self._write_count
+        block_count = min(write_count, self._blocks.shape[0])
+        ids = np.arange(write_count - block_count, write_count) % self._blocks.shape[0]
+        blocks = self._blocks[ids]
+
+        xruns = []
+        while self._xruns:
+            xruns.append(self._xruns.popleft())
+        if not block_count and not xruns:
+            return
+        start = blocks[0, 0] if block_count else xruns[0][0]
+        events = [e for e in list(FlightRecorder._EVENTS) if e[0] >= start]
+
+        snapshot = {
+            "name": self.name,
+            "xruns": [dict(time_sec=t, delay_usec=d) for t, d in xruns],
+            "fields": FlightRecorder.FIELD_NAMES,
+            "blocks": np.round(blocks, 4).tolist(),
+            "events": [dict(time_sec=t, kind=k, message=m) for t, k, m in events],
+        }
+
+        file_name = f"{self.name}_{strftime('%Y%m%d_%H%M%S')}_{write_count}.json"
+        path = os.path.join(os.path.abspath(system_config.FLIGHT_RECORDER_PATH), file_name)
+        path_tmp = f"{path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path_tmp, "w") as file:
+                json.dump(snapshot, file)
+            os.replace(path_tmp, path)
+        except OSError as e:
+            log_str = f'failed to write flight recording "{os.path.relpath(path)}" ({e}).'
+            self._logger.warning(log_str) if self._logger else print(
+                f"[WARNING]  {log_str}", file=sys.stderr
+            )
+            return
+
+        log_str = f'dumped flight recording of {block_count} blocks to "{os.path.relpath(path)}".'
+        self._logger.info(log_str) if self._logger else print(log_str)
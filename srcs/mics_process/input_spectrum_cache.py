@@ -0,0 +1,111 @@
+import threading
+
+
+class InputSpectrumCache(object):
+    """
+    Flexible abstract structure providing a per-process cache of input block spectra. Several
+    convolvers receiving identical input blocks (i.e., being connected to the same source ports)
+    only need to transform the block once per processing frame.
+
+    The cache key is provided by the owning `JackClient` and consists of the JACK frame time of
+    the current processing frame, the connected source port names and the input delay. The
+    `Convolver` extends it by the size and dtype of its input buffer.
+
+    Since the process callbacks of several clients may run concurrently, the spectra of every
+    processing frame are stored in an individual generation. Generations are never altered once
+    replaced, so a callback still processing an earlier frame is not affected by another callback
+    starting a new frame. Only the most recent generations are kept, spectra of earlier frames are
+    not cached anymore. Accordingly, the producing `Convolver` stores copies of its spectra in as
+    many alternately written buffers, since its transform output buffer is reused in every frame.
+
+    Cached spectra are provided as read-only views, since they are shared between all consumers
+    within a processing frame. The cache is only effective for clients running their process
+    callbacks in the same process, hence it has no effect on isolated clients (see
+    `system_config.IS_RENDERER_PROCESS_ISOLATION`).
+    """
+
+    GENERATION_COUNT = 2
+    """Number of most recent processing frames whose spectra are kept."""
+    _GENERATIONS = ()
+    """Global tuple of the JACK frame time and dictionary of cached input block spectra of the
+    most recent processing frames, newest first. The tuple is only ever replaced as a whole."""
+    _LOCK = threading.Lock()
+    """Lock serializing the creation of new generations."""
+
+    @staticmethod
+    def get(key):
+        """
+        Parameters
+        ----------
+        key : tuple
+            identifier of the input block spectrum, the first element being the JACK frame time
+
+        Returns
+        -------
+        numpy.ndarray or None
+            read-only complex input block spectrum, `None` in case it was not cached yet
+        """
+        for frame_time, spectra in InputSpectrumCache._GENERATIONS:
+            if frame_time == key[0]:
+                return spectra.get(key)
+        return None
+
+    @staticmethod
+    def put(key, spectrum):
+        """
+        Parameters
+        ----------
+        key : tuple
+            identifier of the input block spectrum, the first element being the JACK frame time
+        spectrum : numpy.ndarray
+            complex input block spectrum, which must not be altered while its processing frame is
+            one of the `GENERATION_COUNT` most recent ones
+
+        Returns
+        -------
+        numpy.ndarray
+            read-only view of the stored input block spectrum
+        """
+        spectrum = spectrum.view()
+        spectrum.flags.writeable = False
+        InputSpectrumCache._get_spectra(key[0])[key] = spectrum
+        return spectrum
+
+    @staticmethod
+    def _get_spectra(frame_time):
+        """
+        Parameters
+        ----------
+        frame_time : int
+            JACK frame time of the processing frame
+
+        Returns
+        -------
+        dict
+            cached input block spectra of the processing frame, a new generation is created in
+            case it does not exist yet
+        """
+        for generation_frame_time, spectra in InputSpectrumCache._GENERATIONS:
+            if generation_frame_time == frame_time:
+                return spectra
+
+        with InputSpectrumCache._LOCK:
+            # generation might have been created by another callback in the meantime
+            generations = InputSpectrumCache._GENERATIONS
+            for generation_frame_time, spectra in generations:
+                if generation_frame_time == frame_time:
+                    return spectra
+
+            spectra = {}
+            # replace reference at once, discarding the spectra of the oldest frame
+            InputSpectrumCache._GENERATIONS = ((frame_time, spectra),) + generations[
+                : InputSpectrumCache.GENERATION_COUNT - 1
+            ]
+            return spectra
+
+    @staticmethod
+    def clear():
+        """Discard all cached spectra, helpful to prevent artifacts when switching
+        configurations."""
+        with InputSpectrumCache._LOCK:
+            InputSpectrumCache._GENERATIONS = ()
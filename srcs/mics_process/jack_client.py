@@ -1,15 +1,37 @@
 import logging
 from operator import is_
 from os import system
+from threading import Event, Thread
 import jack
 import numpy as np
 from . import tools, system_config, mp_context
 from .subprocess import SubProcess 
 from .delay_buffer import DelayBuffer
-from time import sleep
+from .flight_recorder import FlightRecorder
+from .realtime import RealtimeAudit
+from .stage_timer import StageTimer
+from .telemetry import Telemetry
+from time import perf_counter, sleep
 
 
 class JackClient(SubProcess): 
+    _ISOLATED_FUNCTIONS = (
+        "get_server_ports",
+        "get_client_outputs",
+        "client_register_and_connect_inputs",
+        "set_input_delay_ms",
+        "set_output_mute",
+        "set_output_volume_db",
+        "set_output_volume_relative_db",
+        "set_output_volume_port_relative_db",
+        "set_monitor_demand",
+        "get_is_audible",
+        "get_sample_rate",
+        "get_cpu_load",
+    )
+    """Names of all functions being executed inside of the spawned process, in case the instance
+    is isolated (see `SubProcess`)."""
+
     def __init__(
             self, 
             name,
@@ -37,10 +59,18 @@ class JackClient(SubProcess):
         self._output_mute = False
         self._output_volume = pow(10, output_volume_dbfs / 20.0)
         self._output_volume_relative = None
+        self._input_source_key = None
+        self._output_connection_count = 0
+        self._is_monitor_demand = True
         self._event_ready = mp_context.Event()
         self._counter_dropout = mp_context.Value("i")
-        self.cpu_load_counter = 0
-        self.level_print_counter = 0
+        # preallocated block receiving the input from JACK, see `_get_input_target_td()`
+        self._input_block_td = None
+        # combined output volume per port, see `_update_output_gain()`
+        self._output_gain = None
+        # maximum output peaks per port since the last report, see `_report_clipping()`
+        self._clip_peaks = None
+        self._event_clip = Event()
         # self.client = jack.Client(client_name, servername=servername)
 
         self._init_client(block_length)
@@ -50,6 +80,94 @@ class JackClient(SubProcess):
             delay_ms=input_delay_ms,
         )
 
+        self._init_callbacks()
+
+        # setting up OSC sender
+        self._init_osc_client()
+        # timing of processing stages, collected outside of the JACK callback
+        self._stage_timer = (
+            StageTimer(
+                name=self.name,
+                block_length=self._client.blocksize,
+                sample_rate=self._client.samplerate,
+            )
+            if StageTimer.get_is_enabled()
+            else None
+        )
+        # recording of the last blocks, dumped on xruns outside of the JACK callback
+        self._flight_recorder = (
+            FlightRecorder(
+                name=self.name, event_terminate=self._event_terminate, logger=self._logger
+            )
+            if FlightRecorder.get_is_enabled()
+            else None
+        )
+        # metering and load reporting outside of the JACK callback
+        self._telemetry = Telemetry(
+            logger=self._logger,
+            event_terminate=self._event_terminate,
+            osc_client=self._osc_client,
+            osc_name=self._osc_name,
+            get_system_load=self.get_cpu_load if self._is_main_client else None,
+            stage_timer=self._stage_timer,
+        )
+
+    def _init_client(self, block_length):
+        """
+        Initialize JACK client specific attributes.
+
+        Parameters
+        ----------
+        block_length : int block length in samples of the JACK client, must be a power of 2.
+            Since this is a global setting for the JACK server, the last setting always gets
+            applied. This should only be called before having any clients active, since the
+            processing flow will be interrupted.
+
+        Raises
+        ------
+        ValueError
+            in case invalid block length is given
+        """
+        self._logger.info("initializing JACK client ...")
+
+        # check for valid name length
+        max_name_length = jack.client_name_size() - 2
+        if len(self.name) > max_name_length:
+            self._logger.warning(
+                f"name with {len(self.name)} characters is too long (OS specific limit is "
+                f"{max_name_length})."
+            )
+            self.name = self.name[:max_name_length]
+            self._logger.warning(f'name got shortened to "{self.name}".')
+
+        self._client = jack.Client(name=self.name)
+        if block_length:
+            if not bool(block_length and not (block_length & (block_length - 1))):
+                self._logger.error(
+                    f"provided blocksize of {block_length} is not a power of 2."
+                )
+                raise ValueError(f'failed to create "{self.name}" instance.')
+
+            self._client.blocksize = block_length
+
+        if self._is_main_client:
+            if self._client.status.server_started:
+                self._logger.warning(
+                    "[INFO]  JACK server was started for this application."
+                )
+            else:
+                self._logger.warning("[INFO]  JACK server was already running.")
+        if self._client.status.name_not_unique:
+            self._logger.warning(
+                f"assigned unique name to JACK client [{self._client.name!r}]."
+            )
+
+    def _init_callbacks(self):
+        """Register all callbacks of the JACK client, which are executed in the process owning
+        the client."""
+        # check once, since this is evaluated in every callback
+        is_audit = RealtimeAudit.get_is_enabled()
+
         @self._client.set_process_callback
         def process(frames):
             """
@@ -68,14 +186,36 @@ class JackClient(SubProcess):
             # this should not be necessary here, but prevents errors when restarting `JackPlayer`
             
             #self._event_ready.wait()
-            self.increment_counters()
             # receive, process and deliver audio blocks
-            
-            self._process_deliver(self._process(self._process_receive()))
-
-            # measure and log / provide individual client and overall system load
-            
-            self._report_load()
+            if is_audit:
+                RealtimeAudit.begin(self._client.name)
+            try:
+                if self._flight_recorder:
+                    start = perf_counter()
+                if self._stage_timer:
+                    self._stage_timer.begin()
+                input_td = self._process_receive()
+                StageTimer.mark(StageTimer.RECEIVE)
+                output_td = self._process(input_td)
+                StageTimer.mark(StageTimer.PROCESS)
+                self._process_deliver(output_td)
+                StageTimer.mark(StageTimer.DELIVER)
+
+                # measure and provide individual client load, delivered by `Telemetry`
+                self._report_load()
+                if self._stage_timer:
+                    self._stage_timer.end()
+                if self._flight_recorder:
+                    self._flight_recorder.record(
+                        start=start,
+                        frame_time=self._client.last_frame_time,
+                        orientation_deg=self._get_flight_orientation(),
+                        stages_sec=self._stage_timer.get_snapshot() if self._stage_timer else None,
+                    )
+            finally:
+                # uninstall auditing also in case the processing raised an error
+                if is_audit:
+                    RealtimeAudit.end()
 
         @self._client.set_shutdown_callback
         def shutdown(status, reason):
@@ -130,6 +270,19 @@ class JackClient(SubProcess):
                 self._logger.debug(
                     f'{["disconnected", "connected"][connect]} JACK {a} and {b}.'
                 )
+                # track if anybody receives the output, see `get_is_audible()`
+                self._output_connection_count += 1 if connect else -1
+            elif isinstance(b, jack.OwnPort) and self._input_source_key is not None:
+                # input blocks are only identifiable as long as the connections match the known
+                # source ports, see `_set_input_source_key()`
+                input_names = [port.name for port in self._client.inports]
+                if b.name in input_names:
+                    i = input_names.index(b.name)
+                    if (
+                        i >= len(self._input_source_key)
+                        or (self._input_source_key[i] == a.name) != connect
+                    ):
+                        self._input_source_key = None
 
         try:
 
@@ -161,59 +314,9 @@ class JackClient(SubProcess):
                 )
             with self._counter_dropout.get_lock():
                 self._counter_dropout.value += 1
-
-        # setting up OSC sender
-        self._init_osc_client()
-
-    def _init_client(self, block_length):
-        """
-        Initialize JACK client specific attributes.
-
-        Parameters
-        ----------
-        block_length : int block length in samples of the JACK client, must be a power of 2.
-            Since this is a global setting for the JACK server, the last setting always gets
-            applied. This should only be called before having any clients active, since the
-            processing flow will be interrupted.
-
-        Raises
-        ------
-        ValueError
-            in case invalid block length is given
-        """
-        self._logger.info("initializing JACK client ...")
-
-        # check for valid name length
-        max_name_length = jack.client_name_size() - 2
-        if len(self.name) > max_name_length:
-            self._logger.warning(
-                f"name with {len(self.name)} characters is too long (OS specific limit is "
-                f"{max_name_length})."
-            )
-            self.name = self.name[:max_name_length]
-            self._logger.warning(f'name got shortened to "{self.name}".')
-
-        self._client = jack.Client(name=self.name)
-        if block_length:
-            if not bool(block_length and not (block_length & (block_length - 1))):
-                self._logger.error(
-                    f"provided blocksize of {block_length} is not a power of 2."
-                )
-                raise ValueError(f'failed to create "{self.name}" instance.')
-
-            self._client.blocksize = block_length
-
-        if self._is_main_client:
-            if self._client.status.server_started:
-                self._logger.warning(
-                    "[INFO]  JACK server was started for this application."
-                )
-            else:
-                self._logger.warning("[INFO]  JACK server was already running.")
-        if self._client.status.name_not_unique:
-            self._logger.warning(
-                f"assigned unique name to JACK client [{self._client.name!r}]."
-            )
+            if self._flight_recorder:
+                # dump what happened during the last blocks outside of the JACK callback
+                self._flight_recorder.trigger(delay)
 
     def start(self):
         """
@@ -224,12 +327,26 @@ class JackClient(SubProcess):
         """
         super().start()
 
+        # reporting of an isolated instance is started by the spawned process
+        if not self._is_isolated:
+            self._start_reporting()
+
         # prevent setting _event_ready if called by an overridden function
         if type(self) is JackClient:  # do not replace with `isinstance()`
             self._logger.info("activating JACK client ...")
             self._client.activate()
             self._event_ready.set()
     
+    def _start_reporting(self):
+        """Start reporting clipping, levels and load measured during processing outside of the
+        JACK callback. This is done by the process owning the JACK client."""
+        if self._is_detect_clipping:
+            Thread(target=self._report_clipping, name=f"{self.name}-clip", daemon=True).start()
+        if self._is_measure_levels or self._is_measure_load or self._stage_timer:
+            self._telemetry.start()
+        if self._flight_recorder:
+            self._flight_recorder.start()
+
     def run(self):
         """
         Overrides the `multiprocessing.Process` function which is automatically called by
@@ -247,6 +364,12 @@ class JackClient(SubProcess):
         Extends the `multiprocessing.Process` function to terminate the process, the JACK client
         and generate some logging messages.
         """
+        if self._is_isolated:
+            # the JACK client is owned and closed by the spawned process
+            self._logger.info("terminating JACK client ...")
+            super().terminate()
+            return
+
         if self._event_ready.is_set():
             self.terminate_members()
 
@@ -266,6 +389,29 @@ class JackClient(SubProcess):
         sleep(0.05)
         self._client.deactivate()  # this is likely to not succeed if called by instance itself
 
+    def _to_transferable(self, value):
+        """
+        Extends the `SubProcess` function to transfer JACK ports by their names, which are
+        accepted by all functions connecting ports.
+
+        Parameters
+        ----------
+        value : Any
+            parameter or result of an isolated function
+
+        Returns
+        -------
+        Any
+            representation of the value which can be transferred between processes
+        """
+        if isinstance(value, jack.Port):
+            return value.name
+        if isinstance(value, jack.Ports):
+            return [port.name for port in value]
+        if type(value) in (list, tuple):
+            return type(value)(self._to_transferable(v) for v in value)
+        return super()._to_transferable(value)
+
     def get_server_ports(self,is_audio = True, is_midi = False, is_input=False, is_output = False):
 
         return self._client.get_ports(is_audio=is_audio,is_midi=is_midi,is_input=is_input,is_output=is_output)
@@ -354,18 +500,48 @@ class JackClient(SubProcess):
             # connect source to input ports
             for src, dst in zip(source_ports, self._client.inports):
                 self._client.connect(src, dst)
+        self._set_input_source_key(source_ports if is_connect else None)
 
         # restore beforehand execution state
         if event_ready_state_before:
             self._event_ready.set()
 
-    def increment_counters(self):
-        self.cpu_load_counter+=1
-        self.level_print_counter+=1
-        if(self.cpu_load_counter>=1000):
-            self.cpu_load_counter=0
-        if(self.level_print_counter>=1000):
-            self.level_print_counter=0
+    def _set_input_source_key(self, source_ports):
+        """
+        Store the names of the source ports connected to the input ports, identifying input blocks
+        that are received identically by other clients (see `InputSpectrumCache`).
+
+        Parameters
+        ----------
+        source_ports : jack.Ports or list of str or None
+            source ports being connected to the input ports in a 1:1 relation, if `None` is given
+            the input blocks are not identifiable
+        """
+        self._input_source_key = (
+            tuple(getattr(src, "name", src) for src in source_ports)
+            if source_ports
+            else None
+        )
+
+    def _get_input_spectrum_key(self):
+        """
+        Returns
+        -------
+        tuple or None
+            identifier of the current input block consisting of the JACK frame time, the connected
+            source port names and the input delay, `None` in case the connected source ports are
+            not known or sharing input spectra is disabled
+        """
+        if (
+            not system_config.IS_SHARED_INPUT_SPECTRUM
+            or self._input_source_key is None
+        ):
+            return None
+        return (
+            self._client.last_frame_time,
+            self._input_source_key,
+            self._input_buffer.get_delay_blocks(),
+        )
 
     # noinspection DuplicatedCode
     def _client_register_outputs(self, output_count):
@@ -397,6 +573,13 @@ class JackClient(SubProcess):
         self._output_volume_relative = np.ones(
             shape=(output_count, 1), dtype=np.float32
         )
+        self._update_output_gain()
+        self._clip_peaks = np.zeros(output_count, dtype=np.float32)
+        self._telemetry.init(
+            channel_count=output_count if self._is_measure_levels else 0,
+            block_length=self._client.blocksize,
+            sample_rate=self._client.samplerate,
+        )
 
     def _client_register_and_connect_outputs(self, target_ports=True):
         """
@@ -683,12 +866,26 @@ class JackClient(SubProcess):
             self._logger.info(f"{log_str} to {value_db_fs:+.1f} dBFS.")
 
         
+        self._update_output_gain()
+
         # print warning for positive dB_FS gain
-        if np.greater(self._output_volume * self._output_volume_relative, 1).any():
+        if np.greater(self._output_gain, 1).any():
             self._logger.warning("setting output volume > 0 dBFS.")
 
         return value_db_fs
 
+    def _update_output_gain(self):
+        """
+        Combine the global and relative output volumes into one gain per output port, so they
+        are not multiplied in every processing frame. The array is replaced instead of altered in
+        place, so the processing never uses a partially updated state.
+        """
+        if self._output_volume_relative is None:
+            return
+        self._output_gain = (self._output_volume * self._output_volume_relative).astype(
+            np.float32
+        )
+
     def _process_receive(self):
         """
         Gather input audio blocks from JACK. Optionally the memory structure of the data will be
@@ -704,19 +901,21 @@ class JackClient(SubProcess):
         When receiving the input arrays from JACK it is necessary to store copies when data needs
         to persist longer then this processing frame. This applies here, since at least one block
         is buffered and shifted internally even for un-partitioned convolution. In the current
-        implementation `np.vstack()` creates a copy of the data.
+        implementation the data is copied once into the array provided by
+        `_get_input_target_td()`, without allocating memory.
         """
         if not self._client.inports or not system_config.IS_RUNNING.is_set():
             return None
 
-        # receive input from JACK, `np.vstack()` creates a copy
-        input_td = np.vstack([port.get_array() for port in self._client.inports])
+        # receive input from JACK, creates a copy
+        input_td = self._get_input_target_td()
+        for channel, port in enumerate(self._client.inports):
+            input_td[channel] = port.get_array()
 
         # buffer and delay input
         input_td = self._input_buffer.process_block(input_td)
 
-        # TODO: prevent all dynamic variable allocations
-        # self._logger.info(id(input_td))
+        # dynamic allocations in the process callback can be audited, see `RealtimeAudit`
 
         # # check array structure
         # if not input_td.flags["C_CONTIGUOUS"]:
@@ -724,6 +923,25 @@ class JackClient(SubProcess):
 
         return input_td
     
+    def _get_input_target_td(self):
+        """
+        Provide the array the input block from JACK is written into. This implementation returns
+        a persistent array, which is only reallocated in case the number of input ports or the
+        block size changed. A deriving class may override this function to let the input be
+        written into its processing buffers directly.
+
+        Returns
+        -------
+        numpy.ndarray
+            array receiving the input block of size [number of input ports; block length]
+        """
+        shape = (len(self._client.inports), self._client.blocksize)
+        if self._input_block_td is None or self._input_block_td.shape != shape:
+            self._input_block_td = np.zeros(
+                shape, dtype=np.float32 if self._is_single_precision else np.float64
+            )
+        return self._input_block_td
+
     def _process(self, input_td):
         """
         Process block of audio data. This implementation provides a straight passthrough
@@ -740,9 +958,9 @@ class JackClient(SubProcess):
         numpy.ndarray
             processed block of audio data that will be delivered to JACK
         """
-        # straight passthrough
+        # straight passthrough, skipping processing of inaudible clients is provided by
+        # `JackRenderer`, see `get_is_audible()`
         return input_td
-        # TODO: skip processing in case output is muted or volume is 0?
 
     def _process_deliver(self, output_td):
         """
@@ -757,120 +975,158 @@ class JackClient(SubProcess):
         output_td : numpy.ndarray or None
             processed block of audio data that will be delivered to JACK
         """
-        if self._event_terminate.is_set():
+        if self._event_terminate.is_set() or not self._client.outports:
             return
 
         if self._output_mute or output_td is None:
-            # output zeros
+            if self._is_measure_levels:
+                self._telemetry.put_silence()
+
+            # output zeros (in every cycle, since JACK may reuse the buffers of output ports)
             for port in self._client.outports:
                 port.get_array().fill(0)
+            return
 
-        else:
-            # apply output volume (scaling for all channels) as well as relative differences (
-            # between channels)
-            output_td *= self._output_volume * self._output_volume_relative
+        # check array structure and dtype (first processing frame only)
+        if self._is_first_frame:
+            self._is_first_frame = False
+            if output_td[0].flags["C_CONTIGUOUS"]:
+                self._logger.debug(f'output array layout is "C_CONTIGUOUS".')
+            else:
+                self._logger.warning(f'output array layout is not "C_CONTIGUOUS".')
+            if (self._is_single_precision and output_td.dtype == np.float32) or (
+                not self._is_single_precision and output_td.dtype == np.float64
+            ):
+                self._logger.debug(
+                    f'output array dtype is "{output_td.dtype}" as requested.'
+                )
+            elif self._is_single_precision and output_td.dtype != np.float32:
+                self._logger.warning(
+                    f'output array dtype is "{output_td.dtype}" instead of {np.float32}.'
+                )
+            elif not self._is_single_precision and output_td.dtype != np.float64:
+                self._logger.warning(
+                    f'output array dtype is "{output_td.dtype}" instead of {np.float64}.'
+                )
+            else:
+                self._logger.warning(
+                    f'output array dtype is unexpected: "{output_td.dtype}".'
+                )
+
+        # regarding maximum number of ports or result channels, the real part of complex
+        # results is a view without copy
+        channel_count = min(output_td.shape[0], len(self._client.outports))
+        output_td = output_td[:channel_count].real
+        gain = self._output_gain[:channel_count]
+
+        if self._is_detect_clipping or self._is_measure_levels:
+            # determine peaks of all channels at once
+            peaks = np.maximum(output_td.max(axis=-1), -output_td.min(axis=-1)) * gain[:, 0]
+
+            # check for clipping, reported by `_report_clipping()`
+            if self._is_detect_clipping and peaks.max() > 1:
+                np.maximum(
+                    self._clip_peaks[:channel_count], peaks, out=self._clip_peaks[:channel_count]
+                )
+                self._event_clip.set()
+
+            # provide levels, reported by `Telemetry`
             if self._is_measure_levels:
-                if(self.cpu_load_counter%100):
-            
-                    # calculate RMS level
-                    rms = tools.calculate_rms(output_td, is_level=True)
-                    if self._osc_client:
-                        # OSC only works with float64, see
-                        # https://github.com/attwad/python-osc/issues/102
-                        self._osc_client.send_message(
-                            f"{self._osc_name}/rms", np.round(rms, 1).astype(np.float64)
-                        )
-                    else:
-                        log_str = np.array2string(
-                            rms, separator=",", precision=1, floatmode="fixed", sign="+"
-                        )
-                        self._logger.info(f"output RMS level [{log_str}]")
-
-                    # calculate PEAK level
-                    peak = tools.calculate_peak(output_td, is_level=True)
-                    if self._osc_client:
-                        # OSC only works with float64, see
-                        # https://github.com/attwad/python-osc/issues/102
-                        self._osc_client.send_message(
-                            f"{self._osc_name}/peak", np.round(peak, 2).astype(np.float64)
-                        )
-                    else:
-                        log_str = np.array2string(
-                            peak, separator=",", precision=2, floatmode="fixed", sign="+"
-                        )
-                        self._logger.debug(f"output PEAK level [{log_str}]")
-
-            # check array structure and dtype (first processing frame only)
-            if self._is_first_frame:
-                self._is_first_frame = False
-                if output_td[0].flags["C_CONTIGUOUS"]:
-                    self._logger.debug(f'output array layout is "C_CONTIGUOUS".')
-                else:
-                    self._logger.warning(f'output array layout is not "C_CONTIGUOUS".')
-                if (self._is_single_precision and output_td.dtype == np.float32) or (
-                    not self._is_single_precision and output_td.dtype == np.float64
-                ):
-                    self._logger.debug(
-                        f'output array dtype is "{output_td.dtype}" as requested.'
-                    )
-                elif self._is_single_precision and output_td.dtype != np.float32:
-                    self._logger.warning(
-                        f'output array dtype is "{output_td.dtype}" instead of {np.float32}.'
-                    )
-                elif not self._is_single_precision and output_td.dtype != np.float64:
-                    self._logger.warning(
-                        f'output array dtype is "{output_td.dtype}" instead of {np.float64}.'
-                    )
-                else:
-                    self._logger.warning(
-                        f'output array dtype is unexpected: "{output_td.dtype}".'
-                    )
+                self._telemetry.put_levels(output_td, gain[:, 0], peaks)
 
-            # regarding maximum number of ports or result channels
-            for data, port in zip(output_td, self._client.outports):
-                # check for clipping
-                peak = np.abs(data).max()
-                if self._is_detect_clipping and peak > 1:
-                    self._logger.warning(
-                        f"output clipping detected ({port.shortname} @ {peak:.2f})."
-                    )
+        # deliver output to JACK, output volume is applied while writing into the port buffers
+        for data, port_gain, port in zip(output_td, gain, self._client.outports):
+            np.multiply(data, port_gain, out=port.get_array())
 
-                # deliver output to JACK
-                port.get_array()[:] = data  # assigning to a slice creates a copy
+        # regarding ports greater then result channels, in every cycle since JACK may reuse the
+        # buffers of output ports
+        for port in self._client.outports[channel_count:]:
+            port.get_array().fill(0)
 
-            # regarding ports greater then result channels
-            for port in self._client.outports[output_td.shape[0] :]:
-                # output zeros
-                port.get_array().fill(0)
+    def _report_clipping(self):
+        """
+        Log output clipping detected by `_process_deliver()`, at most once per
+        `system_config.CLIENT_CLIPPING_REPORT_SEC`. This is run in a background thread, so no
+        logging happens during processing.
+        """
+        while not self._event_terminate.is_set():
+            if not self._event_clip.wait(timeout=1):
+                continue
+            self._event_clip.clear()
+
+            peaks = self._clip_peaks.copy()
+            self._clip_peaks.fill(0)
+            ports = ", ".join(
+                f"{port.shortname} @ {peak:.2f}"
+                for port, peak in zip(self._client.outports, peaks)
+                if peak > 1
+            )
+            self._logger.warning(f"output clipping detected ({ports}).")
 
-    def _report_load(self):
+            # limit rate of reports
+            self._event_terminate.wait(timeout=system_config.CLIENT_CLIPPING_REPORT_SEC)
+
+    def _get_flight_orientation(self):
         """
-        Deliver via OSC (or log otherwise) individual client load based on reported JACK frame
-        times. Furthermore deliver (or log) overall system load based on a prediction by JACK.
-        Latter is is done only when configured as a main client.
+        Returns
+        -------
+        numpy.ndarray or None
+            current tracker azimuth, elevation and tilt in degrees, in case the client renders
+            depending on a tracker, see `FlightRecorder`
         """
-        if(self.cpu_load_counter%100):
-            if not self._is_measure_load or not system_config.IS_RUNNING.is_set():
-                return
+        return None
 
-            if self._is_main_client:
-                # overall JACK system CPU load<r
-                load = round(self.get_cpu_load(), 1)
-                if self._osc_client:
-                    self._osc_client.send_message("/load", load)
-                else:
-                    self._logger.debug(f"load system percent [{load}]")
+    def _report_load(self):
+        """
+        Provide the individual client load based on reported JACK frame times and publish the
+        measurements of the current processing frame, which are delivered via OSC (or logged
+        otherwise) by `Telemetry`. Furthermore the overall system load based on a prediction by
+        JACK is delivered, in case configured as a main client.
+        """
+        if not (self._is_measure_load or self._is_measure_levels):
+            return
 
+        t_percent = 0
+        if self._is_measure_load and system_config.IS_RUNNING.is_set():
             # individual client JACK system load
             t_percent = self._client.frame_time - self._client.last_frame_time
-            t_percent = round(100 * t_percent / self._client.blocksize)
-            if t_percent < 0:
-                t_percent = 0
+            t_percent = max(round(100 * t_percent / self._client.blocksize), 0)
+        self._telemetry.commit(t_percent)
 
-            if self._osc_client:
-                self._osc_client.send_message(f"{self._osc_name}/load", t_percent)
-            else:
-                self._logger.debug(f"load percent [{t_percent}]")
+    def set_monitor_demand(self, new_state=True):
+        """
+        Parameters
+        ----------
+        new_state : bool, optional
+            if the output of the client is currently listened to by a monitor, see `JackMonitor`
+
+        Returns
+        -------
+        bool
+            actually realized monitor demand state
+        """
+        self._is_monitor_demand = bool(new_state)
+        return self._is_monitor_demand
+
+    def get_is_audible(self):
+        """
+        Returns
+        -------
+        bool
+            if the output of the client is currently audible at all, i.e., it is not muted, the
+            output volume is not zero, at least one output port is connected and it is demanded
+            by a monitor (see `set_monitor_demand()`)
+        """
+        return (
+            not self._output_mute
+            and self._output_volume > 0
+            and (
+                self._output_volume_relative is None
+                or bool(np.any(self._output_volume_relative))
+            )
+            and self._output_connection_count > 0
+            and self._is_monitor_demand
+        )
 
     def _check_alive(self, msg=""):
         """
@@ -894,6 +1150,15 @@ class JackClient(SubProcess):
 
         return False
 
+    def get_sample_rate(self):
+        """
+        Returns
+        -------
+        int
+             sampling frequency of the JACK server (would be reported identically by all clients)
+        """
+        return self._client.samplerate
+
     def get_cpu_load(self):
         """
         Returns
@@ -12,6 +12,10 @@ class JackMonitor(JackClient):
     ----------
     _is_passthrough : bool
         if JACK client should passthrough signals without any processing
+    _is_demand_driven : bool
+        if only the client providing the currently listened binaural input is considered to be
+        audible, so all other source clients (and the clients feeding them) can skip their
+        processing (see `JackRenderer.DemandMode`)
     """
 
 
@@ -20,11 +24,22 @@ class JackMonitor(JackClient):
         name,
         OSC_port,
         block_length,
+        is_demand_driven=False,
         *args,
         **kwargs,
     ):
-    
+        """
+        Extends the `JackClient` function to initialize a new JACK client and process.
+
+        Parameters
+        ----------
+        is_demand_driven : bool, optional
+            if only the client providing the currently listened binaural input should be
+            considered audible, this assumes that the other outputs of all source clients are not
+            listened to
+        """
         super().__init__(name=name,OSC_port=OSC_port, block_length=block_length, *args, **kwargs)
+        self._is_demand_driven = is_demand_driven
         # set attributes
         self._is_passthrough = True
         self._input_count = 0
@@ -121,19 +136,66 @@ class JackMonitor(JackClient):
         if event_ready_state_before:
             self._event_ready.set()
 
-    def client_register_and_connect_new_bin_input(self, input_src_name, source_ports=True, ):
-
+    def client_register_and_connect_new_bin_input(
+        self, input_src_name, source_ports=True, source_client=None, upstream_clients=None
+    ):
+        """
+        Parameters
+        ----------
+        input_src_name : str
+            name of the binaural input
+        source_ports : jack.Ports or bool or None, optional
+            source ports for connecting the created input ports to, see
+            `client_register_and_connect_inputs()`
+        source_client : JackClient, optional
+            client providing the source ports, which is notified whether its output is listened
+            to in case of demand driven monitoring
+        upstream_clients : list of JackClient, optional
+            clients feeding the source client exclusively for this binaural input (e.g. the
+            pre-renderer of a microphone array), which are notified identically
+        """
+        channel_offset = len(self._client.inports)
         self.client_register_and_connect_inputs(source_ports=source_ports)
         _new_binaural_feed = {
             "name": input_src_name,
-            "source_ports": source_ports
+            "source_ports": source_ports,
+            "channel_offset": channel_offset,
+            "source_client": source_client,
+            "upstream_clients": [c for c in upstream_clients or [] if c is not None],
         }
         self._binaural_feeds.append(_new_binaural_feed)
+        self._update_source_demand()
+
+    def _update_source_demand(self):
+        """
+        Notify all source clients and their upstream clients whether one of their binaural inputs
+        is currently listened to, in case of demand driven monitoring.
+        """
+        if not self._is_demand_driven:
+            return
+
+        # a client might provide several binaural inputs (e.g. several listeners or arrays)
+        demands = {}
+        for i, feed in enumerate(self._binaural_feeds):
+            for client in [feed["source_client"]] + feed["upstream_clients"]:
+                if client is not None:
+                    _, is_demanded = demands.get(id(client), (client, False))
+                    demands[id(client)] = (client, is_demanded or i == self._listened_bin_input)
+        for client, is_demanded in demands.values():
+            client.set_monitor_demand(is_demanded)
 
     def choose_bin_input_to_listen(self, bin_input_index):
 
+        bin_input_index = int(bin_input_index)
+        if not 0 <= bin_input_index < len(self._binaural_feeds):
+            self._logger.error(
+                f'binaural input {bin_input_index} does not exist, "listen" ignored.'
+            )
+            return
+
         self._listened_bin_input = bin_input_index
-        self._channel_to_listen = self._listened_bin_input*2
+        self._channel_to_listen = self._binaural_feeds[bin_input_index]["channel_offset"]
+        self._update_source_demand()
         if(self._output_mute==True and self.first_time):
             self.set_output_mute(False)
             self.first_time = False
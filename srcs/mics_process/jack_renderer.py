@@ -1,10 +1,24 @@
 from asyncio.log import logger
 from copy import copy
-from time import altzone
-from . import Convolver, FilterSet, tools
-from .convolver import AdjustableFdConvolver, AdjustableShConvolver, AdjustableShConvolverMeasuredEnc
+from enum import auto, Enum
+from threading import Event, Lock, Thread
+from time import altzone, perf_counter
+
+import jack
+import numpy as np
+
+from . import Convolver, FilterSet, HeadTracker, system_config, tools
+from .convolver import (
+    AdjustableFdConvolver,
+    AdjustableShConvolver,
+    AdjustableShConvolverBatch,
+    AdjustableShConvolverMeasuredEnc,
+    AdjustableShConvolverMultiListener,
+)
 from .filter_set import FilterSetMiro, FilterSetShConfig, FilterSetSofa
 from .jack_client import JackClient
+from .realtime import RealtimeAudit, RealtimeMode
+from .stage_timer import StageTimer
 
 class JackRenderer(JackClient):
     """
@@ -17,8 +31,70 @@ class JackRenderer(JackClient):
         if JACK client should passthrough signals without any processing
     _convolver : Convolver
         providing block-wise processing of FIR filtering in the frequency domain
+    _demand_mode : JackRenderer.DemandMode or None
+        behaviour while the output is not audible, `None` to always render at full quality
+    _is_audible : bool
+        if the output was audible in the last processing frame, see `JackClient.get_is_audible()`
+    _demand_preroll_count : int
+        number of remaining blocks to be processed with silenced output after becoming audible
+    _filter_params : dict
+        parameters the current `FilterSet` was loaded and prepared with, so exchanged filter sets
+        are loaded identically, see `set_renderer_filter()`
+    _swap_thread : threading.Thread or None
+        background thread loading and preparing an exchanged `FilterSet`
+    _swap_convolver_next : Convolver or None
+        prepared instance being switched to at the next block boundary
+    _swap_convolver_last : Convolver or None
+        previous instance being faded out during the transition
+    _swap_windows_td : numpy.ndarray or None
+        time domain window samples to fade in the new instance during the transition of size
+        [`system_config.FILTER_SWAP_CROSSFADE_BLOCKS`; block length]
+    _swap_block_id : int
+        index of the current block during the transition
+    _event_swap_done : threading.Event
+        set as soon as the transition is finished, so the previous instance can be released
+    _tracker_deg : numpy.ndarray or None
+        unsynchronized view of the shared tracker data, recorded by the `FlightRecorder`
+    _isolation_block_length : int or None
+        block length of the JACK client being recreated by the spawned process, in case the
+        instance is isolated
+    _isolation_target_ports : list of str or bool or None
+        target ports being connected by the spawned process, in case the instance is isolated
     """
 
+    _ISOLATED_FUNCTIONS = JackClient._ISOLATED_FUNCTIONS + (
+        "set_client_passthrough",
+        "set_client_crossfade",
+        "set_renderer_sh_order",
+        "prepare_renderer_sh_processing",
+        "set_renderer_filter",
+        "set_renderer_array_volume_db",
+        "set_renderer_array_mute",
+        "get_pre_renderer_sh_config",
+    )
+    """Names of all functions being executed inside of the spawned process, in case the instance
+    is isolated (see `SubProcess`)."""
+
+    _PREPARE_LOCK = Lock()
+    """Lock to serialize preparations of spherical harmonics processing during runtime, since
+    `Compensation` holds a global configuration."""
+    _SWAP_TIMEOUT_SEC = 5
+    """Time in s waited for the processing to switch to an exchanged filter set (in addition to
+    the transition), before exchanging filters is cancelled."""
+
+    class DemandMode(Enum):
+        """
+        Enumeration data type used to identify the behaviour of a renderer while its output is
+        not audible. It's attributes (with an arbitrary distinct integer value) are used as
+        system wide unique constant identifiers.
+        """
+
+        SUSPEND = auto()
+        """Skip processing entirely and deliver silence."""
+
+        LOW_COST = auto()
+        """Continue processing at reduced quality and effort, see `Convolver.set_low_cost()`."""
+
     def __init__(
         self,
         name,
@@ -35,6 +111,13 @@ class JackRenderer(JackClient):
         is_measured_encoding = False,
         encoding_filter_name = None,
         encoding_filter_type = None,
+        listener_filter_names=None,
+        listener_filter_types=None,
+        listener_shared_tracker_data=None,
+        array_filter_names=None,
+        array_filter_types=None,
+        array_source_positions=None,
+        array_shared_tracker_data=None,
         ## azim_deg=0,
         ## elevs_deg = 0,
         *args,
@@ -73,12 +156,43 @@ class JackRenderer(JackClient):
              impulse response truncation level in dB relative under peak
         is_prevent_resampling : bool, optional
             if loaded filter should not be resampled
+        listener_filter_names : list of str, optional
+            file paths/names of HRIR filter files of additional listeners being rendered from the
+            same spherical harmonics decomposition, see `AdjustableShConvolverMultiListener`
+        listener_filter_types : list of FilterSet.Type or list of str, optional
+            types of HRIR filters of additional listeners being loaded
+        listener_shared_tracker_data : list of multiprocessing.Array, optional
+            shared data arrays from existing tracker instances of additional listeners
+        array_filter_names : list of str, optional
+            file paths/names of HRIR filter files of additional microphone arrays being rendered
+            in the same vectorized pass, see `AdjustableShConvolverBatch`
+        array_filter_types : list of FilterSet.Type or list of str, optional
+            types of HRIR filters of additional microphone arrays being loaded
+        array_source_positions : list of list of int or list of list of float, optional
+            rendered binaural source positions of additional microphone arrays
+        array_shared_tracker_data : list of multiprocessing.Array, optional
+            shared data arrays from existing tracker instances of additional microphone arrays
         """
         super().__init__(name=name,OSC_port=OSC_port, block_length=block_length, *args, **kwargs)
 
         # set attributes
         self._is_passthrough = True
         self._convolver = None
+        self._demand_mode = tools.transform_into_type(
+            system_config.DEMAND_MODE, JackRenderer.DemandMode
+        )
+        self._is_audible = True
+        self._demand_preroll_count = 0
+        self._filter_params = {}
+        self._swap_thread = None
+        self._swap_convolver_next = None
+        self._swap_convolver_last = None
+        self._swap_windows_td = None
+        self._swap_block_id = 0
+        self._event_swap_done = Event()
+        self._is_isolated = system_config.IS_RENDERER_PROCESS_ISOLATION
+        self._isolation_block_length = None
+        self._isolation_target_ports = None
         self._logger.warning(f"measure encoding: {is_measured_encoding}")
         self._init_convolver(
             filter_name=filter_name,
@@ -92,9 +206,21 @@ class JackRenderer(JackClient):
             is_measured_encoding = is_measured_encoding,
             encoding_filter_name = encoding_filter_name,
             encoding_filter_type = encoding_filter_type,
+            listener_filter_names=listener_filter_names,
+            listener_filter_types=listener_filter_types,
+            listener_shared_tracker_data=listener_shared_tracker_data,
+            array_filter_names=array_filter_names,
+            array_filter_types=array_filter_types,
+            array_source_positions=array_source_positions,
+            array_shared_tracker_data=array_shared_tracker_data,
             ##azim_deg = azim_deg,
             ##elevs_deg = elevs_deg
         )
+        self._tracker_deg = (
+            np.frombuffer(shared_tracker_data.get_obj(), dtype=np.float32)
+            if shared_tracker_data is not None
+            else None
+        )
     
     def _init_convolver(
         self,
@@ -109,6 +235,13 @@ class JackRenderer(JackClient):
         is_measured_encoding = False,
         encoding_filter_name = None,
         encoding_filter_type = None,
+        listener_filter_names=None,
+        listener_filter_types=None,
+        listener_shared_tracker_data=None,
+        array_filter_names=None,
+        array_filter_types=None,
+        array_source_positions=None,
+        array_shared_tracker_data=None,
         ## azim_deg,
         ## elevs_deg
     ):
@@ -139,7 +272,30 @@ class JackRenderer(JackClient):
              impulse response truncation level in dB relative under peak
         is_prevent_resampling : bool
             if loaded filter should not be resampled
+        listener_filter_names : list of str, optional
+            file paths/names of HRIR filter files of additional listeners
+        listener_filter_types : list of FilterSet.Type or list of str, optional
+            types of HRIR filters of additional listeners being loaded
+        listener_shared_tracker_data : list of multiprocessing.Array, optional
+            shared data arrays from existing tracker instances of additional listeners
+        array_filter_names : list of str, optional
+            file paths/names of HRIR filter files of additional microphone arrays
+        array_filter_types : list of FilterSet.Type or list of str, optional
+            types of HRIR filters of additional microphone arrays being loaded
+        array_source_positions : list of list of int or list of list of float, optional
+            rendered binaural source positions of additional microphone arrays
+        array_shared_tracker_data : list of multiprocessing.Array, optional
+            shared data arrays from existing tracker instances of additional microphone arrays
         """
+        self._filter_params = dict(
+            filter_type=filter_type,
+            source_positions=source_positions,
+            shared_tracker_data=shared_tracker_data,
+            sh_max_order=sh_max_order,
+            sh_is_enforce_pinv=sh_is_enforce_pinv,
+            ir_trunc_db=ir_trunc_db,
+            is_prevent_resampling=is_prevent_resampling,
+        )
         filter_set_encoding = None 
         filter_set = FilterSet.create_instance_by_type(
             file_name=filter_name,
@@ -212,6 +368,23 @@ class JackRenderer(JackClient):
                 is_prevent_logging=self._logger.disabled,
             )
 
+        listener_filter_sets = self._load_additional_filter_sets(
+            filter_names=listener_filter_names,
+            filter_types=listener_filter_types,
+            sh_max_order=sh_max_order,
+            sh_is_enforce_pinv=sh_is_enforce_pinv,
+            ir_trunc_db=ir_trunc_db,
+            is_prevent_resampling=is_prevent_resampling,
+        )
+        array_filter_sets = self._load_additional_filter_sets(
+            filter_names=array_filter_names,
+            filter_types=array_filter_types,
+            sh_max_order=sh_max_order,
+            sh_is_enforce_pinv=sh_is_enforce_pinv,
+            ir_trunc_db=ir_trunc_db,
+            is_prevent_resampling=is_prevent_resampling,
+        )
+
         self._convolver = Convolver.create_instance_by_filter_set(
             filter_set=filter_set,
             block_length=self._client.blocksize,
@@ -219,6 +392,11 @@ class JackRenderer(JackClient):
             shared_tracker_data=shared_tracker_data,
             is_measured_encoding = is_measured_encoding,
             filter_set_encoding = filter_set_encoding,
+            listener_filter_sets=listener_filter_sets,
+            listener_shared_tracker_data=listener_shared_tracker_data,
+            array_filter_sets=array_filter_sets,
+            array_source_positions=array_source_positions,
+            array_shared_tracker_data=array_shared_tracker_data,
             ## azim_deg=azim_deg,
             ## elevs_deg=elevs_deg
         )
@@ -232,6 +410,54 @@ class JackRenderer(JackClient):
 
         self._is_passthrough = False
 
+    def _load_additional_filter_sets(
+        self,
+        filter_names,
+        filter_types,
+        sh_max_order,
+        sh_is_enforce_pinv,
+        ir_trunc_db,
+        is_prevent_resampling,
+    ):
+        """
+        Create and load `FilterSet` instances of additional listeners or microphone arrays with
+        identical parameters as the main `FilterSet`.
+
+        Parameters
+        ----------
+        filter_names : list of str or None
+            file paths/names of filter files
+        filter_types : list of FilterSet.Type or list of str or None
+            types of filters being loaded
+
+        Returns
+        -------
+        list of FilterSet or None
+            loaded filter sets, `None` in case no `filter_names` were given
+        """
+        if not filter_names:
+            return None
+
+        filter_sets = []
+        for filter_name, filter_type in zip(filter_names, filter_types):
+            filter_set = FilterSet.create_instance_by_type(
+                file_name=filter_name,
+                file_type=filter_type,
+                sh_max_order=sh_max_order,
+                sh_is_enforce_pinv=sh_is_enforce_pinv,
+            )
+            filter_set.load(
+                block_length=self._client.blocksize,
+                is_single_precision=self._is_single_precision,
+                logger=self._logger,
+                ir_trunc_db=ir_trunc_db,
+                check_fs=self._client.samplerate,
+                is_prevent_resampling=is_prevent_resampling,
+                is_prevent_logging=self._logger.disabled,
+            )
+            filter_sets.append(filter_set)
+        return filter_sets
+
     def client_register_and_connect_inputs(self, source_ports=True):
         """
         Register an identical number of input ports according to the provided source ports to the
@@ -287,7 +513,12 @@ class JackRenderer(JackClient):
         elif (
             is_connect
             and len(source_ports) < convolver_port_count
-            and type(self._convolver) is AdjustableShConvolver
+            and type(self._convolver)
+            in (
+                AdjustableShConvolver,
+                AdjustableShConvolverMultiListener,
+                AdjustableShConvolverBatch,
+            )
         ):
             self._logger.warning(
                 f"skipping input connect.\n"
@@ -303,6 +534,7 @@ class JackRenderer(JackClient):
             # connect source to input ports
             for src, dst in zip(source_ports, self._client.inports):
                 self._client.connect(src, dst)
+        self._set_input_source_key(source_ports if is_connect else None)
 
         # restore beforehand execution state
         if event_ready_state_before:
@@ -352,6 +584,23 @@ class JackRenderer(JackClient):
         client_connect_target_ports : jack.Ports or bool, optional
             see `_client_register_and_connect_outputs()` for documentation
         """
+        # release before forking the process, so the memory is not kept referenced by it
+        if system_config.IS_LEAN_FILTERS:
+            self._convolver.release_unused_filter_data()
+        self._logger.info(
+            f"memory footprint of filters and buffers "
+            f"{tools.calculate_memory_footprint(self._convolver) / 1e6:.1f} MB."
+        )
+
+        if self._is_isolated:
+            # the JACK client is recreated under the identical name by the spawned process, see
+            # `_init_isolated_client()`
+            self._isolation_block_length = self._client.blocksize
+            self._isolation_target_ports = self._to_transferable(client_connect_target_ports)
+            self._client.close()
+            super().start()
+            return
+
         super().start()
 
         # run after `AdjustableShConvolver.prepare_renderer_sh_processing()` was run
@@ -362,6 +611,75 @@ class JackRenderer(JackClient):
         self._client_register_and_connect_outputs(client_connect_target_ports)
         self._event_ready.set()
 
+    def run(self):
+        """
+        Extends the `JackClient` function to run the JACK client inside of the spawned process,
+        in case the instance is isolated.
+        """
+        if self._is_isolated:
+            try:
+                self._init_isolated_client()
+            except (jack.JackError, RuntimeError, ValueError) as e:
+                self._logger.error(f"failed to run JACK client in process ({e}).")
+                return
+
+        super().run()
+
+        if self._is_isolated:
+            self._event_ready.clear()
+            self._client.deactivate()
+            self._client.close()
+
+    def _init_isolated_client(self):
+        """
+        Recreate, prepare and activate the JACK client inside of the spawned process. Thereby,
+        the processing callbacks are executed by this process with its own interpreter, while all
+        functions named in `_ISOLATED_FUNCTIONS` are forwarded here by the calling process.
+        """
+        self._init_client(self._isolation_block_length)
+        self._init_callbacks()
+
+        # run after `AdjustableShConvolver.prepare_renderer_sh_processing()` was run
+        self._convolver.init_fft_optimize(self._logger)
+
+        self._logger.debug("activating JACK client in process ...")
+        self._client.activate()
+        self._client_register_and_connect_outputs(self._isolation_target_ports)
+        self._start_reporting()
+        self._event_ready.set()
+
+        # garbage collection of this process is not controlled by the calling process
+        RealtimeMode.enable(logger=self._logger)
+        RealtimeAudit.start(logger=self._logger)
+
+    def _get_input_target_td(self):
+        """
+        Extends the `JackClient` function to let the input block from JACK be written into the
+        input buffer of the `Convolver` directly, in case no input delay is applied (see
+        `Convolver.get_input_target_td()`).
+
+        Returns
+        -------
+        numpy.ndarray
+            array receiving the input block of size [number of input ports; block length]
+        """
+        if not self._convolver._is_passthrough and not self._input_buffer.get_delay_blocks():
+            input_td = self._convolver.get_input_target_td(len(self._client.inports))
+            if input_td is not None:
+                return input_td
+        return super()._get_input_target_td()
+
+    def _get_flight_orientation(self):
+        """
+        Returns
+        -------
+        numpy.ndarray or None
+            current tracker azimuth, elevation and tilt in degrees, see `FlightRecorder`
+        """
+        if self._tracker_deg is None:
+            return None
+        return self._tracker_deg[HeadTracker.DataIndex.AZIM : HeadTracker.DataIndex.TILT + 1]
+
     def _process(self, input_td):
         """
         Process block of audio data. This implementation falls back to a straight passthrough
@@ -378,10 +696,110 @@ class JackRenderer(JackClient):
         numpy.ndarray
             processed block of audio data that will be delivered to JACK
         """
+        is_suspended = False
+        if not self._is_passthrough and input_td is not None and self._demand_mode is not None:
+            self._process_demand()
+            is_suspended = (
+                not self._is_audible
+                and self._demand_mode is JackRenderer.DemandMode.SUSPEND
+            )
+        # cross-fading is only necessary while the filter sets are audible
+        is_crossfade = not (self._is_passthrough or is_suspended)
+
+        convolver_next = self._swap_convolver_next
+        if convolver_next is not None:
+            # switch to exchanged filter set at block boundary, see `set_renderer_filter()`
+            self._swap_convolver_last = self._convolver if is_crossfade else None
+            self._convolver = convolver_next
+            self._swap_convolver_next = None
+            self._swap_block_id = 0
+            if not is_crossfade:
+                self._event_swap_done.set()
+        elif not is_crossfade and self._swap_convolver_last is not None:
+            # finish the transition at once
+            self._swap_convolver_last = None
+            self._event_swap_done.set()
+
         if self._is_passthrough:
             return super()._process(input_td)
+        if is_suspended:
+            return None
+
+        if input_td is not None:
+            # allow sharing the input spectrum with other convolvers receiving identical blocks
+            self._convolver.set_input_spectrum_key(self._get_input_spectrum_key())
+        output_td = self._convolver.filter_block(input_td)
+        if self._swap_convolver_last is not None:
+            output_td = self._process_swap(input_td, output_td)
+
+        if self._demand_preroll_count:
+            # deliver silence while buffers are refilled after becoming audible
+            self._demand_preroll_count -= 1
+            return None
+        return output_td
+
+    def _process_swap(self, input_td, output_td):
+        """
+        Cross-fade from the output of the previous to the output of the exchanged filter set
+        during the transition. Both filter sets are applied to the identical input blocks, the
+        new one starts with empty buffers which are filled during the fade in.
+
+        Parameters
+        ----------
+        input_td : numpy.ndarray or None
+            block of audio data that was received from JACK
+        output_td : numpy.ndarray or None
+            block of audio data processed by the exchanged filter set
 
-        return self._convolver.filter_block(input_td)
+        Returns
+        -------
+        numpy.ndarray or None
+            cross-faded block of audio data that will be delivered to JACK
+        """
+        if input_td is not None:
+            self._swap_convolver_last.set_input_spectrum_key(self._get_input_spectrum_key())
+        last_output_td = self._swap_convolver_last.filter_block(input_td)
+        if output_td is not None and last_output_td is not None:
+            window_in_td = self._swap_windows_td[self._swap_block_id]
+            output_td = output_td * window_in_td + last_output_td * (1 - window_in_td)
+
+        # transition also advances while no output is generated
+        self._swap_block_id += 1
+        if self._swap_block_id >= self._swap_windows_td.shape[0]:
+            # previous filter set is released by the background thread
+            self._swap_convolver_last = None
+            self._event_swap_done.set()
+        StageTimer.mark(StageTimer.CROSSFADE)
+        return output_td
+
+    # noinspection PyProtectedMember
+    def _process_demand(self):
+        """
+        Update the audible state of the output and adjust the processing accordingly. When the
+        output becomes inaudible, processing is suspended or switched to low cost mode according
+        to `_demand_mode`. When the output becomes audible again after being suspended, the
+        buffers are refilled before delivering output, for at least
+        `system_config.DEMAND_PREROLL_BLOCKS` blocks and the number of filter partitions, so the
+        first delivered block already contains the complete filter tail.
+        """
+        is_audible = self.get_is_audible()
+        if is_audible == self._is_audible:
+            return
+        self._is_audible = is_audible
+
+        if self._demand_mode is JackRenderer.DemandMode.LOW_COST:
+            # buffers are still filled while processing at reduced quality
+            self._convolver.set_low_cost(not is_audible)
+            return
+
+        if is_audible:
+            # discard outdated signal from before suspending
+            self._convolver._clear_buffers()
+            self._demand_preroll_count = max(
+                system_config.DEMAND_PREROLL_BLOCKS, self._convolver.get_block_count()
+            )
+        else:
+            self._demand_preroll_count = 0
 
     def set_client_passthrough(self, new_state=None):
         """
@@ -435,7 +853,12 @@ class JackRenderer(JackClient):
         if new_state is True and (
             not self._convolver
             or type(self._convolver)
-            not in [AdjustableFdConvolver, AdjustableShConvolver]
+            not in [
+                AdjustableFdConvolver,
+                AdjustableShConvolver,
+                AdjustableShConvolverMultiListener,
+                AdjustableShConvolverBatch,
+            ]
         ):
             self._logger.warning("This client does not support crossfade mode.")
         else:
@@ -457,7 +880,11 @@ class JackRenderer(JackClient):
         """
         if not self._check_alive("set SH processing order"):
             return
-        if not type(self._convolver) is AdjustableShConvolver:
+        if type(self._convolver) not in (
+            AdjustableShConvolver,
+            AdjustableShConvolverMultiListener,
+            AdjustableShConvolverBatch,
+        ):
             self._logger.error(
                 f'client is not rendering in spherical harmonics mode, "set SH processing order" '
                 f"ignored."
@@ -469,9 +896,10 @@ class JackRenderer(JackClient):
             )
             return
 
-        new_order = self._convolver.update_sh_processing(
-            sh_new_order=new_order, logger=self._logger
-        )
+        with JackRenderer._PREPARE_LOCK:
+            new_order = self._convolver.update_sh_processing(
+                sh_new_order=new_order, logger=self._logger
+            )
         if new_order is not None:
             self._logger.info(f"set SH processing order to {new_order:d}.")
 
@@ -488,9 +916,10 @@ class JackRenderer(JackClient):
 
         Parameters
         ----------
-        input_sh_config : FilterSetShConfig
+        input_sh_config : FilterSetShConfig or list of FilterSetShConfig
             combined filter configuration with all necessary information to transform an incoming
-            audio block into spherical harmonics sound field coefficients in real-time
+            audio block into spherical harmonics sound field coefficients in real-time, a list
+            with one configuration per array is only supported by `AdjustableShConvolverBatch`
         mrf_limit_db : int
             maximum modal amplification limit in dB
         compensation_type : str or Compensation.Type
@@ -506,7 +935,12 @@ class JackRenderer(JackClient):
             "applying spherical harmonics configuration and pre-calculating components ..."
         )
 
-        if type(self._convolver) is not AdjustableShConvolver and type(self._convolver) is not AdjustableShConvolverMeasuredEnc:
+        if type(self._convolver) not in (
+            AdjustableShConvolver,
+            AdjustableShConvolverMeasuredEnc,
+            AdjustableShConvolverMultiListener,
+            AdjustableShConvolverBatch,
+        ):
             # noinspection PyProtectedMember
             raise ValueError(
                 f"convolver type {type(self._convolver)} of filter {type(self._convolver._filter)} "
@@ -516,6 +950,307 @@ class JackRenderer(JackClient):
         self._convolver.prepare_sh_processing(
             input_sh_config, mrf_limit_db, compensation_type, self._logger
         )
+        self._filter_params["sh_processing"] = (input_sh_config, mrf_limit_db, compensation_type)
+
+    def set_renderer_filter(self, filter_name, filter_type=None):
+        """
+        Exchange the `FilterSet` of the running renderer without interrupting the audio
+        processing of this or any other client. The new filter set is loaded and prepared with
+        identical parameters as the current one in a background thread. Afterwards, the renderer
+        switches to the new filter set at a block boundary and cross-fades between the outputs of
+        both filter sets over `system_config.FILTER_SWAP_CROSSFADE_BLOCKS` blocks. While no
+        audible output is generated (passthrough or suspended, see `DemandMode`), the renderer
+        switches immediately without cross-fade. The previous filter set is released after the
+        transition, so both are only held in memory during the transition. Exchanging is cancelled
+        in case the processing does not switch in time (e.g. when the client is terminated).
+
+        Parameters
+        ----------
+        filter_name : str
+            file path/name of the new filter file
+        filter_type : FilterSet.Type or str, optional
+            type of the new filter, if not given the type of the current filter is used
+
+        Returns
+        -------
+        bool
+            if exchanging the filter set was started
+        """
+        log_str = "set filter"
+        if not self._check_alive(log_str):
+            return False
+        if not self._convolver or type(self._convolver) in (
+            AdjustableShConvolverBatch,
+            AdjustableShConvolverMeasuredEnc,
+            AdjustableShConvolverMultiListener,
+        ):
+            self._logger.error(
+                f'client does not support exchanging filters, "{log_str}" ignored.'
+            )
+            return False
+        if self._swap_thread is not None and self._swap_thread.is_alive():
+            self._logger.error(f'exchanging filters already in progress, "{log_str}" ignored.')
+            return False
+
+        self._swap_thread = Thread(
+            target=self._swap_filter,
+            args=(filter_name, filter_type or self._filter_params["filter_type"]),
+            name=f"{self.name}-swap",
+            daemon=True,
+        )
+        self._swap_thread.start()
+        return True
+
+    # noinspection PyProtectedMember
+    def _swap_filter(self, filter_name, filter_type):
+        """
+        Load and prepare the exchanged `FilterSet` and provide the resulting `Convolver` to the
+        processing, afterwards wait for the transition to finish and release the previous
+        instance. This is run in a background thread, see `set_renderer_filter()`.
+
+        Parameters
+        ----------
+        filter_name : str
+            file path/name of the new filter file
+        filter_type : FilterSet.Type or str
+            type of the new filter
+        """
+        start = perf_counter()
+        params = self._filter_params
+        try:
+            filter_set = FilterSet.create_instance_by_type(
+                file_name=filter_name,
+                file_type=filter_type,
+                sh_max_order=params["sh_max_order"],
+                sh_is_enforce_pinv=params["sh_is_enforce_pinv"],
+            )
+            if filter_set is None:
+                raise ValueError("no filter name or filter type given")
+
+            # plots are not generated, since `matplotlib` is not thread-safe
+            filter_set.load(
+                block_length=self._client.blocksize,
+                is_single_precision=self._is_single_precision,
+                logger=self._logger,
+                ir_trunc_db=params["ir_trunc_db"],
+                check_fs=self._client.samplerate,
+                is_prevent_resampling=params["is_prevent_resampling"],
+                is_prevent_logging=True,
+            )
+            convolver = Convolver.create_instance_by_filter_set(
+                filter_set=filter_set,
+                block_length=self._client.blocksize,
+                source_positions=params["source_positions"],
+                shared_tracker_data=params["shared_tracker_data"],
+            )
+            if "sh_processing" in params:
+                with JackRenderer._PREPARE_LOCK:
+                    convolver.prepare_sh_processing(
+                        *params["sh_processing"], logger=self._logger, is_plot=False
+                    )
+            self._check_swap_sh_configuration(filter_set)
+            if type(convolver) is not type(self._convolver) or (
+                convolver.get_input_channel_count(),
+                convolver.get_output_channel_count(),
+            ) != (
+                self._convolver.get_input_channel_count(),
+                self._convolver.get_output_channel_count(),
+            ):
+                raise ValueError(
+                    f"{type(convolver).__name__} with "
+                    f"{convolver.get_input_channel_count()} inputs and "
+                    f"{convolver.get_output_channel_count()} outputs is incompatible to the "
+                    f"current configuration"
+                )
+
+            # adopt current rendering states
+            convolver.set_passthrough(self._convolver._is_passthrough)
+            convolver.set_low_cost(self._convolver._is_low_cost)
+            if hasattr(self._convolver, "_is_crossfade"):
+                convolver.set_crossfade(self._convolver._is_crossfade)
+            if system_config.IS_LEAN_FILTERS:
+                convolver.release_unused_filter_data()
+            convolver.init_fft_optimize(self._logger)
+        except (ValueError, OSError, RuntimeError, NotImplementedError) as e:
+            self._logger.error(f'loading "{filter_name}" failed ({e}), "set filter" ignored.')
+            return
+
+        # calculate SINE-Square fade in windows over all transition blocks
+        block_count = max(system_config.FILTER_SWAP_CROSSFADE_BLOCKS, 1)
+        window_in_td = np.arange(
+            block_count * self._client.blocksize, dtype=filter_set.get_dirac_td().dtype
+        )
+        window_in_td = np.square(
+            np.sin(window_in_td * np.pi / (2 * (window_in_td.shape[0] - 1)))
+        )
+        self._swap_windows_td = window_in_td.reshape(block_count, -1)
+
+        # keep previous instance referenced until the transition is finished, so it is not
+        # released in the processing thread
+        last_convolver = self._convolver
+
+        # hand over to the processing, which switches at the next block boundary
+        self._event_swap_done.clear()
+        self._swap_convolver_next = convolver
+        self._logger.info(
+            f'prepared "{filter_name}" in {perf_counter() - start:.2f} s, switching filters ...'
+        )
+        # cancel in case the processing is interrupted (e.g. client being terminated)
+        transition_sec = block_count * self._client.blocksize / self._client.samplerate
+        timeout = JackRenderer._SWAP_TIMEOUT_SEC + transition_sec
+        deadline = perf_counter() + timeout
+        while not self._event_swap_done.wait(timeout=0.1):
+            if not self._event_terminate.is_set() and perf_counter() < deadline:
+                continue
+
+            # withdraw the switch, unless the processing performed it in the meantime
+            self._swap_convolver_next = None
+            if self._convolver is not convolver:
+                self._logger.error(
+                    f'switching to "{filter_name}" was not performed by the processing within '
+                    f'{timeout:.1f} s, "set filter" cancelled.'
+                )
+                return
+            self._logger.warning(
+                f'transition to "{filter_name}" was not finished within {timeout:.1f} s.'
+            )
+            break
+
+        del last_convolver
+        self._filter_params["filter_type"] = filter_type
+        self._logger.info(f'set filter to "{filter_name}".')
+
+    # noinspection PyProtectedMember
+    def _check_swap_sh_configuration(self, filter_set):
+        """
+        Check if an exchanged filter set of a pre-renderer provides the identical spherical
+        harmonics configuration as the current one, since renderers decoding the output of this
+        client were prepared with it (see `get_pre_renderer_sh_config()`).
+
+        Parameters
+        ----------
+        filter_set : FilterSet
+            beforehand loaded exchanged filter set
+
+        Raises
+        ------
+        ValueError
+            in case the spatial sampling grid, the SH order or the array configuration differ
+        """
+        current_filter_set = self._convolver._filter
+        if (
+            not isinstance(current_filter_set, FilterSetMiro)
+            or current_filter_set._is_hrir
+            or current_filter_set._sh_max_order is None
+        ):
+            return
+
+        config = current_filter_set.get_sh_configuration()
+        new_config = (
+            filter_set.get_sh_configuration()
+            if isinstance(filter_set, FilterSetMiro) and not filter_set._is_hrir
+            else None
+        )
+        if (
+            new_config is None
+            or not np.array_equal(config.sh_m, new_config.sh_m)
+            or not np.array_equal(config.sh_bases_weighted, new_config.sh_bases_weighted)
+            or (config.arir_config is None) != (new_config.arir_config is None)
+            or (
+                config.arir_config is not None
+                and not all(
+                    np.array_equal(a, b)
+                    for a, b in zip(config.arir_config, new_config.arir_config)
+                )
+            )
+        ):
+            raise ValueError(
+                "spherical harmonics configuration (sampling grid, order or array configuration) "
+                "differs from the one connected renderers were prepared with"
+            )
+
+    def set_renderer_array_volume_db(self, array_id, value_db_fs):
+        """
+        Parameters
+        ----------
+        array_id : int or float or str
+            index of the rendered microphone array
+        value_db_fs : int or float
+            output volume of the array in Decibel_FullScale
+
+        Returns
+        -------
+        float
+            actually realized output volume of the array in Decibel_FullScale
+        """
+        log_str = "set array output volume"
+        if not self._check_alive(log_str) or not self._check_array_id(
+            array_id, log_str
+        ):
+            return
+
+        array_id = int(array_id)
+        value_db_fs = float(value_db_fs)
+        self._convolver.set_array_volume(array_id, 10 ** (value_db_fs / 20.0))
+        self._logger.info(f"{log_str} of array {array_id} to {value_db_fs:+.1f} dBFS.")
+        return value_db_fs
+
+    def set_renderer_array_mute(self, array_id, new_state=None):
+        """
+        Parameters
+        ----------
+        array_id : int or float or str
+            index of the rendered microphone array
+        new_state : bool, int, float, str or None, optional
+            new output mute state of the array, if `None` is given this function works as a
+            toggle between states
+
+        Returns
+        -------
+        bool
+            actually realized output mute state of the array
+        """
+        log_str = "set array mute state"
+        if not self._check_alive(log_str) or not self._check_array_id(
+            array_id, log_str
+        ):
+            return
+
+        array_id = int(array_id)
+        new_state = tools.transform_into_state(new_state, logger=self._logger)
+        new_state = self._convolver.set_array_mute(array_id, new_state)
+        self._logger.info(
+            f'{log_str} of array {array_id} to {["OFF", "ON"][new_state]}.'
+        )
+        return new_state
+
+    def _check_array_id(self, array_id, log_str):
+        """
+        Parameters
+        ----------
+        array_id : int or float or str
+            index of the rendered microphone array
+        log_str : str
+            description of the requested operation for logging
+
+        Returns
+        -------
+        bool
+            if the client renders in batch mode and `array_id` is valid
+        """
+        if type(self._convolver) is not AdjustableShConvolverBatch:
+            self._logger.error(
+                f'client is not rendering in batch mode, "{log_str}" ignored.'
+            )
+            return False
+        try:
+            array_id = int(array_id)
+        except ValueError:
+            array_id = -1
+        if not 0 <= array_id < self._convolver.get_array_count():
+            self._logger.error(f'invalid array index "{array_id}", "{log_str}" ignored.')
+            return False
+        return True
 
     def get_pre_renderer_sh_config(self):
         """
@@ -0,0 +1,334 @@
+import gc
+import logging
+import os
+import sys
+import threading
+import traceback
+from time import perf_counter, sleep
+
+from . import system_config
+
+
+class RealtimeMode(object):
+    """
+    Flexible abstract structure to keep the cyclic garbage collector from interrupting the JACK
+    process callbacks at arbitrary times while rendering. All objects existing when rendering
+    starts (i.e., filter sets, convolvers and clients) are moved into the permanent generation and
+    automatic collection is disabled. Instead, the young generations are collected in a
+    background thread every `system_config.REALTIME_GC_INTERVAL_SEC`, which is short, since the
+    frozen objects are not traversed. Objects surviving these collections are promoted to the
+    oldest generation, which is additionally collected every
+    `system_config.REALTIME_GC_FULL_INTERVAL_SEC`, so cyclic garbage (i.e., of OSC handling or
+    logging) does not accumulate over a session. This also only traverses objects created after
+    freezing.
+    """
+
+    _EVENT_STOP = threading.Event()
+    """Event ending the collecting thread when being set."""
+
+    @staticmethod
+    def get_is_enabled():
+        """
+        Returns
+        -------
+        bool
+            if the real-time mode is enabled by the system configuration
+        """
+        return bool(getattr(system_config, "IS_REALTIME_MODE", False))
+
+    @staticmethod
+    def enable(logger=None):
+        """
+        Freeze and disable the cyclic garbage collector and start the collecting thread, in case
+        the real-time mode is enabled by the system configuration. This should be called after
+        all rendering clients have been started.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the calling process
+        """
+        if not RealtimeMode.get_is_enabled() or not gc.isenabled():
+            return
+
+        gc.collect()
+        gc.freeze()
+        gc.disable()
+
+        RealtimeMode._EVENT_STOP.clear()
+        threading.Thread(
+            target=RealtimeMode._run_collector, args=(logger,), name="gc", daemon=True
+        ).start()
+
+        log_str = f"frozen {gc.get_freeze_count()} objects and disabled garbage collector."
+        logger.info(log_str) if logger else print(log_str)
+
+    @staticmethod
+    def disable():
+        """Stop the collecting thread and restore the automatic garbage collection."""
+        if gc.isenabled():
+            return
+
+        RealtimeMode._EVENT_STOP.set()
+        gc.unfreeze()
+        gc.enable()
+
+    @staticmethod
+    def _run_collector(logger=None):
+        """
+        Collect the young generations periodically and all generations at a lower rate until
+        `disable()` is called.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the calling process
+        """
+        full_interval_count = max(
+            round(
+                system_config.REALTIME_GC_FULL_INTERVAL_SEC
+                / system_config.REALTIME_GC_INTERVAL_SEC
+            ),
+            1,
+        )
+        interval_count = 0
+        while not RealtimeMode._EVENT_STOP.wait(timeout=system_config.REALTIME_GC_INTERVAL_SEC):
+            interval_count += 1
+            # collect the oldest generation as well after some intervals
+            generation = 2 if interval_count % full_interval_count == 0 else 1
+            start = perf_counter()
+            count = gc.collect(generation=generation)
+            if count:
+                log_str = (
+                    f"collected {count} objects in {(perf_counter() - start) * 1000:.2f} ms."
+                )
+                logger.debug(log_str) if logger else print(log_str)
+
+
+class RealtimeAudit(object):
+    """
+    Flexible abstract structure to audit the JACK process callbacks of all clients for operations
+    which are not real-time safe. Memory allocations (traced by `tracemalloc`), logging calls and
+    lock acquisitions happening inside a callback are counted and attributed to the code location
+    causing them. All offending locations are reported with their call stack every
+    `system_config.REALTIME_AUDIT_REPORT_SEC`.
+
+    Auditing is realized by a profiling function of the callback thread, which has a severe
+    performance impact. Hence, this is meant for debugging only. Lock acquisitions are detected
+    when being called explicitly or by synchronization primitives (i.e., `threading.Condition`
+    or `multiprocessing.Event`), whereas `with` statements directly on a lock are not visible to
+    profiling functions.
+
+    Allocations are traced process wide by `tracemalloc`. Hence, only one callback is audited at
+    a time and callbacks of other clients running concurrently in the same process are skipped,
+    so their allocations are not charged to the audited one. Allocations by other threads of the
+    process (e.g. OSC or logging) during an audited callback are still attributed to it.
+    """
+
+    _STATE = threading.local()
+    """Thread specific state of the callback being audited."""
+    _STATS = {}
+    """Global dictionary of the number of audited callbacks and offences per client."""
+    _OFFENDERS = {}
+    """Global dictionary of the number of offences and the call stack per code location."""
+    _LOCK_TYPES = ("lock", "RLock", "SemLock")
+    """Names of lock types whose acquisitions are audited."""
+    _LOCK_FUNCTIONS = ("acquire", "__enter__")
+    """Names of functions acquiring a lock."""
+    _STACK_DEPTH = 8
+    """Number of frames of reported call stacks."""
+    _REPORT_COUNT = 10
+    """Number of code locations being reported at most, ordered by their number of offences."""
+    _IS_STARTED = False
+    """If tracing of allocations and logging calls was started."""
+    _LOCK_AUDITED = threading.Lock()
+    """Lock being held while a callback is audited, so only one callback is audited at a time."""
+    _PACKAGE_PATH = os.path.dirname(os.path.abspath(__file__))
+    """Path of this package, offences are attributed to the innermost frame within it."""
+
+    @staticmethod
+    def get_is_enabled():
+        """
+        Returns
+        -------
+        bool
+            if auditing is enabled by the system configuration
+        """
+        return bool(getattr(system_config, "IS_REALTIME_AUDIT", False))
+
+    @staticmethod
+    def start(logger=None):
+        """
+        Start tracing and the reporting thread, in case auditing is enabled by the system
+        configuration.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the calling process
+        """
+        if not RealtimeAudit.get_is_enabled() or RealtimeAudit._IS_STARTED:
+            return
+        RealtimeAudit._IS_STARTED = True
+
+        import tracemalloc
+
+        tracemalloc.start()
+
+        # count log records created inside of audited callbacks
+        factory = logging.getLogRecordFactory()
+
+        def audit_factory(*args, **kwargs):
+            if getattr(RealtimeAudit._STATE, "name", None):
+                RealtimeAudit._add_offence("logging", sys._getframe(1))
+            return factory(*args, **kwargs)
+
+        logging.setLogRecordFactory(audit_factory)
+
+        threading.Thread(
+            target=RealtimeAudit._run_reporter, args=(logger,), name="audit", daemon=True
+        ).start()
+
+        log_str = "auditing JACK process callbacks (severe performance impact) ..."
+        logger.warning(log_str) if logger else print(f"[WARNING]  {log_str}", file=sys.stderr)
+
+    @staticmethod
+    def begin(name):
+        """
+        Start auditing the callback of the current thread. This has to be called at the
+        beginning of the JACK process callback. The callback is not audited in case another
+        callback is audited at the moment.
+
+        Parameters
+        ----------
+        name : str
+            name of the client being audited
+        """
+        if not RealtimeAudit._IS_STARTED:
+            return
+        # acquired before the profiling function is installed, hence not audited itself
+        if not RealtimeAudit._LOCK_AUDITED.acquire(blocking=False):
+            return
+
+        import tracemalloc
+
+        state = RealtimeAudit._STATE
+        state.name = name
+        state.offences = 0
+        tracemalloc.reset_peak()
+        state.mark = tracemalloc.get_traced_memory()[0]
+        sys.setprofile(RealtimeAudit._profile)
+
+    @staticmethod
+    def end():
+        """Stop auditing the callback of the current thread. This has to be called at the end of
+        the JACK process callback."""
+        state = RealtimeAudit._STATE
+        if not getattr(state, "name", None):
+            return
+
+        sys.setprofile(None)
+        stats = RealtimeAudit._STATS.setdefault(state.name, [0, 0, 0])
+        stats[0] += 1
+        stats[1] += bool(state.offences)
+        stats[2] = max(stats[2], state.offences)
+        state.name = None
+        RealtimeAudit._LOCK_AUDITED.release()
+
+    @staticmethod
+    def _profile(frame, event, arg):
+        """
+        Profiling function of the audited callback thread, see `sys.setprofile()`. Allocations
+        are attributed to the code executed since the last profiling event.
+
+        Parameters
+        ----------
+        frame : frame
+            current stack frame
+        event : str
+            kind of profiling event
+        arg : Any
+            called function in case of events concerning C functions
+        """
+        import tracemalloc
+
+        state = RealtimeAudit._STATE
+        current, peak = tracemalloc.get_traced_memory()
+        # ignore events of auditing itself
+        is_audited = frame.f_globals is not globals()
+        if is_audited and peak > state.mark:
+            RealtimeAudit._add_offence("allocation", frame)
+        tracemalloc.reset_peak()
+        state.mark = current
+
+        if (
+            is_audited
+            and event == "c_call"
+            and getattr(arg, "__name__", None) in RealtimeAudit._LOCK_FUNCTIONS
+            and type(getattr(arg, "__self__", None)).__name__ in RealtimeAudit._LOCK_TYPES
+        ):
+            RealtimeAudit._add_offence("lock", frame)
+
+    @staticmethod
+    def _add_offence(kind, frame):
+        """
+        Count an offence of the innermost code location within this package, so operations
+        inside of other libraries are attributed to the code calling them.
+
+        Parameters
+        ----------
+        kind : str
+            kind of offence
+        frame : frame
+            stack frame of the code location causing the offence
+        """
+        RealtimeAudit._STATE.offences += 1
+        while frame.f_back and not frame.f_code.co_filename.startswith(
+            RealtimeAudit._PACKAGE_PATH
+        ):
+            frame = frame.f_back
+        key = (kind, frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+        offender = RealtimeAudit._OFFENDERS.get(key)
+        if offender is None:
+            stack = "".join(traceback.format_stack(frame, limit=RealtimeAudit._STACK_DEPTH))
+            RealtimeAudit._OFFENDERS[key] = [1, stack]
+        else:
+            offender[0] += 1
+
+    @staticmethod
+    def _run_reporter(logger=None):
+        """
+        Report all clients and offending code locations periodically.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the calling process
+        """
+
+        def log(log_str, is_warning=False):
+            if is_warning:
+                logger.warning(log_str) if logger else print(
+                    f"[WARNING]  {log_str}", file=sys.stderr
+                )
+            else:
+                logger.info(log_str) if logger else print(log_str)
+
+        while True:
+            sleep(system_config.REALTIME_AUDIT_REPORT_SEC)
+            stats, RealtimeAudit._STATS = RealtimeAudit._STATS, {}
+            offenders, RealtimeAudit._OFFENDERS = RealtimeAudit._OFFENDERS, {}
+
+            for name, (count, offending_count, max_offences) in sorted(stats.items()):
+                log(
+                    f'audited {count} callbacks of "{name}", {offending_count} with offences '
+                    f"(at most {max_offences} per callback).",
+                    is_warning=bool(offending_count),
+                )
+            for (kind, file, line, function), (count, stack) in sorted(
+                offenders.items(), key=lambda item: item[1][0], reverse=True
+            )[: RealtimeAudit._REPORT_COUNT]:
+                log(
+                    f"{count}x {kind} in {function}() ({file}:{line}), stack:\n{stack}",
+                    is_warning=True,
+                )
@@ -0,0 +1,300 @@
+import json
+import os
+import sys
+import threading
+from time import perf_counter, sleep, thread_time
+
+import numpy as np
+
+from . import system_config
+from .telemetry import MetricRing
+
+
+class StageTimer(object):
+    """
+    Flexible structure to measure the processing time of every stage of the JACK process callback
+    of a `JackClient`. The callback only adds the time passed since the previous stage into a
+    compact snapshot stored in a `MetricRing`, the stages within `Convolver` implementations are
+    marked by `mark()` without requiring a reference to the respective instance. The snapshots
+    are read by the `Telemetry` thread of the client, which collects histograms relative to the
+    block duration (the deadline of every callback) and delivers their percentiles via OSC.
+    Furthermore, the percentiles of all clients are dumped periodically into a JSON file.
+
+    Attributes
+    ----------
+    name : str
+        name of the measured client
+    _deadline : float
+        duration of one audio block in s
+    _ring : MetricRing
+        snapshots of the stage durations in s with fields [stages; callback total; thread CPU
+        time]
+    _slot : numpy.ndarray or None
+        snapshot of the current callback
+    _start : float
+        high-resolution time at the beginning of the current callback
+    _last : float
+        high-resolution time at the end of the previous stage
+    _cpu_start : float
+        thread CPU time at the beginning of the current callback
+    _histograms : numpy.ndarray
+        number of callbacks per logarithmic duration bin of size [number of stages + 2; number of
+        bins]
+    _max : numpy.ndarray
+        maximum durations in percent of the deadline of size [number of stages + 2]
+    _sum : numpy.ndarray
+        summed durations in percent of the deadline of size [number of stages + 2]
+    _block_count : int
+        number of measured callbacks
+    _overrun_count : int
+        number of measured callbacks exceeding the deadline
+    _lock : threading.Lock
+        lock protecting the histograms between the `Telemetry` and the dumping thread
+    """
+
+    RECEIVE, FFT, SPATIAL, MAC, ROTATION, IFFT, CROSSFADE, PROCESS, DELIVER = range(9)
+    """Indices of all measured stages."""
+    STAGE_NAMES = (
+        "receive",
+        "fft",
+        "spatial",
+        "mac",
+        "rotation",
+        "ifft",
+        "crossfade",
+        "process",
+        "deliver",
+        "total",
+        "cpu",
+    )
+    """Names of all measured stages, followed by the callback total and the thread CPU time."""
+
+    _BIN_MIN_PERCENT = 0.01
+    """Lower edge in percent of the deadline of the first logarithmic histogram bin, shorter
+    durations are collected in this bin."""
+    _BINS_PER_DECADE = 24
+    """Number of logarithmic histogram bins per decade."""
+    _BIN_COUNT = 5 * _BINS_PER_DECADE + 1
+    """Number of histogram bins, longer durations than 1000 percent of the deadline are collected
+    in the last bin."""
+    _PERCENTILES = (50, 95, 99)
+    """Percentiles being reported of every stage."""
+
+    _STATE = threading.local()
+    """Thread specific reference to the timer of the callback currently being measured."""
+    _INSTANCES = []
+    """Global list of all created timers, which are dumped periodically."""
+
+    @staticmethod
+    def get_is_enabled():
+        """
+        Returns
+        -------
+        bool
+            if timing of processing stages is enabled by the system configuration
+        """
+        return bool(getattr(system_config, "IS_STAGE_TIMING", False))
+
+    @staticmethod
+    def mark(stage):
+        """
+        End the given stage of the callback currently being measured in this thread, i.e., add
+        the time passed since the end of the previous stage. This does nothing in case no
+        callback is measured in this thread.
+
+        Parameters
+        ----------
+        stage : int
+            index of the ended stage, e.g. `StageTimer.FFT`
+        """
+        timer = getattr(StageTimer._STATE, "timer", None)
+        if timer is not None:
+            now = perf_counter()
+            timer._slot[stage] += now - timer._last
+            timer._last = now
+
+    @staticmethod
+    def start_dump(logger=None):
+        """
+        Start the thread dumping the percentiles of all timers every
+        `system_config.STAGE_TIMING_DUMP_SEC` into `system_config.STAGE_TIMING_PATH`, in case
+        timing is enabled by the system configuration.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the calling process
+        """
+        if not StageTimer.get_is_enabled() or not system_config.STAGE_TIMING_PATH:
+            return
+
+        threading.Thread(
+            target=StageTimer._run_dump, args=(logger,), name="timing", daemon=True
+        ).start()
+
+    @staticmethod
+    def _run_dump(logger=None):
+        """
+        Write the percentiles of all timers periodically. The file is written atomically by
+        writing to a temporary file first which is renamed afterwards. Failed writes are retried
+        in the next interval, while a persisting error is only logged once.
+
+        Parameters
+        ----------
+        logger : logging.Logger, optional
+            instance to provide identical logging behaviour as the calling process
+        """
+        path = os.path.abspath(system_config.STAGE_TIMING_PATH)
+        path_tmp = f"{path}.{os.getpid()}.tmp"
+        last_error = None
+        while True:
+            sleep(system_config.STAGE_TIMING_DUMP_SEC)
+            summaries = [timer.get_summary() for timer in StageTimer._INSTANCES]
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path_tmp, "w") as file:
+                    json.dump({"clients": summaries}, file, indent=2)
+                os.replace(path_tmp, path)
+                last_error = None
+            except OSError as e:
+                if str(e) != last_error:
+                    log_str = f'failed to write stage timing "{os.path.relpath(path)}" ({e}).'
+                    logger.warning(log_str) if logger else print(
+                        f"[WARNING]  {log_str}", file=sys.stderr
+                    )
+                last_error = str(e)
+
+    def __init__(self, name, block_length, sample_rate):
+        """
+        Parameters
+        ----------
+        name : str
+            name of the measured client
+        block_length : int
+            system specific size of every audio block
+        sample_rate : int
+            system specific sampling frequency
+        """
+        self.name = name
+        self._deadline = block_length / sample_rate
+
+        # twice the number of blocks processed in between two `Telemetry` updates
+        block_count = sample_rate / block_length / max(system_config.TELEMETRY_RATE_HZ, 1)
+        self._ring = MetricRing(
+            capacity=2 * int(np.ceil(block_count)) + 1, field_count=len(StageTimer.STAGE_NAMES)
+        )
+        self._slot = None
+        self._start = 0.0
+        self._last = 0.0
+        self._cpu_start = 0.0
+
+        self._histograms = np.zeros(
+            (len(StageTimer.STAGE_NAMES), StageTimer._BIN_COUNT), dtype=np.int64
+        )
+        self._max = np.zeros(len(StageTimer.STAGE_NAMES))
+        self._sum = np.zeros(len(StageTimer.STAGE_NAMES))
+        self._block_count = 0
+        self._overrun_count = 0
+        self._lock = threading.Lock()
+
+        StageTimer._INSTANCES.append(self)
+
+    def begin(self):
+        """Start measuring the callback of the current thread. This is called at the beginning of
+        the JACK process callback."""
+        self._slot = self._ring.get_slot()
+        self._slot.fill(0)
+        StageTimer._STATE.timer = self
+        self._cpu_start = thread_time()
+        self._start = self._last = perf_counter()
+
+    def end(self):
+        """Stop measuring the callback of the current thread and publish the snapshot. This is
+        called at the end of the JACK process callback."""
+        StageTimer._STATE.timer = None
+        self._slot[-2] = perf_counter() - self._start
+        self._slot[-1] = thread_time() - self._cpu_start
+        self._ring.commit()
+
+    def get_snapshot(self):
+        """
+        Returns
+        -------
+        numpy.ndarray or None
+            stage durations in s of the last measured callback, see `STAGE_NAMES`
+        """
+        return self._slot
+
+    def update(self):
+        """Collect all snapshots published since the last update into the histograms. This is
+        called by the `Telemetry` thread."""
+        percents = self._ring.read().astype(np.float64) * (100 / self._deadline)
+        if not percents.shape[0]:
+            return
+
+        bins = np.floor(
+            StageTimer._BINS_PER_DECADE
+            * np.log10(np.maximum(percents / StageTimer._BIN_MIN_PERCENT, 1))
+        ).astype(np.intp)
+        np.clip(bins, 0, StageTimer._BIN_COUNT - 1, out=bins)
+
+        with self._lock:
+            np.add.at(self._histograms, (np.arange(percents.shape[1]), bins), 1)
+            np.maximum(self._max, percents.max(axis=0), out=self._max)
+            self._sum += percents.sum(axis=0)
+            self._block_count += percents.shape[0]
+            self._overrun_count += int(np.count_nonzero(percents[:, -2] > 100))
+
+    def get_percentiles(self):
+        """
+        Returns
+        -------
+        numpy.ndarray
+            percentiles (see `_PERCENTILES`) and maximum durations in percent of the deadline of
+            size [number of stages + 2; number of percentiles + 1], percentiles are given as the
+            upper edge of the respective histogram bin
+        """
+        with self._lock:
+            cumulated = np.cumsum(self._histograms, axis=-1)
+            maximum = self._max.copy()
+
+        edges = StageTimer._BIN_MIN_PERCENT * 10 ** (
+            np.arange(1, StageTimer._BIN_COUNT + 1) / StageTimer._BINS_PER_DECADE
+        )
+        percentiles = np.zeros((cumulated.shape[0], len(StageTimer._PERCENTILES) + 1))
+        percentiles[:, -1] = maximum
+        if cumulated[0, -1]:
+            for p, percentile in enumerate(StageTimer._PERCENTILES):
+                bins = np.argmax(cumulated >= cumulated[:, -1:] * percentile / 100, axis=-1)
+                # bin edges exceeding the maximum are not meaningful
+                percentiles[:, p] = np.minimum(edges[bins], maximum)
+        return percentiles
+
+    def get_summary(self):
+        """
+        Returns
+        -------
+        dict
+            number of measured callbacks and overruns as well as the mean, percentiles and
+            maximum durations in percent of the deadline of every stage
+        """
+        percentiles = self.get_percentiles()
+        with self._lock:
+            block_count = self._block_count
+            overrun_count = self._overrun_count
+            means = self._sum / max(block_count, 1)
+
+        keys = [f"p{p}" for p in StageTimer._PERCENTILES] + ["max"]
+        return {
+            "name": self.name,
+            "deadline_ms": round(self._deadline * 1000, 3),
+            "block_count": block_count,
+            "overrun_count": overrun_count,
+            "stages_percent": {
+                stage: dict(
+                    mean=round(float(mean), 3),
+                    **{k: round(float(v), 3) for k, v in zip(keys, values)},
+                )
+                for stage, mean, values in zip(StageTimer.STAGE_NAMES, means, percentiles)
+            },
+        }
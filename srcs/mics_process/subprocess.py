@@ -1,6 +1,10 @@
+import functools
 import logging
+import pickle
+import threading
 
 from . import system_config, mp_context, tools, process_logger
+from .flight_recorder import FlightRecorder
 
 
 class SubProcess(mp_context.Process):
@@ -18,8 +22,25 @@ class SubProcess(mp_context.Process):
         OSC client instance used to send status messages
     _osc_name : str
         used OSC target when sending messages
+    _is_isolated : bool
+        if all functions named in `_ISOLATED_FUNCTIONS` are executed inside of the spawned process
+        after it was started, see `_call_isolated()`
+    _is_isolated_child : bool
+        if this is the instance inside of the spawned process executing isolated functions
+    _isolation_connection : multiprocessing.connection.Connection or None
+        end of the pipe the calling process sends isolated function calls to
+    _isolation_connection_child : multiprocessing.connection.Connection or None
+        end of the pipe the spawned process receives isolated function calls from
+    _isolation_lock : threading.Lock
+        lock serializing isolated function calls of concurrent threads of the calling process
     """
 
+    _ISOLATED_FUNCTIONS = ()
+    """Names of all functions being executed inside of the spawned process, in case the instance
+    is isolated."""
+    _ISOLATION_JOIN_TIMEOUT_SEC = 1
+    """Time in s given to an isolated process to clean up after being terminated."""
+
     def __init__(
         self,
         name,
@@ -60,6 +81,11 @@ class SubProcess(mp_context.Process):
 
         # initialize attributes
         self._event_terminate = mp_context.Event()
+        self._is_isolated = False
+        self._is_isolated_child = False
+        self._isolation_connection = None
+        self._isolation_connection_child = None
+        self._isolation_lock = threading.Lock()
 
     def _init_osc_client(self):
         """Initialize OSC client specific attributes to open port sending status data."""
@@ -87,8 +113,19 @@ class SubProcess(mp_context.Process):
         their own.
         """
         self._logger.debug("starting PROCESS ...")
+        if self._is_isolated:
+            self._isolation_connection, self._isolation_connection_child = mp_context.Pipe()
+
         super().start()
 
+        if self._is_isolated:
+            # only the spawned process keeps its end of the pipe open, so calls fail as soon as
+            # it exited
+            self._isolation_connection_child.close()
+            # replace isolated functions in the calling process
+            for function_name in self._ISOLATED_FUNCTIONS:
+                setattr(self, function_name, self._create_isolated_function(function_name))
+
     def run(self):
         """
         Overrides the `multiprocessing.Process` function which is automatically called by `start()`
@@ -96,6 +133,11 @@ class SubProcess(mp_context.Process):
         process stay alive until the according `multiprocessing.Event` is set.
         """
         self._logger.debug("running PROCESS ...")
+        if self._is_isolated:
+            self._is_isolated_child = True
+            threading.Thread(
+                target=self._run_isolated_calls, name=f"{self.name}-calls", daemon=True
+            ).start()
 
         try:
             self._event_terminate.wait()
@@ -109,6 +151,9 @@ class SubProcess(mp_context.Process):
         """
         self._logger.debug("terminating PROCESS ...")
         self._event_terminate.set()
+        if self._is_isolated and self.is_alive():
+            # allow the process to clean up its own resources
+            self.join(timeout=SubProcess._ISOLATION_JOIN_TIMEOUT_SEC)
 
         # delete logger instance
         try:
@@ -117,3 +162,118 @@ class SubProcess(mp_context.Process):
         except KeyError:
             pass
         super().terminate()
+
+    def is_alive(self):
+        """
+        Extends the `multiprocessing.Process` function, so it can also be called by the spawned
+        process itself when executing isolated functions.
+
+        Returns
+        -------
+        bool
+            if the process is running
+        """
+        if self._is_isolated_child:
+            return not self._event_terminate.is_set()
+        return super().is_alive()
+
+    def _create_isolated_function(self, function_name):
+        """
+        Parameters
+        ----------
+        function_name : str
+            name of the function being executed inside of the spawned process
+
+        Returns
+        -------
+        function
+            replacement of the function in the calling process, which provides the identical
+            signature (see `inspect.signature()`) and forwards all calls via `_call_isolated()`
+        """
+
+        @functools.wraps(getattr(self, function_name))
+        def isolated_function(*args, **kwargs):
+            return self._call_isolated(function_name, *args, **kwargs)
+
+        return isolated_function
+
+    def _call_isolated(self, function_name, *args, **kwargs):
+        """
+        Execute a function inside of the spawned process and wait for its result.
+
+        Parameters
+        ----------
+        function_name : str
+            name of the function being executed
+        args : Any
+            positional parameters of the function, see `_to_transferable()`
+        kwargs : Any
+            keyword parameters of the function, see `_to_transferable()`
+
+        Returns
+        -------
+        Any
+            result of the function
+
+        Raises
+        ------
+        RuntimeError
+            in case the spawned process is not reachable
+        Exception
+            re-raise of any exception raised by the function
+        """
+        call = (
+            function_name,
+            self._to_transferable(args),
+            {k: self._to_transferable(v) for k, v in kwargs.items()},
+        )
+        with self._isolation_lock:
+            try:
+                self._isolation_connection.send(call)
+                result, error = self._isolation_connection.recv()
+            except (OSError, EOFError) as e:
+                raise RuntimeError(f'failed to call "{function_name}()" in process ({e}).')
+        if error is not None:
+            raise error
+        return result
+
+    def _run_isolated_calls(self):
+        """Execute all function calls received from the calling process one after another, until
+        the process is terminated."""
+        connection = self._isolation_connection_child
+        while not self._event_terminate.is_set():
+            try:
+                if not connection.poll(timeout=1):
+                    continue
+                function_name, args, kwargs = connection.recv()
+            except (OSError, EOFError):
+                return
+
+            FlightRecorder.add_event("call", f"{function_name}{tuple(args)}")
+            try:
+                result, error = getattr(self, function_name)(*args, **kwargs), None
+            except Exception as e:
+                result, error = None, e
+
+            try:
+                connection.send((self._to_transferable(result), error))
+            except (pickle.PicklingError, TypeError, AttributeError) as e:
+                # result or exception could not be pickled
+                connection.send((None, RuntimeError(f'"{function_name}()" failed ({e}).')))
+            except (OSError, EOFError):
+                return
+
+    def _to_transferable(self, value):
+        """
+        Parameters
+        ----------
+        value : Any
+            parameter or result of an isolated function
+
+        Returns
+        -------
+        Any
+            representation of the value which can be transferred between processes, this
+            implementation returns the value unchanged
+        """
+        return value
@@ -17,6 +17,117 @@ IS_PYFFTW_MODE = True  # True leads to the best performance so far
 real-time DFT operations. In case `pyfftw` is not used, all related tasks like loading/saving and
 pre-calculating FFTW wisdom will be skipped. """
 
+IS_SHARED_INPUT_SPECTRUM = False
+"""If the input block spectra should be shared between all convolvers receiving identical input
+blocks (connected to the same source ports with the same input delay) in the same process. Hence,
+each input block is only transformed once per processing frame, see `InputSpectrumCache`. This
+has no effect on clients running in their own process, see `IS_RENDERER_PROCESS_ISOLATION`. """
+
+IS_SILENCE_GATING = False
+"""If convolvers should skip processing while their input is silent and all buffered signal
+components have decayed. Processing resumes as soon as the input signal returns, see
+`OverlapSaveConvolver`. """
+
+SILENCE_GATE_LEVEL_DB = -150
+"""Mean energy level in dBFS of an input block below which it is considered silent."""
+
+DEMAND_MODE = None
+"""Behaviour of renderers while their output is not audible (muted, zero volume, output ports not
+connected or not selected by a demand driven monitor), either "SUSPEND" to skip processing
+entirely, "LOW_COST" to process at reduced quality and effort or `None` to always render at full
+quality, see `JackRenderer.DemandMode`. Pre-renderers follow the demand of the array they feed,
+see `JackMonitor`. """
+
+DEMAND_LOW_COST_SH_ORDER = 1
+"""Maximum spherical harmonics rendering order of renderers in "LOW_COST" demand mode."""
+
+DEMAND_PREROLL_BLOCKS = 2
+"""Minimum number of blocks being processed with silenced output after a suspended renderer
+becomes audible again, to refill the signal buffers before delivering output. At least the number
+of filter partitions is processed in any case."""
+
+FILTER_CACHE_PATH = None
+"""Path of fully preprocessed filter sets being cached to (e.g. "cache/"), so later startups with
+identical filter files and load parameters skip the preprocessing, see `FilterCache`. Set to
+`None` to disable caching. """
+
+IS_SHARED_FILTERS = True
+"""If filter sets loaded from identical files with identical load parameters should reference the
+same read-only filter data instead of individual copies, see `FilterRegistry`. """
+
+HRIR_LOOKUP_RESOLUTION_DEG = 0.5
+"""Quantization step size in degrees of head orientations, for which the nearest HRIR sampling
+point is looked up from a precomputed table during rendering, see `FilterSetMiro`. """
+
+IS_HRIR_INTERPOLATION = False
+"""If HRIRs should be interpolated between the three sampling points of the enclosing grid
+triangle by precomputed barycentric weights, instead of using the nearest sampling point only.
+This allows rendering with sparse HRIR grids, see `FilterSetMiro`. """
+
+RESAMPLING_TYPE = "SINC_BEST"
+"""Method of resampling filters not matching the system sampling rate at load time, either
+"SINC_BEST" (`libsamplerate` "sinc_best" converter) or "POLYPHASE" (`scipy` polyphase filter,
+faster but only for rational sampling rate ratios of feasible factors), see `FilterSet`. """
+
+RESAMPLING_WORKER_COUNT = None
+"""Number of threads resampling filters in parallel at load time, `None` to use one per CPU."""
+
+HRIR_COMPACT_SH_ORDER = None
+"""Spherical harmonics order of HRIR sets being rendered by direction (not in spherical harmonics
+domain) to be stored as block-wise SH coefficients instead of spectra for every sampling point,
+which reduces the memory footprint of dense sampling grids. Spectra of individual head
+orientations are synthesized on demand. Set to `None` to store spectra of all sampling points,
+see `FilterSetMiro`. """
+
+HRIR_COMPACT_CACHE_SIZE = 256
+"""Number of synthesized head orientation spectra being kept of HRIR sets in compact storage,
+see `HRIR_COMPACT_SH_ORDER`. The storage is preallocated and the least recently used spectra are
+overwritten, hence this has to exceed twice the number of convolvers sharing an HRIR set (current
+and last orientation of each). """
+
+IS_LEAN_FILTERS = False
+"""If representations of the filter data, which are not read anymore by the respective
+`Convolver` after all preparations, should be released before the rendering processes are
+started. Time domain impulse responses and dirac impulses are replaced by views without
+occupying memory, frequency domain spectra of filter sets rendered in spherical harmonics domain
+are dropped, see `FilterSet.release_unused()`. """
+
+IS_HRIR_MINIMUM_PHASE = False
+"""If HRIRs should be decomposed into minimum phase filters and onset delays per direction and
+ear at load time, which are truncated according to `HRIR_TRUNCATION_ENERGY_DB`. The delays are
+applied as fractional delays by the renderer. For HRIRs being rendered in spherical harmonics
+domain only the common onset delay is removed, see `FilterSet`. """
+
+HRIR_TRUNCATION_ENERGY_DB = -50
+"""Residual energy in dB relative to the total energy of every HRIR, below which the tail is
+truncated in case `IS_HRIR_MINIMUM_PHASE` is enabled. """
+
+FILTER_LOAD_WORKER_COUNT = None
+"""Number of threads loading distinct filter sets of all configured renderers concurrently at
+startup, `None` to use one per filter set, see `FilterLoadPlanner`. """
+
+FILTER_SWAP_CROSSFADE_BLOCKS = 8
+"""Number of blocks the outputs of the previous and the new filter set are cross-faded over, when
+exchanging the filter set of a running renderer, see `JackRenderer.set_renderer_filter()`. """
+
+IS_REALTIME_MODE = False
+"""If the cyclic garbage collector should be frozen and disabled while rendering, so collections
+never interrupt the JACK process callbacks at arbitrary times. Instead, young objects are
+collected in a background thread every `REALTIME_GC_INTERVAL_SEC` and all objects not being frozen
+every `REALTIME_GC_FULL_INTERVAL_SEC`, see `RealtimeMode`. """
+REALTIME_GC_INTERVAL_SEC = 5
+"""Interval in s of collecting young objects in real-time mode. """
+REALTIME_GC_FULL_INTERVAL_SEC = 60
+"""Interval in s of collecting all (not frozen) objects in real-time mode, so cyclic garbage
+surviving the young generations is not accumulated. """
+
+IS_REALTIME_AUDIT = False
+"""If memory allocations, logging calls and lock acquisitions inside the JACK process callbacks
+should be counted and reported with their call stacks every `REALTIME_AUDIT_REPORT_SEC`. This
+has a severe performance impact and is meant for debugging only, see `RealtimeAudit`. """
+REALTIME_AUDIT_REPORT_SEC = 10
+"""Interval in s of reporting offending code locations when auditing the process callbacks. """
+
 ## SH_COMPENSATION_TYPE = "MODAL_RADIAL_FILTER"
 
 ## SH_COMPENSATION_TYPE = "SPHERICAL_HARMONICS_TAPERING+SPHERICAL_HEAD_FILTER"
@@ -49,6 +160,52 @@ LOGGING_PATH = "log/"
 CLIENT_MAX_DELAY_SEC = 5
 """Input buffer delay limitation in s for all renderers."""
 
+CLIENT_CLIPPING_REPORT_SEC = 2
+"""Minimum interval in s between reports of output clipping detected by a client."""
+
+TELEMETRY_RATE_HZ = 20
+"""Rate of output level meters and load measurements of all clients being delivered via OSC (or
+logged otherwise), see `Telemetry`."""
+
+IS_STAGE_TIMING = False
+"""If the processing time of every stage of the JACK process callbacks (receiving, transforming,
+multiplying, rotating, cross-fading, delivering, ...) as well as their thread CPU time should be
+measured. Percentiles relative to the block duration are delivered via OSC at
+`TELEMETRY_RATE_HZ` and dumped into `STAGE_TIMING_PATH`, see `StageTimer`."""
+
+STAGE_TIMING_PATH = "log/stage_timing.json"
+"""Path of the file all measured processing stage percentiles are dumped to, see `StageTimer`.
+Set to `None` to disable dumping."""
+
+STAGE_TIMING_DUMP_SEC = 5
+"""Interval in s of dumping measured processing stage percentiles."""
+
+IS_FLIGHT_RECORDER = False
+"""If the last blocks processed by every client (time, callback duration, tracker orientation and
+processing stage durations in case `IS_STAGE_TIMING`) as well as OSC commands and garbage
+collections should be recorded and dumped into `FLIGHT_RECORDER_PATH` on every JACK xrun, see
+`FlightRecorder`."""
+
+FLIGHT_RECORDER_PATH = "log/flight/"
+"""Path of flight recordings being dumped to on JACK xruns."""
+
+FLIGHT_RECORDER_BLOCK_COUNT = 512
+"""Number of last blocks being recorded per client."""
+
+FLIGHT_RECORDER_EVENT_COUNT = 256
+"""Number of last process wide events (OSC commands and garbage collections) being recorded."""
+
+FLIGHT_RECORDER_MIN_INTERVAL_SEC = 1
+"""Minimum interval in s between dumps of a client, further xruns in between are contained in the
+following dump."""
+
+IS_RENDERER_PROCESS_ISOLATION = False
+"""If the JACK client of every `JackRenderer` should be created and run inside of its own spawned
+process, so the processing of all renderers is not bound to a single interpreter (and its global
+interpreter lock) anymore. Control functions are forwarded to the spawned process via a pipe and
+JACK ports are exchanged by their names, see `SubProcess`. Otherwise, all processing callbacks are
+executed by the main process while the spawned processes only wait for termination. """
+
 ARIR_RADIAL_AMP = 18
 """Maximum amplification limit in dB when generating modal radial filters, see `FilterSet`."""
 
@@ -0,0 +1,383 @@
+from threading import Thread
+
+import numpy as np
+
+from . import system_config
+
+
+class MetricRing(object):
+    """
+    Basic class to provide a ring buffer of fixed size metric snapshots between exactly one
+    producer (the JACK process callback) and one consumer (the `Telemetry` thread). The producer
+    only writes into preallocated memory and advances its own counter, the consumer only advances
+    its own counter. Hence, no locking is required and the producer is never blocked. In case the
+    consumer falls behind, the oldest snapshots are overwritten.
+
+    Attributes
+    ----------
+    _buffer : numpy.ndarray
+        snapshot buffer of size [number of snapshots; number of metric fields]
+    _write_count : int
+        number of snapshots committed by the producer
+    _read_count : int
+        number of snapshots read by the consumer
+    """
+
+    def __init__(self, capacity, field_count):
+        """
+        Parameters
+        ----------
+        capacity : int
+            number of snapshots being buffered at most
+        field_count : int
+            number of metric fields of every snapshot
+        """
+        self._buffer = np.zeros((capacity, field_count), dtype=np.float32)
+        self._write_count = 0
+        self._read_count = 0
+
+    def get_slot(self):
+        """
+        Returns
+        -------
+        numpy.ndarray
+            writable snapshot being filled by the producer until `commit()` of size [number of
+            metric fields]
+        """
+        return self._buffer[self._write_count % self._buffer.shape[0]]
+
+    def commit(self):
+        """Publish the current snapshot to the consumer."""
+        self._write_count += 1
+
+    def read(self):
+        """
+        Returns
+        -------
+        numpy.ndarray
+            copy of all snapshots committed since the last call of size [number of snapshots;
+            number of metric fields]
+        """
+        write_count = self._write_count
+        read_count = max(self._read_count, write_count - self._buffer.shape[0] + 1)
+        self._read_count = write_count
+
+        ids = np.arange(read_count, write_count) % self._buffer.shape[0]
+        return self._buffer[ids]
+
+
+class Telemetry(object):
+    """
+    Flexible structure to provide output level meters and load measurements of a `JackClient`
+    without any computation or network traffic in the JACK process callback. The callback only
+    stores compact snapshots (block energy and peak of every output channel as well as the client
+    load) into a `MetricRing`. A separate thread reads all snapshots at the fixed rate of
+    `system_config.TELEMETRY_RATE_HZ`, calculates smoothed meters and sends all values in one OSC
+    bundle (or logs them otherwise).
+
+    Attributes
+    ----------
+    _ring : MetricRing or None
+        snapshots of the current configuration with fields [client load; output channel energies;
+        output channel peaks]
+    _channel_count : int
+        number of metered output channels
+    _block_length : int
+        system specific size of every audio block
+    _osc_client : pythonosc.udp_client.SimpleUDPClient or None
+        OSC client instance used to send status messages
+    _osc_name : str or None
+        used OSC target when sending messages
+    _logger : logging.Logger
+        instance to provide identical logging behaviour as the owning client
+    _get_system_load : function or None
+        function returning the overall JACK system load, in case it should be reported
+    _stage_timer : StageTimer or None
+        processing stage timer of the owning client, in case its percentiles should be reported
+    _event_terminate : multiprocessing.Event
+        event of the owning client ending the telemetry thread when being set
+    _rms_energy : numpy.ndarray or None
+        exponentially smoothed mean output energy of size [number of output channels]
+    _peak_db : numpy.ndarray or None
+        output peak levels in dBFS with hold and fall back behaviour of size [number of output
+        channels]
+    """
+
+    _RMS_TIME_CONSTANT_SEC = 0.3
+    """Time constant in s of the exponential smoothing of RMS levels."""
+    _PEAK_FALL_DB_PER_SEC = 20
+    """Rate in dB/s the displayed peak levels fall back with."""
+    _LOG_INTERVAL_SEC = 1
+    """Interval in s of logging meters, in case no OSC client is used."""
+    _LEVEL_FLOOR_DB = -200
+    """Level in dBFS being reported for silence."""
+
+    def __init__(
+        self,
+        logger,
+        event_terminate,
+        osc_client=None,
+        osc_name=None,
+        get_system_load=None,
+        stage_timer=None,
+    ):
+        """
+        Parameters
+        ----------
+        logger : logging.Logger
+            instance to provide identical logging behaviour as the owning client
+        event_terminate : multiprocessing.Event
+            event of the owning client ending the telemetry thread when being set
+        osc_client : pythonosc.udp_client.SimpleUDPClient, optional
+            OSC client instance used to send status messages
+        osc_name : str, optional
+            used OSC target when sending messages
+        get_system_load : function, optional
+            function returning the overall JACK system load, in case it should be reported
+        stage_timer : StageTimer, optional
+            processing stage timer of the owning client, in case its percentiles should be
+            reported
+        """
+        self._ring = None
+        self._channel_count = 0
+        self._block_length = 1
+        self._osc_client = osc_client
+        self._osc_name = osc_name
+        self._logger = logger
+        self._get_system_load = get_system_load
+        self._stage_timer = stage_timer
+        self._event_terminate = event_terminate
+        self._rms_energy = None
+        self._peak_db = None
+
+    def init(self, channel_count, block_length, sample_rate):
+        """
+        Allocate the snapshot buffer for the given configuration. The buffer is replaced as a
+        whole, so the telemetry thread never reads a partially updated state.
+
+        Parameters
+        ----------
+        channel_count : int
+            number of metered output channels
+        block_length : int
+            system specific size of every audio block
+        sample_rate : int
+            system specific sampling frequency
+        """
+        # twice the number of blocks processed in between two updates
+        block_count = sample_rate / block_length / max(system_config.TELEMETRY_RATE_HZ, 1)
+        self._channel_count = channel_count
+        self._block_length = block_length
+        self._ring = MetricRing(
+            capacity=2 * int(np.ceil(block_count)) + 1, field_count=1 + 2 * channel_count
+        )
+
+    def start(self):
+        """Start the telemetry thread."""
+        Thread(target=self._run, name="telemetry", daemon=True).start()
+
+    def put_levels(self, data_td, gains, peaks):
+        """
+        Store output levels of the current block. This is called by the JACK process callback.
+
+        Parameters
+        ----------
+        data_td : numpy.ndarray
+            block of time domain output samples before applying the output volume of size
+            [number of delivered channels; block length]
+        gains : numpy.ndarray
+            output volume of every delivered channel of size [number of delivered channels]
+        peaks : numpy.ndarray
+            absolute peak values after applying the output volume of size [number of delivered
+            channels]
+        """
+        ring = self._ring
+        if ring is None:
+            return
+        slot = ring.get_slot()
+        count = min(data_td.shape[0], self._channel_count)
+        energies = slot[1 : 1 + count]
+        np.einsum(
+            "ij,ij->i", data_td[:count], data_td[:count], out=energies, casting="same_kind"
+        )
+        energies *= np.square(gains[:count])
+        slot[1 + count : 1 + self._channel_count] = 0
+        slot[1 + self._channel_count : 1 + self._channel_count + count] = peaks[:count]
+        slot[1 + self._channel_count + count :] = 0
+
+    def put_silence(self):
+        """Store silent output levels of the current block. This is called by the JACK process
+        callback."""
+        ring = self._ring
+        if ring is not None:
+            ring.get_slot()[1:] = 0
+
+    def commit(self, load_percent=0):
+        """
+        Store the client load and publish the snapshot of the current block. This is called by
+        the JACK process callback.
+
+        Parameters
+        ----------
+        load_percent : int, optional
+            individual client load in percent of the block duration
+        """
+        ring = self._ring
+        if ring is not None:
+            ring.get_slot()[0] = load_percent
+            ring.commit()
+
+    def _run(self):
+        """Read and deliver all snapshots periodically until the owning client terminates."""
+        period = 1 / max(system_config.TELEMETRY_RATE_HZ, 1)
+        log_count = max(int(round(Telemetry._LOG_INTERVAL_SEC / period)), 1)
+        tick = 0
+        while not self._event_terminate.wait(timeout=period):
+            if self._stage_timer:
+                self._stage_timer.update()
+            ring = self._ring
+            if ring is None:
+                continue
+            load, rms_db, peak_db = self._update(ring.read(), period)
+            if self._osc_client:
+                self._send(load, rms_db, peak_db)
+            elif tick % log_count == 0:
+                self._log(load, rms_db, peak_db)
+            tick += 1
+
+    def _update(self, snapshots, period):
+        """
+        Parameters
+        ----------
+        snapshots : numpy.ndarray
+            snapshots committed since the last update of size [number of snapshots; number of
+            metric fields]
+        period : float
+            time in s since the last update
+
+        Returns
+        -------
+        int
+            maximum individual client load in percent
+        numpy.ndarray
+            smoothed RMS levels in dBFS of size [number of output channels]
+        numpy.ndarray
+            peak levels with fall back in dBFS of size [number of output channels]
+        """
+        count = self._channel_count
+        if self._rms_energy is None or self._rms_energy.shape[0] != count:
+            self._rms_energy = np.zeros(count)
+            self._peak_db = np.full(count, Telemetry._LEVEL_FLOOR_DB, dtype=np.float64)
+
+        if snapshots.shape[0]:
+            load = int(snapshots[:, 0].max())
+            energy = snapshots[:, 1 : 1 + count].mean(axis=0) / self._block_length
+            peak = snapshots[:, 1 + count :].max(axis=0)
+        else:
+            load = 0
+            energy = np.zeros(count)
+            peak = np.zeros(count)
+
+        # exponential smoothing of the energy
+        alpha = 1 - np.exp(-period / Telemetry._RMS_TIME_CONSTANT_SEC)
+        self._rms_energy += alpha * (energy - self._rms_energy)
+
+        # peak hold with linear fall back
+        self._peak_db = np.maximum(
+            self._to_db(peak, is_energy=False),
+            self._peak_db - Telemetry._PEAK_FALL_DB_PER_SEC * period,
+        )
+        self._peak_db = np.maximum(self._peak_db, Telemetry._LEVEL_FLOOR_DB)
+
+        return load, self._to_db(self._rms_energy, is_energy=True), self._peak_db
+
+    @staticmethod
+    def _to_db(values, is_energy):
+        """
+        Parameters
+        ----------
+        values : numpy.ndarray
+            energy or magnitude values
+        is_energy : bool
+            if values are energies, otherwise magnitudes
+
+        Returns
+        -------
+        numpy.ndarray
+            levels in dBFS, zeros are transformed into `_LEVEL_FLOOR_DB`
+        """
+        with np.errstate(divide="ignore"):
+            levels = (10 if is_energy else 20) * np.log10(values)
+        return np.maximum(levels, Telemetry._LEVEL_FLOOR_DB)
+
+    def _send(self, load, rms_db, peak_db):
+        """
+        Deliver all values in one OSC bundle.
+
+        Parameters
+        ----------
+        load : int
+            individual client load in percent
+        rms_db : numpy.ndarray
+            RMS levels in dBFS of size [number of output channels]
+        peak_db : numpy.ndarray
+            peak levels in dBFS of size [number of output channels]
+        """
+        from pythonosc import osc_bundle_builder, osc_message_builder
+
+        def add_message(address, values):
+            message = osc_message_builder.OscMessageBuilder(address=address)
+            for value in values:
+                # OSC only works with float64, see
+                # https://github.com/attwad/python-osc/issues/102
+                message.add_arg(value)
+            bundle.add_content(message.build())
+
+        bundle = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        if self._get_system_load:
+            add_message("/load", [round(float(self._get_system_load()), 1)])
+        add_message(f"{self._osc_name}/load", [load])
+        if self._channel_count:
+            add_message(f"{self._osc_name}/rms", np.round(rms_db, 1).astype(np.float64).tolist())
+            add_message(
+                f"{self._osc_name}/peak", np.round(peak_db, 2).astype(np.float64).tolist()
+            )
+        if self._stage_timer:
+            # percentiles and maximum of every processing stage in percent of the deadline
+            for stage, values in zip(
+                self._stage_timer.STAGE_NAMES, self._stage_timer.get_percentiles()
+            ):
+                add_message(
+                    f"{self._osc_name}/timing/{stage}", np.round(values, 2).tolist()
+                )
+
+        try:
+            self._osc_client.send(bundle.build())
+        except OSError as e:
+            self._logger.debug(f"sending OSC telemetry failed ({e}).")
+
+    def _log(self, load, rms_db, peak_db):
+        """
+        Log all values, in case no OSC client is used.
+
+        Parameters
+        ----------
+        load : int
+            individual client load in percent
+        rms_db : numpy.ndarray
+            RMS levels in dBFS of size [number of output channels]
+        peak_db : numpy.ndarray
+            peak levels in dBFS of size [number of output channels]
+        """
+        if self._get_system_load:
+            self._logger.debug(f"load system percent [{round(self._get_system_load(), 1)}]")
+        self._logger.debug(f"load percent [{load}]")
+        if self._channel_count:
+            log_str = np.array2string(
+                rms_db, separator=",", precision=1, floatmode="fixed", sign="+"
+            )
+            self._logger.info(f"output RMS level [{log_str}]")
+            log_str = np.array2string(
+                peak_db, separator=",", precision=2, floatmode="fixed", sign="+"
+            )
+            self._logger.debug(f"output PEAK level [{log_str}]")
@@ -75,6 +75,54 @@ def calculate_peak(data_td, is_level=False):
         peak[np.isnan(peak)] = -200  # transform zeros into -200 dB
     return peak
 
+
+def calculate_memory_footprint(instance):
+    """
+    Calculate the memory occupied by all `numpy.ndarray`s referenced by the given instance and
+    recursively by all referenced instances of this package. Every underlying buffer is only
+    counted once, so views (i.e., broadcasted dirac impulses) do not count their logical size.
+    Arrays shared with other instances (see `FilterRegistry`) are counted nevertheless.
+
+    Parameters
+    ----------
+    instance : Any
+        instance of this package, i.e., `Convolver`
+
+    Returns
+    -------
+    int
+        occupied memory in bytes
+    """
+    import numpy as np
+
+    package = __name__.rsplit(".", 1)[0]
+    visited = set()
+    buffers = {}
+
+    def _collect(obj):
+        if id(obj) in visited:
+            return
+        visited.add(id(obj))
+
+        if isinstance(obj, np.ndarray):
+            # find array owning the buffer
+            while isinstance(obj.base, np.ndarray):
+                obj = obj.base
+            buffers[id(obj)] = obj.nbytes
+        elif isinstance(obj, (list, tuple)):
+            for o in obj:
+                _collect(o)
+        elif isinstance(obj, dict):
+            for o in obj.values():
+                _collect(o)
+        elif type(obj).__module__.startswith(package) and hasattr(obj, "__dict__"):
+            for o in vars(obj).values():
+                _collect(o)
+
+    _collect(instance)
+    return sum(buffers.values())
+
+
 def get_is_debug():
     """
     The current implementation works fine in PyCharm, but might not work from command line or
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# the application is run from the repository root, with `srcs` providing the packages
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "srcs")
+)
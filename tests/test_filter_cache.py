@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from mics_process import system_config
+from mics_process.filter_cache import FilterCache
+from mics_process.filter_registry import FilterRegistry
+from mics_process.filter_set import FilterSetMiro
+
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(system_config, "FILTER_CACHE_PATH", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    path = tmp_path / "filter.mat"
+    path.write_bytes(b"filter source contents")
+    return str(path)
+
+
+def test_store_and_load_round_trip(cache_path, source_file):
+    key = FilterCache.get_key(source_file, "HRIR", 256, True)
+    irs_td = np.arange(24, dtype=np.float32).reshape(2, 3, 4)
+    meta = {
+        "fs": 48000,
+        "shape": (2, 3, 4),
+        "name": "hrir",
+        "grid": {"azim": np.linspace(0, 1, 5), "weights": None},
+    }
+
+    assert FilterCache.get_array(key, "irs_td") is None
+    assert FilterCache.get_meta(key) is None
+
+    FilterCache.put_array(key, "irs_td", irs_td)
+    FilterCache.put_meta(key, meta)
+
+    loaded = FilterCache.get_array(key, "irs_td")
+    np.testing.assert_array_equal(loaded, irs_td)
+    assert loaded.dtype == irs_td.dtype
+
+    loaded_meta = FilterCache.get_meta(key)
+    assert loaded_meta["fs"] == 48000
+    assert loaded_meta["shape"] == [2, 3, 4]  # tuples are restored as lists
+    assert loaded_meta["name"] == "hrir"
+    assert loaded_meta["grid"]["weights"] is None
+    np.testing.assert_array_equal(loaded_meta["grid"]["azim"], meta["grid"]["azim"])
+
+
+def test_loaded_array_is_copy_on_write(cache_path, source_file):
+    key = FilterCache.get_key(source_file)
+    FilterCache.put_array(key, "irs_td", np.ones(4))
+
+    loaded = FilterCache.get_array(key, "irs_td")
+    loaded[0] = 2
+    np.testing.assert_array_equal(FilterCache.get_array(key, "irs_td"), np.ones(4))
+
+
+def test_disabled_cache_stores_nothing(tmp_path, monkeypatch, source_file):
+    monkeypatch.setattr(system_config, "FILTER_CACHE_PATH", None)
+    key = FilterCache.get_key(source_file)
+
+    FilterCache.put_array(key, "irs_td", np.ones(4))
+    assert FilterCache.get_array(key, "irs_td") is None
+
+
+def test_key_depends_on_parameters(source_file):
+    key = FilterCache.get_key(source_file, "HRIR", 256, True)
+    assert FilterCache.get_key(source_file, "HRIR", 256, True) == key
+    assert FilterCache.get_key(source_file, "HRIR", 512, True) != key
+    assert FilterCache.get_key(source_file, "HRIR", 256, False) != key
+
+
+def test_key_depends_on_contents(tmp_path):
+    path_a = tmp_path / "a.mat"
+    path_b = tmp_path / "b.mat"
+    path_a.write_bytes(b"contents")
+    path_b.write_bytes(b"contents")
+    path_c = tmp_path / "c.mat"
+    path_c.write_bytes(b"other contents")
+
+    key = FilterCache.get_key(str(path_a))
+    assert FilterCache.get_key(str(path_b)) == key
+    assert FilterCache.get_key(str(path_c)) != key
+
+
+def test_key_without_source_file(tmp_path):
+    assert FilterCache.get_key(np.zeros(4)) is None
+    assert FilterCache.get_key(str(tmp_path / "missing.mat")) is None
+
+
+class _KeyCaptured(Exception):
+    pass
+
+
+def _get_load_key_params(monkeypatch, filter_set):
+    """Capture the parameters `FilterSet.load()` identifies its preprocessing result by."""
+    params = []
+
+    def get_key(file_name, *key_params):
+        params.append(key_params)
+        raise _KeyCaptured
+
+    monkeypatch.setattr(FilterRegistry, "get_key", staticmethod(get_key))
+    with pytest.raises(_KeyCaptured):
+        filter_set.load(block_length=256, is_single_precision=True, is_prevent_logging=True)
+    return params[0]
+
+
+def test_load_key_depends_on_rendering_mode(monkeypatch, source_file):
+    by_direction = _get_load_key_params(
+        monkeypatch, FilterSetMiro(file_name=source_file, is_hrir=True)
+    )
+    by_sh = _get_load_key_params(
+        monkeypatch, FilterSetMiro(file_name=source_file, is_hrir=True, sh_max_order=4)
+    )
+    assert by_direction != by_sh
+
+
+def test_load_key_depends_on_resampling_type(monkeypatch, source_file):
+    monkeypatch.setattr(system_config, "RESAMPLING_TYPE", "SINC_BEST")
+    sinc = _get_load_key_params(monkeypatch, FilterSetMiro(file_name=source_file, is_hrir=True))
+    monkeypatch.setattr(system_config, "RESAMPLING_TYPE", "POLYPHASE")
+    poly = _get_load_key_params(monkeypatch, FilterSetMiro(file_name=source_file, is_hrir=True))
+    assert sinc != poly
+
+
+def test_load_key_depends_on_minimum_phase(monkeypatch, source_file):
+    monkeypatch.setattr(system_config, "IS_HRIR_MINIMUM_PHASE", False)
+    linear = _get_load_key_params(
+        monkeypatch, FilterSetMiro(file_name=source_file, is_hrir=True)
+    )
+    monkeypatch.setattr(system_config, "IS_HRIR_MINIMUM_PHASE", True)
+    minimum = _get_load_key_params(
+        monkeypatch, FilterSetMiro(file_name=source_file, is_hrir=True)
+    )
+    assert linear != minimum
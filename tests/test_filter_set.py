@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+
+from mics_process import system_config
+from mics_process.filter_set import FilterSetMiro
+
+
+def _get_unit_vectors(count, seed=0):
+    vectors = np.random.default_rng(seed).standard_normal((count, 3))
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def _get_nearest_ids(points_vectors, lookup_vectors):
+    return np.argmax(lookup_vectors @ points_vectors.T, axis=-1)
+
+
+def test_interpolation_weights_inside_hull():
+    points_vectors = _get_unit_vectors(50)
+    lookup_vectors = _get_unit_vectors(1000, seed=1)
+
+    ids, weights = FilterSetMiro._calculate_points_interpolation(
+        points_vectors=points_vectors,
+        lookup_vectors=lookup_vectors,
+        nearest_ids=_get_nearest_ids(points_vectors, lookup_vectors),
+    )
+
+    assert ids.shape == weights.shape == (1000, 3)
+    np.testing.assert_allclose(weights.sum(axis=-1), 1)
+    assert np.all(weights >= 0)
+    # sorted by descending weight
+    assert np.all(np.diff(weights, axis=-1) <= 0)
+
+    # interpolated direction of the enclosing triangle matches the orientation
+    interpolated = np.einsum("ki,kij->kj", weights, points_vectors[ids])
+    interpolated /= np.linalg.norm(interpolated, axis=-1, keepdims=True)
+    np.testing.assert_allclose(interpolated, lookup_vectors, atol=1e-9)
+
+
+def test_interpolation_weights_at_sampling_points():
+    points_vectors = _get_unit_vectors(20)
+
+    ids, weights = FilterSetMiro._calculate_points_interpolation(
+        points_vectors=points_vectors,
+        lookup_vectors=points_vectors,
+        nearest_ids=np.arange(20),
+    )
+
+    np.testing.assert_array_equal(ids[:, 0], np.arange(20))
+    np.testing.assert_allclose(weights[:, 0], 1, atol=1e-9)
+
+
+def test_interpolation_falls_back_to_nearest_point():
+    # horizontal grid does not enclose any volume
+    azims_rad = np.linspace(0, 2 * np.pi, 12, endpoint=False)
+    points_vectors = np.stack([np.cos(azims_rad), np.sin(azims_rad), np.zeros(12)], axis=-1)
+    lookup_vectors = _get_unit_vectors(10)
+    nearest_ids = _get_nearest_ids(points_vectors, lookup_vectors)
+
+    ids, weights = FilterSetMiro._calculate_points_interpolation(
+        points_vectors=points_vectors,
+        lookup_vectors=lookup_vectors,
+        nearest_ids=nearest_ids,
+    )
+
+    np.testing.assert_array_equal(ids[:, 0], nearest_ids)
+    np.testing.assert_array_equal(weights, [[1, 0, 0]] * 10)
+
+
+_LENGTH = 256
+_DECAY = 0.6
+_ONSETS = np.array([[10, 13], [20, 11]])
+
+
+def _get_minimum_phase_irs():
+    """Decaying exponential impulse responses, which are minimum phase, with individual onsets
+    per direction and ear of size [number of directions; number of ears; number of samples]."""
+    irs_td = np.zeros(_ONSETS.shape + (_LENGTH,))
+    decay = _DECAY ** np.arange(_LENGTH // 2)
+    for ids, onset in np.ndenumerate(_ONSETS):
+        irs_td[ids][onset : onset + decay.shape[0]] = decay
+    return irs_td
+
+
+def _get_filter_set(irs_td, sh_max_order=None):
+    filter_set = FilterSetMiro(file_name="hrir.mat", is_hrir=True, sh_max_order=sh_max_order)
+    filter_set._irs_td = irs_td.copy()
+    return filter_set
+
+
+@pytest.fixture
+def truncation_db(monkeypatch):
+    monkeypatch.setattr(system_config, "HRIR_TRUNCATION_ENERGY_DB", -200)
+
+
+def test_minimum_phase_preserves_magnitude(truncation_db):
+    irs_td = _get_minimum_phase_irs()
+    filter_set = _get_filter_set(irs_td)
+
+    filter_set._transform_minimum_phase(logger=None)
+
+    nfft = 2 * _LENGTH
+    np.testing.assert_allclose(
+        np.abs(np.fft.rfft(filter_set._irs_td, nfft, axis=-1)),
+        np.abs(np.fft.rfft(irs_td, nfft, axis=-1)),
+        rtol=1e-6,
+        atol=1e-9,
+    )
+    # minimum phase filters start immediately
+    assert np.all(np.argmax(np.abs(filter_set._irs_td), axis=-1) == 0)
+
+
+def test_minimum_phase_onset_delays(truncation_db):
+    filter_set = _get_filter_set(_get_minimum_phase_irs())
+
+    filter_set._transform_minimum_phase(logger=None)
+
+    # stored relative to the earliest onset of the entire set
+    np.testing.assert_allclose(filter_set._irs_delays, _ONSETS - _ONSETS.min(), atol=1e-6)
+    np.testing.assert_allclose(filter_set.get_filter_delays_max(), np.ptp(_ONSETS), atol=1e-6)
+
+
+def test_minimum_phase_truncation():
+    filter_set = _get_filter_set(_get_minimum_phase_irs())
+
+    filter_set._transform_minimum_phase(logger=None)
+
+    # residual energy of the decay after `n` samples is `_DECAY ** (2 * n)`
+    expected_length = int(
+        np.ceil(system_config.HRIR_TRUNCATION_ENERGY_DB / (20 * np.log10(_DECAY)))
+    )
+    assert abs(filter_set._irs_td.shape[-1] - expected_length) <= 1
+
+
+def test_common_onset_removed_when_rendered_in_sh_domain(truncation_db):
+    irs_td = _get_minimum_phase_irs()
+    filter_set = _get_filter_set(irs_td, sh_max_order=4)
+
+    filter_set._transform_minimum_phase(logger=None)
+
+    assert filter_set._irs_delays is None
+    # onset is detected by linear interpolation, which is one sample before the first peak
+    common_onset = _ONSETS.min() - 1
+    np.testing.assert_array_equal(
+        filter_set._irs_td, irs_td[..., common_onset : common_onset + filter_set._irs_td.shape[-1]]
+    )
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from mics_process.input_spectrum_cache import InputSpectrumCache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    InputSpectrumCache.clear()
+    yield
+    InputSpectrumCache.clear()
+
+
+def test_get_returns_stored_spectrum():
+    spectrum = np.arange(4, dtype=np.complex64)
+    stored = InputSpectrumCache.put((100, "port"), spectrum)
+
+    np.testing.assert_array_equal(InputSpectrumCache.get((100, "port")), spectrum)
+    assert InputSpectrumCache.get((100, "other")) is None
+    assert InputSpectrumCache.get((200, "port")) is None
+    assert not stored.flags.writeable
+
+
+def test_recent_generations_are_kept():
+    for frame_time in range(InputSpectrumCache.GENERATION_COUNT):
+        InputSpectrumCache.put((frame_time, "port"), np.full(4, frame_time, dtype=np.complex64))
+
+    for frame_time in range(InputSpectrumCache.GENERATION_COUNT):
+        np.testing.assert_array_equal(
+            InputSpectrumCache.get((frame_time, "port")), np.full(4, frame_time)
+        )
+
+
+def test_oldest_generation_is_discarded():
+    frame_count = InputSpectrumCache.GENERATION_COUNT + 1
+    for frame_time in range(frame_count):
+        InputSpectrumCache.put((frame_time, "port"), np.full(4, frame_time, dtype=np.complex64))
+
+    assert InputSpectrumCache.get((0, "port")) is None
+    for frame_time in range(1, frame_count):
+        assert InputSpectrumCache.get((frame_time, "port")) is not None
+
+
+def test_spectra_of_a_frame_share_a_generation():
+    InputSpectrumCache.put((100, "a"), np.zeros(4, dtype=np.complex64))
+    InputSpectrumCache.put((100, "b"), np.ones(4, dtype=np.complex64))
+    InputSpectrumCache.put((200, "a"), np.zeros(4, dtype=np.complex64))
+
+    assert InputSpectrumCache.get((100, "a")) is not None
+    np.testing.assert_array_equal(InputSpectrumCache.get((100, "b")), np.ones(4))
+
+
+def test_clear():
+    InputSpectrumCache.put((100, "port"), np.zeros(4, dtype=np.complex64))
+    InputSpectrumCache.clear()
+    assert InputSpectrumCache.get((100, "port")) is None
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from mics_process.stage_timer import StageTimer
+
+
+@pytest.fixture
+def timer():
+    timer = StageTimer(name="test", block_length=512, sample_rate=48000)
+    yield timer
+    StageTimer._INSTANCES.remove(timer)
+
+
+def _get_bin_edge(bin_id):
+    return StageTimer._BIN_MIN_PERCENT * 10 ** ((bin_id + 1) / StageTimer._BINS_PER_DECADE)
+
+
+def test_percentiles_of_synthetic_histogram(timer):
+    assert StageTimer._PERCENTILES == (50, 95, 99)
+    # every callback is collected for all stages
+    timer._histograms[:, 10] = 50
+    timer._histograms[:, 20] = 45
+    timer._histograms[:, 30] = 4
+    timer._histograms[:, 40] = 1
+    timer._max[:] = 1000
+
+    percentiles = timer.get_percentiles()[StageTimer.FFT]
+    np.testing.assert_allclose(
+        percentiles, [_get_bin_edge(10), _get_bin_edge(20), _get_bin_edge(30), 1000]
+    )
+
+
+def test_percentiles_limited_by_maximum(timer):
+    timer._histograms[:, 50] = 10
+    timer._max[:] = _get_bin_edge(50) / 2
+
+    percentiles = timer.get_percentiles()[StageTimer.MAC]
+    np.testing.assert_allclose(percentiles, [_get_bin_edge(50) / 2] * 4)
+
+
+def test_percentiles_without_measurements(timer):
+    percentiles = timer.get_percentiles()
+    assert percentiles.shape == (len(StageTimer.STAGE_NAMES), len(StageTimer._PERCENTILES) + 1)
+    assert not percentiles.any()
+
+
+def test_update_collects_snapshots(timer):
+    deadline = 512 / 48000
+    for fraction in (0.1, 0.2, 1.5):
+        slot = timer._ring.get_slot()
+        slot.fill(0)
+        slot[-2] = fraction * deadline
+        timer._ring.commit()
+    timer.update()
+
+    summary = timer.get_summary()
+    assert summary["block_count"] == 3
+    assert summary["overrun_count"] == 1
+    total = summary["stages_percent"]["total"]
+    assert total["mean"] == pytest.approx(60, rel=1e-3)
+    assert total["max"] == pytest.approx(150, rel=1e-3)
@@ -0,0 +1,54 @@
+import numpy as np
+
+from mics_process.telemetry import MetricRing
+
+
+def _write(ring, values):
+    for value in values:
+        ring.get_slot()[:] = value
+        ring.commit()
+
+
+def test_read_returns_committed_snapshots_once():
+    ring = MetricRing(capacity=8, field_count=2)
+    _write(ring, [1, 2, 3])
+
+    np.testing.assert_array_equal(ring.read()[:, 0], [1, 2, 3])
+    assert ring.read().shape == (0, 2)
+
+    _write(ring, [4])
+    np.testing.assert_array_equal(ring.read()[:, 0], [4])
+
+
+def test_uncommitted_snapshot_is_not_read():
+    ring = MetricRing(capacity=8, field_count=1)
+    _write(ring, [1])
+    ring.get_slot()[:] = 2
+
+    np.testing.assert_array_equal(ring.read()[:, 0], [1])
+
+
+def test_wraparound_keeps_most_recent_snapshots():
+    ring = MetricRing(capacity=4, field_count=1)
+    _write(ring, range(10))
+
+    # the slot being written next is never read, hence one less than the capacity is kept
+    np.testing.assert_array_equal(ring.read()[:, 0], [7, 8, 9])
+
+
+def test_wraparound_between_reads():
+    ring = MetricRing(capacity=4, field_count=1)
+    _write(ring, [0, 1])
+    np.testing.assert_array_equal(ring.read()[:, 0], [0, 1])
+
+    _write(ring, [2, 3, 4])
+    np.testing.assert_array_equal(ring.read()[:, 0], [2, 3, 4])
+
+
+def test_read_returns_copy():
+    ring = MetricRing(capacity=4, field_count=1)
+    _write(ring, [1])
+    snapshots = ring.read()
+
+    _write(ring, [5, 5, 5, 5])
+    np.testing.assert_array_equal(snapshots[:, 0], [1])